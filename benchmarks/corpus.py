@@ -0,0 +1,94 @@
+"""
+pt-BR utterance corpus shared by the speech benchmarks.
+
+The corpus format lives in ``stuart_ai.utils.audio_corpus`` (``NNNN.wav`` +
+``NNNN.json`` with at least ``{"text": ..., "wake": bool}``), so utterances
+recorded in capture mode can be labelled and reused here. When the
+directory is empty, the bundled phrase list below is synthesized once with
+Edge TTS (needs network access) so the benchmarks can run on a headless
+machine without a microphone.
+"""
+import asyncio
+import os
+from dataclasses import dataclass
+
+import edge_tts
+import numpy as np
+from faster_whisper import decode_audio
+
+from stuart_ai.utils.audio_corpus import corpus_entries, read_sidecar, read_wav, write_sidecar, write_wav
+from stuart_ai.utils.audio_utils import WHISPER_SAMPLE_RATE
+
+DEFAULT_CORPUS_DIR = os.path.join("tmp", "bench_corpus")
+VOICES = ["pt-BR-AntonioNeural", "pt-BR-FranciscaNeural"]
+
+# (text, contains the wake word)
+PHRASES = [
+    ("Stuart, que horas são?", True),
+    ("Stuart, qual a data de hoje?", True),
+    ("Stuart, abra o navegador.", True),
+    ("Stuart, conte uma piada.", True),
+    ("Stuart, aumentar volume.", True),
+    ("Stuart, pesquise sobre energia solar.", True),
+    ("Stuart, como está o tempo em São Paulo?", True),
+    ("Stuart, próxima música.", True),
+    ("Você viu o jogo de ontem à noite?", False),
+    ("Preciso terminar o relatório até sexta-feira.", False),
+    ("A reunião foi remarcada para amanhã de manhã.", False),
+    ("Vamos almoçar no restaurante da esquina?", False),
+    ("O café acabou de novo.", False),
+    ("Me passa aquele documento, por favor.", False),
+    ("Hoje o trânsito estava horrível.", False),
+    ("Alguém sabe a senha do wi-fi?", False),
+    # One sound away from the name: must not wake the assistant
+    ("Sua arte é linda.", False),
+    ("Tu art, quanto custou?", False),
+    ("Vou dar a partida, start o carro.", False),
+    ("Os Stuarts governaram a Escócia.", False),
+]
+
+
+@dataclass
+class Utterance:
+    name: str
+    samples: np.ndarray
+    text: str
+    wake: bool
+
+    @property
+    def duration(self) -> float:
+        return self.samples.size / WHISPER_SAMPLE_RATE
+
+
+async def _synthesize(corpus_dir: str):
+    index = 0
+    for voice in VOICES:
+        for text, wake in PHRASES:
+            base = os.path.join(corpus_dir, f"{index:04d}")
+            await edge_tts.Communicate(text, voice).save(base + ".mp3")
+            samples = decode_audio(base + ".mp3", sampling_rate=WHISPER_SAMPLE_RATE)
+            os.remove(base + ".mp3")
+            # Pad with half a second of silence on each side, like a captured phrase
+            pad = np.zeros(WHISPER_SAMPLE_RATE // 2, dtype=np.float32)
+            write_wav(base + ".wav", np.concatenate([pad, samples, pad]))
+            write_sidecar(base, {"text": text, "wake": wake, "voice": voice})
+            index += 1
+
+
+def load_corpus(corpus_dir: str = DEFAULT_CORPUS_DIR) -> list[Utterance]:
+    """Loads every labelled utterance in ``corpus_dir``, synthesizing the default set if it is empty."""
+    os.makedirs(corpus_dir, mode=0o700, exist_ok=True)
+    if not any(name.endswith(".wav") for name in os.listdir(corpus_dir)):
+        print(f"Synthesizing benchmark corpus into {corpus_dir}...")
+        asyncio.run(_synthesize(corpus_dir))
+
+    utterances = []
+    for base in corpus_entries(corpus_dir):
+        meta = read_sidecar(base)
+        # Entries recorded in capture mode stay out until they are labelled
+        if "wake" not in meta:
+            continue
+        utterances.append(
+            Utterance(os.path.basename(base), read_wav(base + ".wav"), meta.get("text", ""), bool(meta["wake"]))
+        )
+    return utterances
@@ -0,0 +1,111 @@
+"""
+Several sessions sharing one Whisper model: STT throughput as the number of sources grows.
+
+Each source is a ``ReplaySource`` playing the corpus as fast as the
+pipeline takes it (lossless capture), so the numbers measure the shared
+command model, not the microphones. Every session is a full ``Assistant``
+with its own capture, memory and context; the wake gate is disabled so
+every utterance gets the full decode, and commands stop at a no-op stub.
+
+Modes:
+    shared    all sessions call the same ``WhisperModel`` directly
+    batched   concurrent utterances go through ``BatchedTranscriber``
+              (one ``BatchedInferencePipeline`` call per batch)
+
+Reported: utterances per second across all sessions and the average
+batch size actually formed.
+
+Usage:
+    python -m benchmarks.multi_source [--corpus DIR] [--sources 1 2 4 8] [--model small]
+"""
+import argparse
+import asyncio
+import time
+from unittest.mock import MagicMock
+
+import speech_recognition as sr
+from faster_whisper import WhisperModel
+
+from benchmarks.corpus import DEFAULT_CORPUS_DIR, load_corpus
+from stuart_ai.core.assistant import Assistant
+from stuart_ai.core.config import settings
+from stuart_ai.core.state import AssistantContext
+from stuart_ai.services.audio_capture import AudioCapture
+from stuart_ai.services.audio_sources import ReplaySource
+from stuart_ai.services.stt_batcher import BatchedTranscriber
+
+
+def _session(name, corpus_dir, model):
+    source = ReplaySource(corpus_dir, speed=None, gap_seconds=1.0)
+    recognizer = sr.Recognizer()
+    capture = AudioCapture(recognizer, source_factory=lambda: source, lossless=True)
+    # Agents, router and memory are never reached: commands stop at the stub below
+    assistant = Assistant(MagicMock(), MagicMock(), MagicMock(), MagicMock(), MagicMock(), model, recognizer,
+                          context=AssistantContext(session=name), audio_capture=capture)
+    assistant.wake_gate = None
+    assistant.noise_calibrator = MagicMock()
+
+    async def ignore(_text):
+        return None
+
+    assistant.handle_command = ignore
+    assistant.speak = ignore
+    return assistant, source
+
+
+def _transcribed(assistants) -> int:
+    return sum(a.context.stage_timings["stt"].count for a in assistants if "stt" in a.context.stage_timings)
+
+
+async def run(corpus_dir, model, sources, settle):
+    sessions = [_session(f"room-{i}", corpus_dir, model) for i in range(sources)]
+    assistants = [assistant for assistant, _ in sessions]
+
+    started = time.perf_counter()
+    tasks = [asyncio.create_task(assistant.listen_continuously()) for assistant in assistants]
+    await asyncio.gather(*(asyncio.to_thread(source.finished.wait) for _, source in sessions))
+
+    # Drained once no session has finished an utterance for `settle` seconds
+    count, last_change = _transcribed(assistants), time.perf_counter()
+    while time.perf_counter() - last_change < settle:
+        await asyncio.sleep(0.05)
+        if _transcribed(assistants) != count:
+            count, last_change = _transcribed(assistants), time.perf_counter()
+    wall = last_change - started
+
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    return count, wall
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS_DIR)
+    parser.add_argument("--sources", nargs="+", type=int, default=[1, 2, 4, 8])
+    parser.add_argument("--model", default=settings.whisper_model_size)
+    parser.add_argument("--compute-type", default=settings.whisper_compute_type)
+    parser.add_argument("--batch-size", type=int, default=settings.stt_batch_size)
+    parser.add_argument("--settle", type=float, default=3.0, help="quiet time that ends a run (s)")
+    args = parser.parse_args()
+
+    # Synthesizes the default corpus on first use
+    utterances = load_corpus(args.corpus)
+    print(f"{len(utterances)} utterances per source, {sum(u.duration for u in utterances):.1f}s of speech")
+
+    model = WhisperModel(args.model, device="cpu", compute_type=args.compute_type,
+                         cpu_threads=settings.whisper_cpu_threads)
+    for sources in args.sources:
+        count, wall = asyncio.run(run(args.corpus, model, sources, args.settle))
+        print(f"{sources:2d} source(s) |  shared | {count:4d} utterances in {wall:6.1f}s | "
+              f"{count / wall:6.2f} utt/s")
+
+        batcher = BatchedTranscriber(model, max_batch=args.batch_size)
+        count, wall = asyncio.run(run(args.corpus, batcher, sources, args.settle))
+        batcher.close()
+        print(f"{sources:2d} source(s) | batched | {count:4d} utterances in {wall:6.1f}s | "
+              f"{count / wall:6.2f} utt/s | avg batch {batcher.stats()['avg_batch']}")
+
+
+if __name__ == "__main__":
+    main()
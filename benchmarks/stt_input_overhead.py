@@ -0,0 +1,62 @@
+"""
+Per-utterance overhead of handing microphone audio to Faster Whisper.
+
+Compares the old path (WAV written to ``tmp/`` and decoded again by
+``faster_whisper.decode_audio``) with the in-memory path
+(``audio_data_to_float32``). Whisper inference itself is identical in both
+cases and is left out.
+
+Usage:
+    python -m benchmarks.stt_input_overhead [--iterations 50]
+"""
+import argparse
+import os
+import time
+
+import numpy as np
+import speech_recognition as sr
+from faster_whisper import decode_audio
+
+from stuart_ai.core.config import settings
+from stuart_ai.utils.audio_utils import audio_data_to_float32
+from stuart_ai.utils.tmp_file_handler import TempFileHandler
+
+
+def _synthetic_utterance(seconds: float, sample_rate: int) -> sr.AudioData:
+    rng = np.random.default_rng(0)
+    samples = (rng.standard_normal(int(seconds * sample_rate)) * 3000).astype("<i2")
+    return sr.AudioData(samples.tobytes(), sample_rate, 2)
+
+
+def _via_temp_wav(audio: sr.AudioData, path: str) -> np.ndarray:
+    with TempFileHandler(path) as temp_file:
+        with open(temp_file, "wb") as f:
+            f.write(audio.get_wav_data())
+        return decode_audio(temp_file, sampling_rate=16000)
+
+
+def _timeit(func, iterations: int) -> float:
+    func()  # warm-up
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+
+    temp_path = os.path.join(settings.temp_dir, "bench_audio.wav")
+    print(f"{'utterance':>12} {'rate':>7} {'temp wav (ms)':>14} {'in-memory (ms)':>15} {'speed-up':>9}")
+    for seconds in (2.0, 5.0, 10.0):
+        for rate in (16000, 44100, 48000):
+            audio = _synthetic_utterance(seconds, rate)
+            before = _timeit(lambda: _via_temp_wav(audio, temp_path), args.iterations)
+            after = _timeit(lambda: audio_data_to_float32(audio), args.iterations)
+            print(f"{seconds:>11.1f}s {rate:>7} {before:>14.2f} {after:>15.2f} {before / after:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Time to first audio of each TTS backend.
+
+Every sentence is synthesized without the cache; reported per backend are
+the median and worst time from request to first MP3 chunk (what delays the
+start of a reply) and to the last chunk. Backends whose program is missing
+(espeak-ng) or that fail (Edge TTS offline) are reported and skipped, and
+runs that end without any audio are counted apart from the timings.
+
+Usage:
+    python -m benchmarks.tts_first_audio [--backends edge espeak] [--rounds 3]
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from stuart_ai.services.tts_backends import BACKENDS, EspeakBackend, create_backend
+
+SENTENCES = [
+    "São 14 horas e 35 minutos.",
+    "Pesquisando nos seus arquivos...",
+    "Hoje é sexta-feira, 16 de outubro.",
+    "A pesquisa encontrou três resultados sobre o clima em São Paulo.",
+]
+
+
+async def _measure(backend, text: str) -> tuple[float | None, float]:
+    """Seconds to the first and the last chunk; the first is None when the backend produced no audio."""
+    started = time.perf_counter()
+    first = None
+    async for _ in backend.stream(text):
+        if first is None:
+            first = time.perf_counter() - started
+    return first, time.perf_counter() - started
+
+
+async def run(names: list[str], rounds: int):
+    for name in names:
+        backend = create_backend(name)
+        if isinstance(backend, EspeakBackend) and not backend.available():
+            print(f"{name:8s} | skipped: {backend.executable} not installed")
+            continue
+        firsts, totals = [], []
+        silent = 0
+        try:
+            for _ in range(rounds):
+                for text in SENTENCES:
+                    first, total = await _measure(backend, text)
+                    if first is None:
+                        silent += 1
+                        continue
+                    firsts.append(first)
+                    totals.append(total)
+        except Exception as e:  # pylint: disable=broad-except
+            print(f"{name:8s} | failed: {e}")
+            continue
+        if not firsts:
+            print(f"{name:8s} | no audio in {silent} runs")
+            continue
+        print(f"{name:8s} | first audio median {statistics.median(firsts) * 1000:7.1f} ms, "
+              f"max {max(firsts) * 1000:7.1f} ms | complete median {statistics.median(totals) * 1000:7.1f} ms"
+              + (f" | {silent} runs without audio" if silent else ""))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--backends", nargs="+", default=list(BACKENDS), choices=list(BACKENDS))
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(run(args.backends, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
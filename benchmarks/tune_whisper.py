@@ -0,0 +1,95 @@
+"""
+Whisper auto-tuner: finds the fastest accurate configuration for this CPU.
+
+Decodes the labelled pt-BR corpus with every combination of model size,
+compute type (int8, int8_float32, float32), CTranslate2 thread count and
+beam size, and measures for each one:
+
+    RTF               decode wall time / audio time (below 1.0 keeps up with speech)
+    keyword accuracy  share of utterances whose wake / no-wake label the
+                      transcript reproduces (``WakeWordMatcher``)
+
+The winner is the most accurate profile with RTF <= --max-rtf, fastest
+among ties (``stt_tuner.pick_best``); when none is that fast, the fastest
+profile. With --write it is saved to the .env
+file as WHISPER_MODEL_SIZE / WHISPER_COMPUTE_TYPE / WHISPER_CPU_THREADS /
+WHISPER_BEAM_SIZE, which main.py reads on the next start.
+
+Larger beams only cost more, so once a loaded model is slower than
+--max-rtf its remaining beam sizes are skipped.
+
+Usage:
+    python -m benchmarks.tune_whisper [--corpus DIR] [--models tiny base small] [--threads 2 4 8] [--write]
+"""
+import argparse
+import time
+
+from faster_whisper import WhisperModel
+
+from benchmarks.corpus import DEFAULT_CORPUS_DIR, load_corpus
+from stuart_ai.core.assistant import COMMAND_PROMPT
+from stuart_ai.core.config import settings
+from stuart_ai.services.stt_tuner import (
+    BEAM_SIZES, COMPUTE_TYPES, MODEL_SIZES, candidate_profiles, default_thread_counts, measure_profile, pick_best,
+    update_env_file,
+)
+from stuart_ai.services.wake_word import WakeWordMatcher
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS_DIR)
+    parser.add_argument("--models", nargs="+", default=list(MODEL_SIZES))
+    parser.add_argument("--compute-types", nargs="+", default=list(COMPUTE_TYPES))
+    parser.add_argument("--threads", nargs="+", type=int, default=default_thread_counts())
+    parser.add_argument("--beams", nargs="+", type=int, default=list(BEAM_SIZES))
+    parser.add_argument("--max-rtf", type=float, default=0.5, help="slowest acceptable real-time factor")
+    parser.add_argument("--tolerance", type=float, default=0.0, help="accuracy given up for speed (0-1)")
+    parser.add_argument("--write", action="store_true", help="save the best profile to --env-file")
+    parser.add_argument("--env-file", default=".env")
+    args = parser.parse_args()
+
+    utterances = load_corpus(args.corpus)
+    samples = [u.samples for u in utterances]
+    labels = [u.wake for u in utterances]
+    matcher = WakeWordMatcher([settings.assistant_keyword.lower(), *settings.wake_keywords],
+                              settings.wake_word_confidence)
+    print(f"{len(utterances)} labelled utterances, {sum(u.duration for u in utterances):.1f}s of audio")
+
+    results = []
+    model, loaded, too_slow = None, None, None
+    for profile in candidate_profiles(args.models, args.compute_types, args.threads, args.beams):
+        key = (profile.model_size, profile.compute_type, profile.cpu_threads)
+        if key != loaded:
+            started = time.perf_counter()
+            model = WhisperModel(profile.model_size, device="cpu", compute_type=profile.compute_type,
+                                 cpu_threads=profile.cpu_threads)
+            # Warm-up so the first-call allocations stay out of the numbers
+            list(model.transcribe(samples[0], language="pt", beam_size=1)[0])
+            print(f"loaded {profile.model_size}/{profile.compute_type}/{profile.cpu_threads} threads "
+                  f"in {time.perf_counter() - started:.1f}s")
+            loaded, too_slow = key, False
+        if too_slow:
+            continue
+
+        result = measure_profile(model, profile, samples, labels, matcher, COMMAND_PROMPT)
+        results.append(result)
+        too_slow = result.rtf > args.max_rtf
+        print(f"  beam {profile.beam_size} | RTF {result.rtf:5.2f} | keyword accuracy {result.keyword_accuracy:6.1%}")
+
+    best = pick_best(results, args.max_rtf, args.tolerance)
+    if best is None:
+        print("No profile measured")
+        return
+    print(f"best: {best.profile} | RTF {best.rtf:.2f} | keyword accuracy {best.keyword_accuracy:.1%}")
+    if best.rtf > args.max_rtf:
+        print(f"warning: no profile reaches RTF {args.max_rtf}; picked the fastest profile")
+    if args.write:
+        update_env_file(args.env_file, best.profile.as_env())
+        print(f"written to {args.env_file}")
+    else:
+        print("\n".join(f"{key}={value}" for key, value in best.profile.as_env().items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Single-model vs two-tier Whisper: steady-state CPU usage and wake-to-response latency.
+
+Modes:
+    ungated   every utterance gets the full decode with the command model
+    single    the wake gate and the command decode share the command model
+    two-tier  a tiny/base model screens for the keyword; the command model
+              only re-decodes the utterances that pass
+
+CPU usage is process CPU time divided by audio time: the average number of
+cores kept busy if utterances arrive back to back. Latency is measured from
+the end of the utterance to the final transcript, for utterances that
+contain the wake word.
+
+Usage:
+    python -m benchmarks.two_tier_stt [--corpus DIR] [--model small] [--wake-model tiny] [--rounds 3]
+"""
+import argparse
+import statistics
+import time
+
+from faster_whisper import WhisperModel
+
+from benchmarks.corpus import DEFAULT_CORPUS_DIR, load_corpus
+from stuart_ai.core.assistant import COMMAND_PROMPT
+from stuart_ai.core.config import settings
+from stuart_ai.services.wake_word import WakeWordGate, find_wake_word
+
+
+def _full_decode(model, samples) -> str:
+    segments, _ = model.transcribe(
+        samples, language="pt", initial_prompt=COMMAND_PROMPT, condition_on_previous_text=False
+    )
+    return " ".join(segment.text for segment in segments)
+
+
+def run_mode(name, command_model, gate, utterances, rounds):
+    keyword = settings.assistant_keyword.lower()
+    latencies, decoded, detected = [], 0, 0
+    audio_seconds = sum(u.duration for u in utterances) * rounds
+
+    cpu_start, wall_start = time.process_time(), time.perf_counter()
+    for _ in range(rounds):
+        for utterance in utterances:
+            start = time.perf_counter()
+            if gate is not None and not gate.detect(utterance.samples):
+                continue
+            decoded += 1
+            text = _full_decode(command_model, utterance.samples)
+            if utterance.wake:
+                latencies.append(time.perf_counter() - start)
+                if find_wake_word(text, keyword, settings.wake_word_confidence):
+                    detected += 1
+    cpu = time.process_time() - cpu_start
+    wall = time.perf_counter() - wall_start
+
+    wake_total = sum(u.wake for u in utterances) * rounds
+    print(f"{name:>9} | cpu {cpu / audio_seconds * 100:6.1f}% of a core | wall RTF {wall / audio_seconds:5.2f} | "
+          f"full decodes {decoded:3d}/{len(utterances) * rounds:<3d} | "
+          f"wake latency p50 {statistics.median(latencies) * 1000 if latencies else 0:7.0f} ms "
+          f"max {max(latencies, default=0) * 1000:7.0f} ms | wake recall {detected}/{wake_total}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS_DIR)
+    parser.add_argument("--model", default=settings.whisper_model_size)
+    parser.add_argument("--compute-type", default=settings.whisper_compute_type)
+    parser.add_argument("--wake-model", default=settings.wake_model_size or "tiny")
+    parser.add_argument("--wake-compute-type", default=settings.wake_compute_type)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    utterances = load_corpus(args.corpus)
+    print(f"{len(utterances)} utterances, {sum(u.duration for u in utterances):.1f}s of audio per round")
+
+    command_model = WhisperModel(args.model, device="cpu", compute_type=args.compute_type)
+    wake_model = WhisperModel(args.wake_model, device="cpu", compute_type=args.wake_compute_type)
+
+    # Warm-up so model loading and first-call allocations stay out of the numbers
+    _full_decode(command_model, utterances[0].samples)
+    _full_decode(wake_model, utterances[0].samples)
+
+    run_mode("ungated", command_model, None, utterances, args.rounds)
+    run_mode("single", command_model, WakeWordGate(command_model), utterances, args.rounds)
+    run_mode("two-tier", command_model, WakeWordGate(wake_model), utterances, args.rounds)
+
+
+if __name__ == "__main__":
+    main()
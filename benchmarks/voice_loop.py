@@ -0,0 +1,124 @@
+"""
+End-to-end voice loop on a replayed corpus: capture -> VAD -> wake gate -> STT -> dispatch.
+
+Runs ``Assistant.listen_continuously`` on a ``ReplaySource`` instead of the
+microphone. Tool execution and TTS are replaced by a recorder, so only the
+voice pipeline is measured. Each dispatched command is attributed to the
+corpus entry that ended last before it; that only holds when the stream is
+paced, so with --speed 0 dispatches are counted rather than attributed.
+
+Reported:
+    wake recall / false accepts   against the corpus ``wake`` labels
+    latency                       end of the utterance in the stream -> dispatch
+                                  (meaningful with --speed 1, i.e. real time)
+    wall time                     total replay time (with --speed 0 the pipeline
+                                  runs as fast as it can: a throughput figure)
+
+Usage:
+    python -m benchmarks.voice_loop [--corpus DIR] [--speed 1] [--model small] [--wake-model tiny]
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from unittest.mock import MagicMock
+
+import speech_recognition as sr
+from faster_whisper import WhisperModel
+
+from benchmarks.corpus import DEFAULT_CORPUS_DIR, load_corpus
+from stuart_ai.core.assistant import Assistant
+from stuart_ai.core.config import settings
+from stuart_ai.core.state import AssistantContext
+from stuart_ai.services.audio_capture import AudioCapture
+from stuart_ai.services.audio_sources import ReplaySource
+
+
+async def run(args, model, wake_model):
+    speed = args.speed or None
+    source = ReplaySource(args.corpus, speed=speed, gap_seconds=args.gap)
+    recognizer = sr.Recognizer()
+    capture = AudioCapture(recognizer, source_factory=lambda: source, lossless=speed is None)
+
+    # Agents, router and memory are never reached: commands stop at the recorder below
+    assistant = Assistant(MagicMock(), MagicMock(), MagicMock(), MagicMock(), MagicMock(), model, recognizer,
+                          context=AssistantContext(), audio_capture=capture, wake_model=wake_model)
+    dispatches = []
+
+    async def record_dispatch(text):
+        dispatches.append((time.monotonic(), text))
+
+    async def silent(_text):
+        return None
+
+    assistant.handle_command = record_dispatch
+    assistant.speak = silent
+
+    started = time.perf_counter()
+    loop_task = asyncio.create_task(assistant.listen_continuously())
+    await asyncio.to_thread(source.finished.wait)
+    # Let the last phrases drain through STT
+    await asyncio.sleep(args.drain)
+    wall = time.perf_counter() - started
+    loop_task.cancel()
+    await asyncio.gather(loop_task, return_exceptions=True)
+    return source.timeline, dispatches, wall, assistant.context.pipeline_stats()
+
+
+def attribute(timeline, dispatches):
+    """Maps each dispatch to the corpus entry that ended last before it."""
+    hits = {}
+    for at, text in dispatches:
+        ended = [u for u in timeline if u.ended_at is not None and u.ended_at <= at]
+        if ended:
+            hits.setdefault(ended[-1].name, (at - ended[-1].ended_at, text))
+    return hits
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS_DIR)
+    parser.add_argument("--speed", type=float, default=1.0, help="1 = real time, 0 = as fast as possible")
+    parser.add_argument("--gap", type=float, default=1.5, help="silence between utterances (s)")
+    parser.add_argument("--drain", type=float, default=5.0, help="wait after the corpus ends (s)")
+    parser.add_argument("--model", default=settings.whisper_model_size)
+    parser.add_argument("--compute-type", default=settings.whisper_compute_type)
+    parser.add_argument("--wake-model", default=settings.wake_model_size)
+    args = parser.parse_args()
+
+    # Synthesizes the default corpus on first use
+    utterances = load_corpus(args.corpus)
+    print(f"{len(utterances)} labelled utterances, {sum(u.duration for u in utterances):.1f}s of speech")
+
+    model = WhisperModel(args.model, device="cpu", compute_type=args.compute_type)
+    wake_model = None
+    if args.wake_model:
+        wake_model = WhisperModel(args.wake_model, device="cpu", compute_type=settings.wake_compute_type)
+
+    timeline, dispatches, wall, stats = asyncio.run(run(args, model, wake_model))
+    labelled = [u for u in timeline if "wake" in u.meta]
+    wake = [u for u in labelled if u.meta["wake"]]
+    print(f"wall time {wall:.1f}s for {sum(u.duration for u in utterances):.1f}s of speech")
+    for stage, timing in stats["stages"].items():
+        print(f"  {stage:>13}: {timing}")
+
+    if not args.speed:
+        print(f"dispatched {len(dispatches)} commands for {len(wake)} wake-labelled utterances")
+        return
+
+    hits = attribute(timeline, dispatches)
+    accepted = [u for u in wake if u.name in hits]
+    false_accepts = [u for u in labelled if not u.meta["wake"] and u.name in hits]
+    latencies = [hits[u.name][0] for u in accepted]
+
+    print(f"wake recall {len(accepted)}/{len(wake)} | false accepts {len(false_accepts)}/{len(labelled) - len(wake)}")
+    if latencies:
+        print(f"latency end-of-utterance -> dispatch: p50 {statistics.median(latencies) * 1000:.0f} ms, "
+              f"max {max(latencies) * 1000:.0f} ms")
+    for u in wake:
+        if u.name not in hits:
+            print(f"  missed {u.name}: {u.meta.get('text')}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Wake-word matcher accuracy: false-accept / false-reject rates on a labelled corpus.
+
+Every utterance is decoded once with the command model; the transcripts are
+then scored by both matchers over a range of thresholds:
+
+    ratio      the previous matcher: ``process.extractOne`` of the keyword
+               over the whitespace-split words, ``fuzz.ratio`` scorer
+    phonetic   ``WakeWordMatcher``: pt-BR phonetic keys plus known
+               mis-transcriptions, scored in one rapidfuzz ``cdist`` call
+
+False accept = the matcher fires on an utterance labelled ``wake: false``;
+false reject = it misses one labelled ``wake: true``. The matching cost per
+transcript is reported too.
+
+Usage:
+    python -m benchmarks.wake_word_accuracy [--corpus DIR] [--model small] [--keywords stuart jarvis]
+"""
+import argparse
+import time
+
+from faster_whisper import WhisperModel
+from rapidfuzz import fuzz, process
+
+from benchmarks.corpus import DEFAULT_CORPUS_DIR, load_corpus
+from stuart_ai.core.assistant import COMMAND_PROMPT
+from stuart_ai.core.config import settings
+from stuart_ai.services.wake_word import WakeWordMatcher
+
+THRESHOLDS = (60, 70, 75, 80, 85, 90)
+
+
+def _decode(model, samples) -> str:
+    segments, _ = model.transcribe(
+        samples, language="pt", initial_prompt=COMMAND_PROMPT, condition_on_previous_text=False
+    )
+    return " ".join(segment.text for segment in segments).strip()
+
+
+def ratio_matcher(keywords, min_score):
+    def match(text):
+        text_lower = text.lower()
+        if any(keyword in text_lower for keyword in keywords):
+            return True
+        words = text_lower.split()
+        return bool(words) and any(
+            process.extractOne(keyword, words, scorer=fuzz.ratio)[1] >= min_score for keyword in keywords
+        )
+    return match
+
+
+def phonetic_matcher(keywords, min_score):
+    matcher = WakeWordMatcher(keywords, min_score)
+    return lambda text: matcher.match(text) is not None
+
+
+def evaluate(name, build, keywords, transcripts):
+    positives = sum(wake for _, wake in transcripts)
+    negatives = len(transcripts) - positives
+    for threshold in THRESHOLDS:
+        match = build(keywords, threshold)
+        started = time.perf_counter()
+        fired = [match(text) for text, _ in transcripts]
+        per_call = (time.perf_counter() - started) / max(1, len(transcripts))
+
+        false_accepts = sum(hit and not wake for hit, (_, wake) in zip(fired, transcripts))
+        false_rejects = sum(wake and not hit for hit, (_, wake) in zip(fired, transcripts))
+        print(f"{name:>9} @ {threshold:3d} | FA {false_accepts:3d}/{negatives:<3d} "
+              f"({false_accepts / max(1, negatives) * 100:5.1f}%) | FR {false_rejects:3d}/{positives:<3d} "
+              f"({false_rejects / max(1, positives) * 100:5.1f}%) | {per_call * 1e6:6.1f} us/transcript")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS_DIR)
+    parser.add_argument("--model", default=settings.whisper_model_size)
+    parser.add_argument("--compute-type", default=settings.whisper_compute_type)
+    parser.add_argument("--keywords", nargs="+",
+                        default=[settings.assistant_keyword.lower(), *settings.wake_keywords])
+    args = parser.parse_args()
+
+    utterances = load_corpus(args.corpus)
+    model = WhisperModel(args.model, device="cpu", compute_type=args.compute_type)
+    transcripts = [(_decode(model, u.samples), u.wake) for u in utterances]
+    print(f"{len(transcripts)} labelled utterances ({sum(u.wake for u in utterances)} addressed to the assistant)")
+
+    keywords = [k.lower() for k in args.keywords]
+    evaluate("ratio", ratio_matcher, keywords, transcripts)
+    evaluate("phonetic", phonetic_matcher, keywords, transcripts)
+
+    matcher = WakeWordMatcher(keywords, settings.wake_word_confidence)
+    for (text, wake), utterance in zip(transcripts, utterances):
+        if wake != (matcher.match(text) is not None):
+            print(f"  {'missed' if wake else 'false accept'} {utterance.name}: {text}")
+
+
+if __name__ == "__main__":
+    main()
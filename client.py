@@ -0,0 +1,40 @@
+"""
+Thin Stuart client: streams this machine's microphone to a Stuart server and plays the replies.
+
+The server runs the whole pipeline (NETWORK_AUDIO_ENABLED=true); this side
+only needs a microphone, PyAudio and mpg123.
+
+Usage:
+    python client.py ws://server:8000/ws/audio --token SECRET [--session kitchen] [--device 2]
+
+The token is the server's NETWORK_AUDIO_TOKEN (also read from that variable).
+"""
+import argparse
+import asyncio
+import os
+
+import speech_recognition as sr
+
+from stuart_ai.core.logger import logger
+from stuart_ai.services.audio_client import AudioClient
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("url", help="server endpoint, e.g. ws://192.168.0.10:8000/ws/audio")
+    parser.add_argument("--session", help="name shown in /sessions (default: assigned by the server)")
+    parser.add_argument("--device", type=int, help="PyAudio input device index (default: system microphone)")
+    parser.add_argument("--token", default=os.environ.get("NETWORK_AUDIO_TOKEN", ""),
+                        help="shared secret set as NETWORK_AUDIO_TOKEN on the server")
+    args = parser.parse_args()
+
+    client = AudioClient(args.url, session=args.session, token=args.token,
+                         source_factory=lambda: sr.Microphone(device_index=args.device))
+    asyncio.run(client.run())
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        logger.info("Stuart client stopped by user.")
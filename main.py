@@ -12,15 +12,26 @@ from stuart_ai.agents.rag.rag_agent import LocalRAGAgent
 from stuart_ai.agents.content_agent import ContentAgent
 from stuart_ai.agents.coding_agent import CodingAgent
 from stuart_ai.services.semantic_router import SemanticRouter
+from stuart_ai.services.stt_worker import WhisperWorkerPool
+from stuart_ai.services.stt_batcher import BatchedTranscriber
+from stuart_ai.services.audio_sources import build_audio_capture, capture_for_source
+from stuart_ai.services.speech_templates import SpeechTemplates
+from stuart_ai.services.tts_backends import create_backend, create_synthesizer
+from stuart_ai.services.tts_cache import TTSCache, collect_static_phrases, presynthesize
 from stuart_ai.core.memory import ConversationMemory
 
 
-async def _start_api(context: AssistantContext):
+async def _start_api(contexts: list[AssistantContext], session_factory=None):
     """Starts the FastAPI management server in the background."""
     try:
         import uvicorn  # pylint: disable=import-outside-toplevel
-        from stuart_ai.api.app import app, set_context  # pylint: disable=import-outside-toplevel
-        set_context(context)
+        from stuart_ai.api.app import (  # pylint: disable=import-outside-toplevel
+            app, set_context, set_session_factory, set_sessions,
+        )
+        if contexts:
+            set_context(contexts[0])
+        set_sessions(contexts)
+        set_session_factory(session_factory)
         config = uvicorn.Config(app, host="0.0.0.0", port=settings.api_port, log_level="warning")
         server = uvicorn.Server(config)
         logger.info("Management API starting on port %d", settings.api_port)
@@ -56,38 +67,108 @@ async def main():
     # 3. Initialize Routing & Memory
     logger.info("Initializing Semantic Router and Memory...")
     semantic_router = SemanticRouter(llm=router_llm)
-    memory = ConversationMemory()
 
     # 4. Initialize Speech Services
-    logger.info("Loading Faster Whisper model '%s'...", settings.whisper_model_size)
-    whisper_model = WhisperModel(settings.whisper_model_size, device="cpu", compute_type="int8")
-    speech_recognizer = sr.Recognizer()
-
-    # 5. Initialize State Context
-    context = AssistantContext()
-
-    # 6. Initialize Assistant
-    logger.info("Starting Assistant...")
-    assistant = Assistant(
-        llm=main_llm,
-        web_search_agent=web_search_agent,
-        local_rag_agent=local_rag_agent,
-        semantic_router=semantic_router,
-        memory=memory,
-        whisper_model=whisper_model,
-        speech_recognizer=speech_recognizer,
-        context=context,
-        content_agent=content_agent,
-        coding_agent=coding_agent,
-    )
+    if settings.stt_workers > 0:
+        logger.info("Starting %d Whisper worker process(es) with model '%s'...",
+                    settings.stt_workers, settings.whisper_model_size)
+        whisper_model = WhisperWorkerPool()
+        whisper_model.start()
+    else:
+        logger.info("Loading Faster Whisper model '%s'...", settings.whisper_model_size)
+        whisper_model = WhisperModel(
+            settings.whisper_model_size,
+            device="cpu",
+            compute_type=settings.whisper_compute_type,
+            cpu_threads=settings.whisper_cpu_threads,
+            num_workers=settings.whisper_num_workers,
+        )
+    wake_model = None
+    if settings.wake_gate_enabled and settings.wake_model_size:
+        logger.info("Loading Faster Whisper wake model '%s'...", settings.wake_model_size)
+        wake_model = WhisperModel(settings.wake_model_size, device="cpu", compute_type=settings.wake_compute_type)
+    cascade_model = None
+    if settings.stt_cascade_enabled and settings.stt_cascade_model_size:
+        logger.info("Loading Faster Whisper cascade model '%s'...", settings.stt_cascade_model_size)
+        cascade_model = WhisperModel(settings.stt_cascade_model_size, device="cpu",
+                                     compute_type=settings.whisper_compute_type,
+                                     cpu_threads=settings.whisper_cpu_threads)
+    # Several rooms share the command model: concurrent utterances are decoded in batches.
+    # In network mode without AUDIO_SESSIONS every session is a remote client.
+    sessions = settings.audio_sessions or ({} if settings.network_audio_enabled else {"default": None})
+    command_model = whisper_model
+    shared = len(sessions) > 1 or settings.network_audio_enabled
+    if shared and not isinstance(whisper_model, WhisperWorkerPool):
+        logger.info("Batching transcriptions across sessions (up to %d per batch)...", settings.stt_batch_size)
+        command_model = BatchedTranscriber(whisper_model)
+
+    tts_cache = TTSCache() if settings.tts_cache_enabled else None
+    speech_templates = SpeechTemplates(create_synthesizer(tts_cache)) if settings.tts_templates_enabled else None
+
+    # 5. Initialize one Assistant per session, each with its own capture, memory and context
+    def build_assistant(name, speech_recognizer, audio_capture, speech_output=None, utterance_recorder=None):
+        return Assistant(
+            llm=main_llm,
+            web_search_agent=web_search_agent,
+            local_rag_agent=local_rag_agent,
+            semantic_router=semantic_router,
+            memory=ConversationMemory(),
+            whisper_model=command_model,
+            wake_model=wake_model,
+            cascade_model=cascade_model,
+            speech_recognizer=speech_recognizer,
+            audio_capture=audio_capture,
+            utterance_recorder=utterance_recorder,
+            context=AssistantContext(session=name),
+            content_agent=content_agent,
+            coding_agent=coding_agent,
+            speech_output=speech_output,
+            tts_cache=tts_cache,
+            speech_templates=speech_templates,
+        )
+
+    assistants = []
+    for name, source in sessions.items():
+        logger.info("Starting Assistant session '%s'...", name)
+        speech_recognizer = sr.Recognizer()
+        if source is None:
+            audio_capture, utterance_recorder = build_audio_capture(speech_recognizer)
+        else:
+            audio_capture, utterance_recorder = capture_for_source(speech_recognizer, source), None
+        assistants.append(
+            build_assistant(name, speech_recognizer, audio_capture, utterance_recorder=utterance_recorder)
+        )
+
+    # Remote clients connecting to /ws/audio get an Assistant built the same way
+    session_factory = None
+    if settings.network_audio_enabled:
+        logger.info("Accepting remote audio clients on ws://0.0.0.0:%d/ws/audio", settings.api_port)
+        if not settings.network_audio_token:
+            logger.warning("NETWORK_AUDIO_TOKEN is not set: every remote audio client will be refused")
+        session_factory = build_assistant
 
     logger.info("Stuart AI is ready!")
 
-    tasks = [asyncio.create_task(assistant.listen_continuously())]
-    if settings.api_enabled:
-        tasks.append(asyncio.create_task(_start_api(context)))
+    tasks = [asyncio.create_task(assistant.listen_continuously()) for assistant in assistants]
+    if tts_cache is not None and settings.tts_presynthesize:
+        # Fixed phrases then play from disk, even when Edge TTS is slow or unreachable
+        backend = create_backend(settings.tts_backend)
+        tasks.append(asyncio.create_task(presynthesize(tts_cache, collect_static_phrases(), backend)))
+    if speech_templates is not None:
+        # Time and date replies are assembled once their pieces are ready
+        tasks.append(asyncio.create_task(speech_templates.prepare()))
+    if settings.api_enabled or settings.network_audio_enabled:
+        tasks.append(asyncio.create_task(
+            _start_api([assistant.context for assistant in assistants], session_factory)
+        ))
 
-    await asyncio.gather(*tasks)
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        if isinstance(command_model, BatchedTranscriber):
+            command_model.close()
+        if isinstance(whisper_model, WhisperWorkerPool):
+            whisper_model.close()
 
 if __name__ == "__main__":
     try:
@@ -5,13 +5,15 @@ if TYPE_CHECKING:
     from stuart_ai.core.state import AssistantContext
 
 try:
-    from fastapi import FastAPI
+    from fastapi import FastAPI, WebSocket, status
 except ImportError as exc:
     raise ImportError("fastapi not installed. Run: uv add fastapi uvicorn") from exc
 
 app = FastAPI(title="Stuart AI Management API", version="0.1.0")
 
 _context: AssistantContext | None = None
+_sessions: list[AssistantContext] = []
+_session_factory = None
 _available_agents: list[dict] = [
     {"name": "web_search", "description": "Busca na web via DuckDuckGo com síntese por LLM"},
     {"name": "rag", "description": "Recuperação de documentos locais (RAG + ChromaDB)"},
@@ -26,6 +28,20 @@ def set_context(context: AssistantContext):
     _context = context
 
 
+def set_sessions(contexts: list[AssistantContext]):
+    global _sessions  # pylint: disable=global-statement
+    _sessions = list(contexts)
+
+
+def set_session_factory(factory):
+    """
+    Enables ``/ws/audio``: ``factory(name, recognizer, capture, speech_output)``
+    builds a remote session's Assistant.
+    """
+    global _session_factory  # pylint: disable=global-statement
+    _session_factory = factory
+
+
 @app.get("/status")
 def get_status():
     if _context is None:
@@ -36,9 +52,66 @@ def get_status():
         "last_response": _context.last_response,
         "command_count": _context.command_count,
         "uptime_seconds": _context.uptime_seconds(),
+        "pipeline": _context.pipeline_stats(),
+        "noise": _context.noise_estimate,
     }
 
 
+@app.get("/sessions")
+def list_sessions():
+    """One entry per audio source served by this host."""
+    return {
+        "sessions": [
+            {
+                "session": context.session,
+                "status": context.status.value,
+                "last_command": context.last_command,
+                "command_count": context.command_count,
+                "pipeline": context.pipeline_stats(),
+            }
+            for context in _sessions
+        ]
+    }
+
+
+@app.websocket("/ws/audio")
+async def audio_session(websocket: WebSocket):
+    """Network mode: a thin client streams microphone PCM in and gets the spoken replies back."""
+    from stuart_ai.services.network_audio import (  # pylint: disable=import-outside-toplevel
+        AudioSession, AuthenticationError, ProtocolError,
+    )
+    await websocket.accept()
+    if _session_factory is None:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason="Network audio is disabled")
+        return
+
+    session = AudioSession(websocket, _session_factory)
+    try:
+        if not await session.open():
+            return
+    except AuthenticationError as e:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason=str(e))
+        return
+    except ProtocolError as e:
+        await websocket.close(code=status.WS_1003_UNSUPPORTED_DATA, reason=str(e))
+        return
+
+    context = session.assistant.context
+    _sessions.append(context)
+    try:
+        await session.run()
+    finally:
+        _sessions.remove(context)
+
+
+@app.get("/audio/noise")
+def get_noise_estimate():
+    """Rolling ambient-noise estimate and the energy threshold currently in use."""
+    if _context is None:
+        return {"status": "not_initialized"}
+    return _context.noise_estimate or {"status": "calibrating"}
+
+
 @app.get("/agents/list")
 def list_agents():
     return {"agents": _available_agents}
@@ -1,19 +1,27 @@
-import os
 import re
-import uuid
-import platform
-import subprocess
 import asyncio
+import functools
+import time
+from dataclasses import dataclass
 
-import aiofiles
+import numpy as np
 import wikipedia
-import edge_tts
-from playsound import playsound
-from thefuzz import process, fuzz
 import speech_recognition as sr
-from stuart_ai.utils.tmp_file_handler import TempFileHandler
-from stuart_ai.utils.audio_utils import ignore_stderr
+from stuart_ai.utils.audio_utils import WHISPER_SAMPLE_RATE, audio_data_to_float32
+from stuart_ai.services.audio_capture import AudioCapture
+from stuart_ai.services.audio_sources import UtteranceRecorder
+from stuart_ai.services.barge_in import BargeInDetector, BargeInKind
 from stuart_ai.services.command_handler import CommandHandler
+from stuart_ai.services.noise_calibration import NoiseCalibrator
+from stuart_ai.services.echo_suppression import EchoSuppressor, load_reference
+from stuart_ai.services.confirmation import ConfirmationAnswer, ConfirmationRecognizer, ConfirmationResult
+from stuart_ai.services.speech_pipeline import SpeechPipeline, split_sentences
+from stuart_ai.services.speech_templates import RenderedSpeech, SpeechTemplates
+from stuart_ai.services.streaming_stt import PartialTranscriber, PhraseProgress
+from stuart_ai.services.stt_cascade import Transcript, TranscriptionCascade, summarize_segments
+from stuart_ai.services.tts_backends import Synthesizer, create_synthesizer
+from stuart_ai.services.tts_playback import AudioPlayer, Mp3Decoder, StreamingPlayer, play_mp3_file
+from stuart_ai.services.wake_word import WakeWordGate, WakeWordMatcher
 from stuart_ai.core.enums import AssistantSignal
 from stuart_ai.core.config import settings
 from stuart_ai.core.logger import logger
@@ -23,6 +31,23 @@ from stuart_ai.core.state import AssistantContext, AssistantStatus
 from stuart_ai.agents.web_search_agent import WebSearchAgent
 from stuart_ai.agents.rag.rag_agent import LocalRAGAgent
 
+@dataclass
+class CapturedUtterance:
+    """One phrase travelling through the voice pipeline."""
+    samples: np.ndarray
+    captured_at: float
+    text: str = ""
+    recording: str | None = None  # Corpus entry written in capture mode
+
+
+# Biases Whisper towards the assistant's vocabulary
+COMMAND_PROMPT = (
+    "Transcrição de comandos de voz para o assistente virtual Stuart. "
+    "Palavras-chave: Stuart, abrir, pesquisar, agendar, hora, data, clima, "
+    "cancelar, desligar, tocar, piada, Python, Linux, código."
+)
+
+
 # pylint: disable=broad-except
 class Assistant:
     def __init__(
@@ -37,15 +62,66 @@ class Assistant:
         context: AssistantContext | None = None,
         content_agent=None,
         coding_agent=None,
+        audio_capture: AudioCapture | None = None,
+        wake_model=None,
+        utterance_recorder: UtteranceRecorder | None = None,
+        cascade_model=None,
+        speech_output=None,
+        tts_cache=None,
+        audio_player: AudioPlayer | None = None,
+        synthesizer: Synthesizer | None = None,
+        speech_templates: SpeechTemplates | None = None,
     ):
         self.keyword = settings.assistant_keyword.lower()
-        self.temp_file_path = f"{settings.temp_dir}/temp_audio.wav"
+        self.wake_matcher = WakeWordMatcher([self.keyword, *settings.wake_keywords], settings.wake_word_confidence)
 
         self.recognizer = speech_recognizer
         self.recognizer.energy_threshold = settings.mic_energy_threshold
         self.recognizer.dynamic_energy_threshold = settings.mic_dynamic_energy_threshold
+        self.capture = audio_capture or AudioCapture(self.recognizer)
+        self.recorder = utterance_recorder
+        # Async callable taking the encoded TTS audio; None plays it on the local speakers
+        self.speech_output = speech_output
+        # TTSCache shared by every session; None always synthesizes
+        self.tts_cache = tts_cache
+        # Time/date replies assembled from pre-synthesized pieces, shared by every session
+        self.speech_templates = speech_templates
+        # Long-lived local output, opened on the first reply
+        self.audio_player = audio_player or AudioPlayer()
+        self._audio_player_failed = False
+        # One reply at a time: an answer waits for the announcement before it
+        self._speech_lock = asyncio.Lock()
+        self._announcements: set[asyncio.Task] = set()
+        # The reply being spoken: the barge-in check must not take it for the user
+        self._speaking_text: str | None = None
+        self._pipeline_active = False
+        self._utterance_claim: asyncio.Future | None = None
+        self._phrase: PhraseProgress | None = None
+        # The running handle_command, cancelled when the user barges in
+        self._command_task: asyncio.Task | None = None
 
         self.model = whisper_model
+        # Two-tier mode: a tiny/base model screens for the keyword and the
+        # configured model only decodes the utterances that pass the gate.
+        self.wake_gate = None
+        if settings.wake_gate_enabled:
+            self.wake_gate = WakeWordGate(wake_model or whisper_model, self.keyword)
+        # Cascade mode: a fast model decodes commands first and the configured
+        # model only re-decodes the transcripts that are doubtful or miss the fast paths.
+        self.cascade = None
+        if settings.stt_cascade_enabled:
+            self.cascade = TranscriptionCascade(cascade_model or wake_model or whisper_model)
+        # Yes/no replies are short and closed-vocabulary: the fast model is enough
+        self.confirmation = ConfirmationRecognizer(wake_model or whisper_model)
+        # Barge-in: the wake word or a stop word cuts a reply short. A network
+        # client plays replies itself and cannot be stopped, so it stays half-duplex.
+        self.barge_in = None
+        if settings.barge_in_enabled and speech_output is None:
+            self.barge_in = BargeInDetector(wake_model or whisper_model, self.wake_matcher)
+        # Streaming mode: partial decodes while the user is still talking
+        self.partial_transcriber = None
+        if settings.streaming_stt_enabled:
+            self.partial_transcriber = PartialTranscriber(whisper_model, COMMAND_PROMPT)
 
         wikipedia.set_lang("pt")
 
@@ -67,6 +143,12 @@ class Assistant:
         self.web_search_agent = web_search_agent
         self.local_rag_agent = local_rag_agent
         self.context = context or AssistantContext()
+        self.noise_calibrator: NoiseCalibrator | None = None
+        self.echo_suppressor = EchoSuppressor(self.context)
+        # TTS_BACKEND, with the local fallback when it is slow or offline
+        self.synthesizer = synthesizer or create_synthesizer(
+            self.tts_cache, on_fallback=self.context.record_tts_fallback
+        )
 
         self.command_handler = CommandHandler(
             self.speak,
@@ -78,94 +160,183 @@ class Assistant:
             memory,
             content_agent=content_agent,
             coding_agent=coding_agent,
+            announce_func=self.announce,
         )
 
+    async def announce(self, text: str):
+        """
+        Speaks a progress message without waiting for it.
+
+        The caller goes on with the work it announces while the message plays;
+        its answer is queued behind the announcement by the next ``speak``.
+        """
+        # Eager: takes its turn at the speech lock now, ahead of the answer
+        task = asyncio.Task(self.speak(text), loop=asyncio.get_running_loop(), eager_start=True)
+        self._announcements.add(task)
+        task.add_done_callback(self._announcements.discard)
+
     async def speak(self, text: str):
         """
         Converts text to speech and plays it.
+
+        Long answers are spoken sentence by sentence: the next sentence is
+        synthesized while the current one plays, and audio starts while the
+        first one is still being synthesized. The time to the first chunk is
+        recorded as the ``tts_first_audio`` stage. Cancelling it (barge-in)
+        drops the audio not played yet. Calls never overlap: each one waits
+        for the reply (or announcement) already playing.
         """
+        async with self._speech_lock:
+            await self._speak(text)
+
+    async def _speak(self, text: str):
         self.context.set_status(AssistantStatus.SPEAKING)
-        temp_audio_file = f"{settings.temp_dir}/response_{uuid.uuid4()}.mp3"
+        self._speaking_text = text
+        player = None
+        stream = None
         try:
             logger.info("Assistant: %s", text)
-
-            # Use Edge TTS for high quality audio
-            communicate = edge_tts.Communicate(text, "pt-BR-AntonioNeural")
-            await communicate.save(temp_audio_file)
-
-            system = platform.system()
-            if system == "Linux":
-                try:
-                    # Use mpg123 on Linux, as playsound can be problematic
-                    await asyncio.create_subprocess_exec(
-                        "mpg123", "-q", temp_audio_file,
-                        stdout=subprocess.DEVNULL,
-                        stderr=subprocess.DEVNULL
-                    )
-                    # We wait a bit or use wait() if we want it to be fully synchronous playback
-                    # For now, let's wait for it to finish to mimic original behavior
-                    proc = await asyncio.create_subprocess_exec(
-                        "mpg123", "-q", temp_audio_file,
-                        stdout=subprocess.DEVNULL,
-                        stderr=subprocess.DEVNULL
-                    )
-                    await proc.wait()
-                except Exception:
-                    # Fallback to playsound if mpg123 is not available or fails
-                    logger.warning("mpg123 not found or failed, falling back to playsound...")
-                    await asyncio.to_thread(playsound, temp_audio_file)
-            else:
-                # Use playsound for other systems (Windows, Darwin)
-                await asyncio.to_thread(playsound, temp_audio_file)
-
+            started = time.monotonic()
+            player = await self._local_player()
+            if player is None and self.speech_output is None:
+                stream = await self._streaming_fallback()
+            rendered = self.speech_templates.render(text) if self.speech_templates is not None else None
+            if rendered is not None:
+                await self._play_rendered(rendered, player or stream, started)
+                return
+            decoder = Mp3Decoder(player.sample_rate) if player else None
+            spoken = bytearray()
+            first_audio_at = None
+
+            async def play_sentence(_index, chunks):
+                nonlocal first_audio_at
+                audio = bytearray()
+                async for data in chunks:
+                    if first_audio_at is None:
+                        first_audio_at = time.monotonic()
+                        self.context.record_stage_timing("tts_first_audio", first_audio_at - started)
+                    audio += data
+                    if player:
+                        await player.enqueue(decoder.decode(data))
+                    elif stream:
+                        await stream.write(data)
+                if player or stream:
+                    spoken.extend(audio)
+                elif audio:
+                    await self._add_echo_reference(bytes(audio), time.monotonic())
+                    if self.speech_output is not None:
+                        # Network session: the client plays it; returns once it reports playback done
+                        await self.speech_output(bytes(audio))
+                    else:
+                        await play_mp3_file(bytes(audio))
+
+            await SpeechPipeline(self._synthesize).run(split_sentences(text), play_sentence)
+            if player:
+                await player.enqueue(decoder.flush())
+                await self._add_echo_reference(bytes(spoken), first_audio_at)
+                await player.flush()
+            elif stream:
+                await self._add_echo_reference(bytes(spoken), first_audio_at)
+                await stream.finish()
+
+        except asyncio.CancelledError:
+            if player:
+                player.interrupt()
+            if stream:
+                await stream.abort()
+            raise
         except Exception as e:
             logger.error("Error in text-to-speech: %s", e)
+            if player:
+                player.interrupt()
+            if stream:
+                await stream.abort()
         finally:
-            if os.path.exists(temp_audio_file):
-                os.remove(temp_audio_file)
+            self._speaking_text = None
             self.context.set_status(AssistantStatus.LISTENING)
 
-    async def listen_for_confirmation(self, prompt: str) -> bool:
-        """Asks a confirmation question and listens for a 'yes' or 'no' answer."""
-        await self.speak(prompt)
+    async def _play_rendered(self, rendered: RenderedSpeech, player: AudioPlayer | StreamingPlayer | None,
+                             started: float):
+        """Plays a reply assembled by the speech templates: the PCM goes straight to the player."""
+        self.context.record_stage_timing("tts_first_audio", time.monotonic() - started)
+        await self._add_echo_reference(rendered.mp3, time.monotonic())
+        if isinstance(player, StreamingPlayer):
+            await player.write(rendered.mp3)
+            await player.finish()
+        elif player:
+            await player.enqueue(rendered.pcm)
+            await player.flush()
+        elif self.speech_output is not None:
+            await self.speech_output(rendered.mp3)
+        else:
+            await play_mp3_file(rendered.mp3)
+
+    async def _local_player(self) -> AudioPlayer | None:
+        """The running local output, or None for network sessions and when no output device works."""
+        if self.speech_output is not None or self._audio_player_failed:
+            return None
+        if not self.audio_player.running:
+            try:
+                await asyncio.to_thread(self.audio_player.start)
+            except AudioDeviceError as e:
+                logger.warning("%s — falling back to mpg123/playsound", e)
+                self._audio_player_failed = True
+                return None
+        return self.audio_player
+
+    @staticmethod
+    async def _streaming_fallback() -> StreamingPlayer | None:
+        """An mpg123 process for one reply when no local output device works; None where mpg123 is missing."""
+        stream = StreamingPlayer()
+        return stream if await stream.start() else None
+
+    async def _add_echo_reference(self, audio: bytes, started_at: float | None):
+        if not audio or not self.echo_suppressor.filter_enabled:
+            return
         try:
+            reference = await asyncio.to_thread(load_reference, audio)
+            self.echo_suppressor.add_reference(reference, started_at=started_at)
+        except Exception as e:
+            logger.warning("Could not load the echo reference: %s", e)
+
+    def _synthesize(self, text: str):
+        """The MP3 for one sentence, as an async iterator of chunks."""
+        return self.synthesizer.stream(text)
+
+    async def ask_confirmation(self, prompt: str) -> ConfirmationResult:
+        """Asks a yes/no question and classifies the reply as YES, NO or UNCLEAR."""
+        await self.speak(prompt)
+        if self._pipeline_active:
+            audio = await self._claim_next_utterance(timeout=5 + 3)
+        else:
             def listen_act():
-                try:
-                    with ignore_stderr():
-                        with sr.Microphone() as source:
-                            logger.info("Listening for confirmation...")
-                            self.recognizer.adjust_for_ambient_noise(source, duration=1)
-                            return self.recognizer.listen(source, timeout=5, phrase_time_limit=3)
-                except OSError as e:
-                    raise AudioDeviceError(f"Could not access microphone: {e}") from e
+                # Reuses the persistent stream and its calibrated threshold; only a
+                # stream opened just now gets calibrated. Drops what was heard
+                # while the prompt was spoken.
+                if not self.capture.running:
+                    self.capture.start()
+                    self.capture.calibrate(duration=1)
+                self.capture.flush()
+                logger.info("Listening for confirmation...")
+                return self.capture.listen(timeout=5, phrase_time_limit=3)
 
             audio = await asyncio.to_thread(listen_act)
 
-            with TempFileHandler(self.temp_file_path) as temp_file:
-                async with aiofiles.open(temp_file, "wb") as f:
-                    if hasattr(audio, '__iter__') and not isinstance(audio, sr.AudioData):
-                        audio = next(audio)
-                        await f.write(audio.get_wav_data())
-                    elif isinstance(audio, sr.AudioData):
-                        await f.write(audio.get_wav_data())
-
-                try:
-                    def transcribe_wrapper():
-                        segments, _ = self.model.transcribe(
-                            temp_file, 
-                            language="pt", 
-                            initial_prompt="Confirmação. Responda apenas Sim ou Não.",
-                            condition_on_previous_text=False
-                        )
-                        return " ".join([segment.text for segment in segments])
-
-                    response_text_raw = await asyncio.to_thread(transcribe_wrapper)
-                except Exception as e:
-                    raise TranscriptionError(f"Transcription failed: {e}") from e
-
-            response_text = response_text_raw.lower().strip()
-            logger.info("Confirmation response: '%s'", response_text)
-            return "sim" in response_text
+        try:
+            samples = await asyncio.to_thread(self._to_samples, audio)
+            result = await asyncio.to_thread(self.confirmation.recognize, samples)
+        except Exception as e:
+            raise TranscriptionError(f"Confirmation decode failed: {e}") from e
+        logger.info("Confirmation response: '%s' -> %s (%.2f)", result.text, result.answer.value, result.confidence)
+        return result
+
+    async def listen_for_confirmation(self, prompt: str) -> bool:
+        """Asks a confirmation question. True only for a clear 'yes'; an unclear reply is asked once more."""
+        try:
+            result = await self.ask_confirmation(prompt)
+            if result.answer is ConfirmationAnswer.UNCLEAR:
+                result = await self.ask_confirmation("Não entendi. Responda sim ou não.")
+            return result.answer is ConfirmationAnswer.YES
 
         except (sr.WaitTimeoutError, sr.UnknownValueError):
             logger.warning("Could not understand confirmation.")
@@ -182,6 +353,105 @@ class Assistant:
             logger.error("An error occurred during confirmation: %s", e)
             return False
 
+    async def _claim_next_utterance(self, timeout: float):
+        """
+        Takes the next phrase from the running capture stage instead of the command pipeline.
+
+        The capture stage owns the stream, so a confirmation cannot read it directly
+        (nor recalibrate it); the dynamic threshold of the running stream is reused.
+        """
+        logger.info("Listening for confirmation...")
+        self.capture.flush()
+        self._utterance_claim = asyncio.get_running_loop().create_future()
+        try:
+            return await asyncio.wait_for(self._utterance_claim, timeout)
+        except asyncio.TimeoutError as e:
+            raise sr.WaitTimeoutError("listening timed out while waiting for confirmation") from e
+        finally:
+            self._utterance_claim = None
+
+    @staticmethod
+    def _to_samples(audio) -> np.ndarray:
+        """Normalizes captured audio (AudioData or a ready buffer) into Whisper's float32 input."""
+        if isinstance(audio, np.ndarray):
+            return audio
+        # listen(stream=True) yields AudioData chunks instead of returning one
+        if hasattr(audio, '__iter__') and not isinstance(audio, sr.AudioData):
+            audio = next(audio)
+        return audio_data_to_float32(audio)
+
+    async def transcribe(self, audio, initial_prompt: str | None = None) -> str:
+        """
+        Transcribes captured audio with Whisper, fully in memory.
+
+        The PCM frames are converted straight into a 16 kHz float32 buffer,
+        so there is no temp WAV file and no ffmpeg decode round-trip.
+        """
+        try:
+            def transcribe_wrapper():
+                samples = self._to_samples(audio)
+                segments, _ = self.model.transcribe(
+                    samples,
+                    language="pt",
+                    initial_prompt=initial_prompt,
+                    beam_size=settings.whisper_beam_size,
+                    condition_on_previous_text=False
+                )
+                return " ".join([segment.text for segment in segments])
+
+            return await asyncio.to_thread(transcribe_wrapper)
+        except Exception as e:
+            raise TranscriptionError(f"Transcription failed: {e}") from e
+
+    async def transcribe_fast(self, samples: np.ndarray, initial_prompt: str | None = None) -> Transcript:
+        """Greedy first-pass decode with the cascade's fast model, keeping the confidence statistics."""
+        try:
+            def transcribe_wrapper():
+                segments, _ = self.cascade.fast_model.transcribe(
+                    samples,
+                    language="pt",
+                    initial_prompt=initial_prompt,
+                    beam_size=1,
+                    condition_on_previous_text=False
+                )
+                return summarize_segments(segments)
+
+            return await asyncio.to_thread(transcribe_wrapper)
+        except Exception as e:
+            raise TranscriptionError(f"Fast transcription failed: {e}") from e
+
+    def _fast_path_miss(self, text: str) -> str | None:
+        """
+        Why a first-pass transcript cannot be dispatched as is: no wake word,
+        or only the LLM router could take it.
+        """
+        if self.wake_matcher.match(text) is None:
+            # The wake gate heard the keyword: the fast model probably garbled it
+            return "no wake word"
+        if not self.command_handler.has_system_route(text):
+            return "no system route"
+        return None
+
+    async def _transcribe_command(self, samples: np.ndarray, initial_prompt: str) -> str:
+        """Full decode, or in cascade mode the fast transcript unless it is doubtful."""
+        if self.cascade is not None:
+            fast = await self.transcribe_fast(samples, initial_prompt)
+            reason = self.cascade.doubt(fast) or self._fast_path_miss(fast.text)
+            self.context.record_cascade(escalated=reason is not None)
+            if reason is None:
+                return fast.text.strip()
+            logger.debug("Re-decoding with the full model (%s): %s", reason, fast.text)
+        return (await self.transcribe(samples, initial_prompt=initial_prompt)).strip()
+
+    async def passes_wake_gate(self, samples: np.ndarray) -> bool:
+        """Runs the cheap keyword-spotting stage. Always True when the gate is disabled."""
+        if self.wake_gate is None:
+            return True
+        try:
+            return await asyncio.to_thread(self.wake_gate.detect, samples)
+        except Exception as e:
+            raise TranscriptionError(f"Wake word gate failed: {e}") from e
+
     # Characters that have no place in voice commands and signal injection attempts
     _DANGEROUS_PATTERN = re.compile(r'[|;&`$]|\.\.|<script', re.IGNORECASE)
     _MAX_COMMAND_LEN = 500
@@ -215,21 +485,13 @@ class Assistant:
         """
         Listens for audio continuously, transcribes it, and checks for the keyword.
         """
-        initial_prompt = (
-            "Transcrição de comandos de voz para o assistente virtual Stuart. "
-            "Palavras-chave: Stuart, abrir, pesquisar, agendar, hora, data, clima, "
-            "cancelar, desligar, tocar, piada, Python, Linux, código."
-        )
+        initial_prompt = COMMAND_PROMPT
 
         logger.info("Adjusting for ambient noise...")
-        # Initial adjustment
+        # Initial adjustment: opens the long-lived microphone stream
         def adjust():
-            try:
-                with ignore_stderr():
-                    with sr.Microphone() as source:
-                        self.recognizer.adjust_for_ambient_noise(source, duration=1)
-            except OSError as e:
-                raise AudioDeviceError(f"Could not access microphone: {e}") from e
+            self.capture.start()
+            self.capture.calibrate(duration=1)
 
         try:
             await asyncio.to_thread(adjust)
@@ -238,94 +500,347 @@ class Assistant:
             await self.speak("Erro crítico: Não consegui encontrar um microfone funcional.")
             return
 
+        if settings.noise_calibration_enabled:
+            if self.noise_calibrator is None:
+                self.noise_calibrator = NoiseCalibrator(self.capture, on_update=self.context.record_noise_estimate)
+            # The calibrator owns the threshold from now on
+            self.recognizer.dynamic_energy_threshold = False
+            self.noise_calibrator.start()
+
         logger.info("Listening for keyword '%s'...", self.keyword)
 
+        try:
+            await self._listen_loop(initial_prompt)
+        finally:
+            if self.noise_calibrator is not None:
+                self.noise_calibrator.stop()
+            self.capture.stop()
+            self.audio_player.close()
+
+    @staticmethod
+    def _put_dropping_oldest(queue: asyncio.Queue, item) -> bool:
+        """Enqueues without blocking; when full, the oldest item is discarded. Returns True if one was dropped."""
+        dropped = False
+        if queue.full():
+            queue.get_nowait()
+            dropped = True
+        queue.put_nowait(item)
+        return dropped
+
+    async def _capture_stage(self, audio_queue: asyncio.Queue, partial_queue: asyncio.Queue | None = None,
+                             barge_in_queue: asyncio.Queue | None = None):
+        """Producer: keeps pulling phrases from the microphone, whatever the later stages are doing."""
+        loop = asyncio.get_running_loop()
+        # Called from the capture thread with (phrase_start, audio)
+        on_partial = (
+            functools.partial(loop.call_soon_threadsafe, self._on_partial_audio, partial_queue, barge_in_queue)
+            if partial_queue is not None or barge_in_queue is not None else None
+        )
+
         while True:
             try:
                 def listen_loop():
-                    try:
-                        with ignore_stderr():
-                            with sr.Microphone() as source:
-                                return self.recognizer.listen(source, timeout=None, phrase_time_limit=settings.phrase_time_limit)
-                    except OSError as e:
-                        raise AudioDeviceError(f"Could not access microphone: {e}") from e
+                    # Reopens the stream only if the capture thread died (device error)
+                    self.capture.start()
+                    return self.capture.listen(
+                        timeout=None,
+                        phrase_time_limit=settings.phrase_time_limit,
+                        on_partial=on_partial,
+                        partial_interval=settings.streaming_stt_interval_seconds,
+                    )
 
+                started = time.perf_counter()
                 audio = await asyncio.to_thread(listen_loop)
+                captured_at = time.monotonic()
+                self.context.record_stage_timing("capture", time.perf_counter() - started)
                 logger.debug("Audio captured, processing...")
 
-                with TempFileHandler(self.temp_file_path) as temp_file:
-                    async with aiofiles.open(temp_file, "wb") as f:
-                        if hasattr(audio, '__iter__') and not isinstance(audio, sr.AudioData):
-                            audio = next(audio)
-                            await f.write(audio.get_wav_data())
-                        elif isinstance(audio, sr.AudioData):
-                            await f.write(audio.get_wav_data())
-
-                    # Transcribe using Whisper
-                    try:
-                        def transcribe_wrapper():
-                            segments, _ = self.model.transcribe(
-                                temp_file,
-                                language="pt",
-                                initial_prompt=initial_prompt,
-                                condition_on_previous_text=False
-                            )
-                            return " ".join([segment.text for segment in segments])
-
-                        text = await asyncio.to_thread(transcribe_wrapper)
-                    except Exception as e:
-                        raise TranscriptionError(f"Transcription failed: {e}") from e
-
-                text = text.strip()
-                if not text:
-                    continue
-
-                logger.debug("Heard: %s", text)
-                text_lower = text.lower()
-
-                # 1. Strict Match
-                if self.keyword in text_lower:
-                    logger.info("Wake word detected (strict match): %s", text)
-                    result = await self.handle_command(text)
-                    if result == AssistantSignal.QUIT:
-                        break
+                # Half-duplex: never transcribe the assistant's own voice
+                heard = audio
+                audio = await asyncio.to_thread(self.echo_suppressor.process, audio, captured_at)
+                if audio is None:
+                    self.context.record_echo_suppressed()
+                    if barge_in_queue is not None and self._barge_in_armed() and not self.echo_suppressor.matched_echo:
+                        # Said over the assistant's voice: may still be the user cutting in.
+                        # A phrase the echo filter recognised is the assistant itself.
+                        self._put_dropping_oldest(barge_in_queue, (heard, captured_at, True))
+                    if self._phrase is not None:
+                        self._phrase.finalized = True
                     continue
 
-                # 2. Fuzzy Match
-                # Check if the keyword is somewhat present
-                # partial_ratio allows "stuart faça isso" to match "stuart" well even if "stuart" is slightly off?
-                # Actually partial_ratio is 100 if the short string is in the long string.
-                # If we have "stewart faça isso", partial ratio of "stuart" might be high.
-                fuzzy_score = fuzz.partial_ratio(self.keyword, text_lower)
-                # Let's verify word-by-word to find the trigger
-                words = text_lower.split()
-                if not words:
+                # A pending confirmation gets the next phrase instead of the command pipeline
+                if self._utterance_claim is not None and not self._utterance_claim.done():
+                    self._utterance_claim.set_result(audio)
                     continue
 
-                best_match = process.extractOne(self.keyword, words, scorer=fuzz.ratio)
-                if best_match:
-                    matched_word = best_match[0]
-                    score = best_match[1]
-                    if score >= settings.wake_word_confidence:
-                        logger.info("Wake word detected (fuzzy match: '%s', score: %d): %s", matched_word, score, text)
-                        # Replace the wrong word with the correct keyword so handle_command can strip it
-                        # We use replace(..., 1) to only replace the first occurrence
-                        text_fixed = text_lower.replace(matched_word, self.keyword, 1)
-                        result = await self.handle_command(text_fixed)
-                        if result == AssistantSignal.QUIT:
-                            break
+                # Partials of a phrase are always reported before the phrase itself
+                phrase = self._phrase
+                if phrase is not None and not phrase.finalized:
+                    phrase.finalized = True
+                    if phrase.dispatched:
+                        logger.debug("Phrase already dispatched from a partial transcript")
+                        continue
+
+                samples = await asyncio.to_thread(audio_data_to_float32, audio)
+                utterance = CapturedUtterance(samples, captured_at)
+                if self.recorder is not None:
+                    utterance.recording = await asyncio.to_thread(
+                        self.recorder.record, audio, listen_ms=round((time.perf_counter() - started) * 1000, 1)
+                    )
+                if self.capture.lossless:
+                    # Replayed faster than real time: wait for STT instead of dropping audio
+                    await audio_queue.put(utterance)
+                elif self._put_dropping_oldest(audio_queue, utterance):
+                    logger.warning("STT is falling behind, dropped the oldest captured utterance")
+                    self.context.record_dropped_utterance()
 
             except sr.WaitTimeoutError:
                 logger.debug("Listening timed out, listening again...")
-            except sr.UnknownValueError:
-                logger.debug("Could not understand audio, listening again...")
             except AudioDeviceError as e:
                 logger.error("Audio device error: %s", e)
                 await self.speak("Tive um problema com o microfone. Tentando reconectar...")
                 await asyncio.sleep(5)
+            except Exception as e:
+                logger.error("An unexpected error occurred while capturing: %s", e)
+                await asyncio.sleep(1) # Prevent tight error loop
+
+    def _on_partial_audio(self, partial_queue: asyncio.Queue | None, barge_in_queue: asyncio.Queue | None,
+                          phrase_start: int, audio: sr.AudioData):
+        """Event-loop side of the capture callback: keeps only the newest partial of the current phrase."""
+        if barge_in_queue is not None and self._barge_in_armed():
+            self._put_dropping_oldest(barge_in_queue, (audio, time.monotonic(), False))
+            return
+        if partial_queue is None or self._utterance_claim is not None:
+            return
+        if self._phrase is None or self._phrase.phrase_id != phrase_start:
+            self._phrase = PhraseProgress(phrase_start)
+        phrase = self._phrase
+        if phrase.finalized or phrase.dispatched:
+            return
+        # A partial superseded by a longer one is worthless: drop it silently
+        self._put_dropping_oldest(partial_queue, (phrase, audio, time.monotonic()))
+
+    async def _partial_stage(self, partial_queue: asyncio.Queue, command_queue: asyncio.Queue):
+        """
+        Decodes the phrase while it is still being spoken.
+
+        Once a partial addresses the assistant, matches an argument-less system
+        route and stays unchanged for ``streaming_stt_stable_passes`` decodes,
+        the command is dispatched without waiting for the end-of-phrase silence
+        and the full transcription. Anything else is left to the regular path.
+        """
+        while True:
+            phrase, audio, captured_at = await partial_queue.get()
+            if phrase.finalized or phrase.dispatched:
+                continue
+            if self.echo_suppressor.half_duplex and self.context.status is AssistantStatus.SPEAKING:
+                continue
+            try:
+                started = time.perf_counter()
+                samples = await asyncio.to_thread(audio_data_to_float32, audio)
+                text = await asyncio.to_thread(self.partial_transcriber.decode, samples)
+                self.context.record_stage_timing("partial_stt", time.perf_counter() - started)
+            except Exception as e:
+                logger.error("Partial transcription failed: %s", e)
+                continue
+            # The phrase ended while decoding: the final transcript takes over
+            if phrase.finalized or not text:
+                continue
+
+            stable = phrase.observe(text, settings.streaming_stt_stable_passes)
+            command = self._addressed_text(text)
+            if not (stable and command and self.command_handler.is_instant_command(command)):
+                continue
+
+            logger.info("Dispatching from a stable partial transcript: %s", text)
+            phrase.dispatched = True
+            self.context.record_early_dispatch()
+            await command_queue.put(CapturedUtterance(samples, captured_at, command))
+
+    def _barge_in_armed(self) -> bool:
+        """True while a command is running and the assistant is talking."""
+        return (self._command_task is not None and not self._command_task.done()
+                and self.context.status is AssistantStatus.SPEAKING)
+
+    async def _interrupt_command(self, heard_from: float):
+        """Cancels the running command and its announcements, then frees the microphone from ``heard_from``."""
+        tasks = [self._command_task, *self._announcements]
+        self.context.record_interruption()
+        for task in tasks:
+            task.cancel()
+        # speak() stops the output and closes the speaking interval on its way out
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self.echo_suppressor.release_from(heard_from)
+
+    async def _barge_in_stage(self, barge_in_queue: asyncio.Queue, audio_queue: asyncio.Queue):
+        """
+        Lets the user interrupt a reply.
+
+        While a command speaks, the capture stage hands over what it hears
+        (growing partials, and phrases the half-duplex gate threw away). A stop
+        word or the wake word cancels the command; a wake word heard in a
+        partial leaves the rest of the phrase to the regular path, which the
+        half-duplex gate no longer trims, and a phrase that already ended is
+        sent to STT directly.
+        """
+        while True:
+            audio, heard_until, final = await barge_in_queue.get()
+            if not self._barge_in_armed():
+                continue
+            try:
+                samples = await asyncio.to_thread(audio_data_to_float32, audio)
+                kind, text = await asyncio.to_thread(self.barge_in.detect, samples, self._speaking_text)
+            except Exception as e:
+                logger.error("Barge-in check failed: %s", e)
+                continue
+            if kind is None or not self._barge_in_armed():
+                continue
+
+            logger.info("Barge-in (%s): %s", kind.value, text)
+            window = min(samples.size / WHISPER_SAMPLE_RATE, self.barge_in.window_seconds)
+            await self._interrupt_command(heard_from=heard_until - window)
+            if kind is BargeInKind.COMMAND and final:
+                tail = samples[-int(window * WHISPER_SAMPLE_RATE):]
+                await audio_queue.put(CapturedUtterance(tail, heard_until))
+
+    async def _stt_stage(self, audio_queue: asyncio.Queue, transcript_queue: asyncio.Queue, initial_prompt: str):
+        """Runs the wake gate and Whisper on captured audio."""
+        while True:
+            utterance = await audio_queue.get()
+            try:
+                age = time.monotonic() - utterance.captured_at
+                if age > settings.pipeline_max_audio_age_seconds and not self.capture.lossless:
+                    logger.warning("Dropping stale utterance captured %.1fs ago", age)
+                    self.context.record_dropped_utterance()
+                    continue
+
+                started = time.perf_counter()
+                if not await self.passes_wake_gate(utterance.samples):
+                    logger.debug("No wake word in the first %.1fs, skipping transcription",
+                                 settings.wake_gate_search_seconds)
+                    self.context.record_stage_timing("stt", time.perf_counter() - started)
+                    await self._annotate_recording(utterance, wake_gate=False)
+                    continue
+
+                utterance.text = await self._transcribe_command(utterance.samples, initial_prompt)
+                stt_seconds = time.perf_counter() - started
+                self.context.record_stage_timing("stt", stt_seconds)
+                await self._annotate_recording(utterance, wake_gate=True, transcript=utterance.text,
+                                               stt_ms=round(stt_seconds * 1000, 1))
+                if not utterance.text:
+                    continue
+
+                logger.debug("Heard: %s", utterance.text)
+                # Backpressure: wait for the router rather than dropping recognised text
+                await transcript_queue.put(utterance)
+
             except TranscriptionError as e:
                 logger.error("Transcription error: %s", e)
                 await asyncio.sleep(1)
             except Exception as e:
-                logger.error("An unexpected error occurred: %s", e)
-                await asyncio.sleep(1) # Prevent tight error loop
+                logger.error("An unexpected error occurred during transcription: %s", e)
+                await asyncio.sleep(1)
+
+    def _addressed_text(self, text: str) -> str | None:
+        """Returns the transcript with the wake word normalised, or None if it does not address the assistant."""
+        match = self.wake_matcher.match(text)
+        if not match:
+            return None
+
+        if match.word == self.keyword:
+            logger.info("Wake word detected (strict match): %s", text)
+            return text
+        logger.info("Wake word detected ('%s' as '%s', score: %d): %s", match.word, match.keyword, match.score, text)
+        # Replace the transcribed word (or an extra keyword) with the main keyword so handle_command can strip it
+        # We use replace(..., 1) to only replace the first occurrence
+        return text.lower().replace(match.word, self.keyword, 1)
+
+    async def _annotate_recording(self, utterance: CapturedUtterance, **meta):
+        """Capture mode: stores what the pipeline made of a recorded phrase next to it."""
+        if self.recorder is None or utterance.recording is None:
+            return
+        try:
+            await asyncio.to_thread(self.recorder.annotate, utterance.recording, **meta)
+        except OSError as e:
+            logger.warning("Could not annotate recorded utterance: %s", e)
+
+    async def _wake_stage(self, transcript_queue: asyncio.Queue, command_queue: asyncio.Queue):
+        """Keeps transcripts that address the assistant and normalises the wake word."""
+        while True:
+            utterance = await transcript_queue.get()
+            started = time.perf_counter()
+            text = self._addressed_text(utterance.text)
+            self.context.record_stage_timing("wake", time.perf_counter() - started)
+            if text is None:
+                continue
+
+            utterance.text = text
+            await command_queue.put(utterance)
+
+    async def _execute_stage(self, command_queue: asyncio.Queue):
+        """Consumer: runs commands one at a time. Returns when a command asks to quit."""
+        while True:
+            utterance = await command_queue.get()
+            self.context.record_stage_timing("queue_latency", time.monotonic() - utterance.captured_at)
+            started = time.perf_counter()
+            self._command_task = asyncio.create_task(self.handle_command(utterance.text))
+            try:
+                result = await self._command_task
+            except asyncio.CancelledError:
+                if asyncio.current_task().cancelling():
+                    raise
+                logger.info("Command interrupted by the user")
+                self.context.set_status(AssistantStatus.LISTENING)
+                continue
+            except Exception as e:
+                logger.error("An unexpected error occurred while executing a command: %s", e)
+                continue
+            finally:
+                self.context.record_stage_timing("execute", time.perf_counter() - started)
+            if result == AssistantSignal.QUIT:
+                return
+
+    async def _listen_loop(self, initial_prompt: str):
+        """
+        Voice pipeline: capture -> STT -> wake -> execute, linked by bounded queues.
+
+        The microphone keeps capturing while earlier utterances are being
+        transcribed or executed. Captured audio is dropped oldest-first when
+        STT falls behind (and when it gets stale); recognised text applies
+        backpressure instead of being dropped. Commands run as a task that a
+        barge-in can cancel while they speak.
+        """
+        size = settings.pipeline_queue_size
+        audio_queue = asyncio.Queue(maxsize=size)
+        transcript_queue = asyncio.Queue(maxsize=size)
+        command_queue = asyncio.Queue(maxsize=size)
+        self.context.queues.update(audio=audio_queue, transcripts=transcript_queue, commands=command_queue)
+
+        partial_queue = None
+        if self.partial_transcriber is not None:
+            # Only the newest partial of the phrase in progress is worth decoding
+            partial_queue = asyncio.Queue(maxsize=1)
+            self.context.queues["partials"] = partial_queue
+        barge_in_queue = None
+        if self.barge_in is not None:
+            # Only the latest speech heard over the assistant's voice matters
+            barge_in_queue = asyncio.Queue(maxsize=1)
+            self.context.queues["barge_in"] = barge_in_queue
+
+        stages = [
+            asyncio.create_task(self._capture_stage(audio_queue, partial_queue, barge_in_queue)),
+            asyncio.create_task(self._stt_stage(audio_queue, transcript_queue, initial_prompt)),
+            asyncio.create_task(self._wake_stage(transcript_queue, command_queue)),
+        ]
+        if partial_queue is not None:
+            stages.append(asyncio.create_task(self._partial_stage(partial_queue, command_queue)))
+        if barge_in_queue is not None:
+            stages.append(asyncio.create_task(self._barge_in_stage(barge_in_queue, audio_queue)))
+        self._pipeline_active = True
+        try:
+            await self._execute_stage(command_queue)
+        finally:
+            self._pipeline_active = False
+            for stage in stages:
+                stage.cancel()
+            await asyncio.gather(*stages, return_exceptions=True)
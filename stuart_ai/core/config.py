@@ -10,9 +10,80 @@ class Settings(BaseSettings):
     # Audio/Wake Word Configuration
     mic_energy_threshold: int = 4000  # Adjust based on mic quality/noise
     mic_dynamic_energy_threshold: bool = True # Let it adjust automatically?
-    wake_word_confidence: int = 70 # 0-100 match score for fuzzy matching
+    wake_word_confidence: int = 85 # 0-100 match score between phonetic keys; above 83 only exact keys match
+    wake_keywords: list[str] = [] # Extra wake words besides assistant_keyword (e.g. ["jarvis"])
+    wake_gate_enabled: bool = True # Screen utterances for the keyword before the full transcription
+    wake_gate_window_seconds: float = 1.5 # Length of each keyword-spotting window
+    wake_gate_search_seconds: float = 3.0 # How far into the utterance to look for the keyword
+    wake_gate_confidence: int = 75 # Looser than wake_word_confidence: the gate must not drop real commands
     phrase_time_limit: int = 10 # Max seconds to record
     whisper_model_size: str = "small" # tiny, base, small, medium, large
+    whisper_compute_type: str = "int8" # int8, int8_float32, float32
+    whisper_cpu_threads: int = 0 # CTranslate2 threads for the command model (0 = library default)
+    whisper_num_workers: int = 1 # Concurrent transcribe calls the command model can serve (e.g. partials + final)
+    whisper_beam_size: int = 5 # Beam search width of the full command decode
+    stt_cascade_enabled: bool = False # Decode commands with a fast model first, re-decode only doubtful ones
+    stt_cascade_model_size: str | None = "base" # Fast first-pass model (empty = reuse the wake model)
+    stt_cascade_min_avg_logprob: float = -0.6 # Below this (worst segment) the fast transcript is re-decoded
+    stt_cascade_max_no_speech_prob: float = 0.5 # Above this the fast transcript is re-decoded
+    stt_cascade_max_compression_ratio: float = 2.4 # Above this (repetitive decode) the fast transcript is re-decoded
+    wake_model_size: str | None = "tiny" # Screening model for the wake gate (empty = reuse whisper_model_size)
+    wake_compute_type: str = "int8"
+    stt_workers: int = 0 # Whisper worker processes for the command model (0 = transcribe in-process)
+    stt_worker_cpu_threads: int = 0 # CTranslate2 threads per worker (0 = library default)
+    capture_buffer_seconds: int = 30 # Size of the microphone ring buffer
+    capture_pre_roll_seconds: float = 0.3 # Audio kept from before speech onset
+    vad_silence_seconds: float = 0.5 # Silence that ends an utterance
+    vad_min_speech_seconds: float = 0.25 # Shorter bursts are dropped before transcription
+    vad_padding_seconds: float = 0.2 # Silence kept after the last speech frame
+    audio_source: str = "live" # live (microphone), capture (microphone + save utterances) or replay (corpus)
+    audio_corpus_dir: str = "tmp/audio_corpus" # Where capture mode writes and replay mode reads utterances
+    audio_replay_speed: float = 1.0 # 1 = real time, 0 = as fast as the pipeline takes it
+    half_duplex_enabled: bool = True # Cut audio heard while the assistant is speaking out of captured phrases
+    echo_tail_seconds: float = 0.3 # Room echo after playback still counts as the assistant speaking
+    echo_filter_enabled: bool = False # Also drop phrases that cross-correlate with the TTS audio just played
+    echo_correlation_threshold: float = 0.4 # Normalised correlation (0-1) above which a phrase is our own echo
+    echo_max_delay_seconds: float = 0.5 # Playback-to-microphone delay searched by the echo filter
+    barge_in_enabled: bool = True # The wake word or a stop word interrupts the assistant while it speaks
+    barge_in_stop_words: list[str] = ["pare", "chega", "silêncio", "cancela"] # Stop the reply without a new command
+    barge_in_window_seconds: float = 2.0 # Latest speech decoded when checking for a barge-in
+    audio_sessions: dict[str, str] = {} # Name -> source ("mic", "mic:<index>", "replay:<dir>"); empty = one session
+    stt_batch_size: int = 8 # Concurrent session utterances decoded together by the shared command model
+    stt_batch_wait_ms: float = 30.0 # How long the first utterance of a batch waits for others
+    network_audio_enabled: bool = False # Serve remote clients on /ws/audio (starts the API)
+    network_audio_token: str = "" # Shared secret every client hello must carry; empty = remote sessions refused
+    network_playback_timeout_seconds: float = 30.0 # Max wait for a client to report a reply was played
+    pipeline_queue_size: int = 4 # Max utterances waiting between voice pipeline stages
+    pipeline_max_audio_age_seconds: float = 15.0 # Captured audio older than this is dropped as stale
+    noise_calibration_enabled: bool = True # Track the noise floor in the background and retune the threshold
+    noise_calibration_window_seconds: float = 30.0 # Rolling window the noise floor is estimated over
+    noise_calibration_update_seconds: float = 1.0 # How often the threshold is recomputed
+    noise_calibration_percentile: float = 20.0 # Low percentile of frame energy taken as the noise floor
+    noise_calibration_ratio: float = 2.0 # energy_threshold = ratio x noise floor
+    confirmation_window_seconds: float = 2.0 # Start of a yes/no reply that gets decoded
+    confirmation_confidence: int = 80 # Min fuzzy score for a word to count as yes/no
+    streaming_stt_enabled: bool = False # Decode partials while the user speaks; instant commands dispatch early
+    streaming_stt_interval_seconds: float = 0.5 # Speech between two partial decodes
+    streaming_stt_stable_passes: int = 2 # Identical partials needed before dispatching early
+
+    # Speech Output (TTS)
+    tts_voice: str = "pt-BR-AntonioNeural" # Edge TTS voice
+    tts_backend: str = "edge" # edge (Edge TTS, online) or espeak (espeak-ng, local)
+    tts_rate: str = "+0%" # Edge TTS speaking rate
+    tts_cache_enabled: bool = True # Keep synthesized speech on disk, keyed by (text, voice, rate)
+    tts_cache_dir: str = "tmp/tts_cache"
+    tts_cache_max_mb: float = 50.0 # Least recently used entries are evicted past this size
+    tts_presynthesize: bool = True # Synthesize the fixed phrases of the tools and replies at startup
+    tts_lookahead_sentences: int = 2 # Sentences synthesized ahead of the one playing
+    tts_min_sentence_chars: int = 20 # Shorter fragments are joined to the next sentence
+    tts_templates_enabled: bool = True # Time and date replies assembled from pre-synthesized pieces
+    tts_template_gap_seconds: float = 0.08 # Pause between two assembled pieces
+    audio_output_buffer_seconds: float = 10.0 # Decoded speech queued ahead of the speakers
+    tts_fallback_backend: str = "espeak" # Local backend used when the main one is slow or fails (empty = none)
+    tts_first_audio_budget_seconds: float = 1.5 # Main backend time to first audio before falling back
+    tts_fallback_cooldown_seconds: float = 60.0 # After a fallback, sentences skip the main backend this long
+    espeak_voice: str = "pt-br" # espeak-ng voice
+    espeak_speed: int = 175 # espeak-ng words per minute
     
     # LLM Configuration
     llm_host: str = "localhost"
@@ -26,6 +26,10 @@ class TranscriptionError(AudioError):
     """Raised when transcription fails."""
 
 
+class SpeechSynthesisError(AudioError):
+    """Raised when a text-to-speech backend fails to produce audio."""
+
+
 class ToolError(StuartBaseException):
     """Base exception for tool related errors."""
 
@@ -1,3 +1,6 @@
+import asyncio
+import collections
+import time
 from enum import Enum
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -10,15 +13,58 @@ class AssistantStatus(Enum):
     SPEAKING = "speaking"
 
 
+@dataclass
+class StageTiming:
+    count: int = 0
+    total_seconds: float = 0.0
+    last_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    def record(self, seconds: float):
+        self.count += 1
+        self.total_seconds += seconds
+        self.last_seconds = seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+    def as_dict(self) -> dict:
+        average = self.total_seconds / self.count if self.count else 0.0
+        return {
+            "count": self.count,
+            "avg_ms": round(average * 1000, 1),
+            "last_ms": round(self.last_seconds * 1000, 1),
+            "max_ms": round(self.max_seconds * 1000, 1),
+        }
+
+
 @dataclass
 class AssistantContext:
+    session: str = "default"
     status: AssistantStatus = AssistantStatus.IDLE
     last_command: str | None = None
     last_response: str | None = None
     command_count: int = 0
     session_start: datetime = field(default_factory=datetime.now)
+    # Voice pipeline instrumentation
+    queues: dict[str, asyncio.Queue] = field(default_factory=dict)
+    stage_timings: dict[str, StageTiming] = field(default_factory=dict)
+    dropped_utterances: int = 0
+    early_dispatches: int = 0
+    cascade_fast: int = 0
+    cascade_escalated: int = 0
+    noise_estimate: dict = field(default_factory=dict)
+    # Monotonic (start, end) of recent SPEAKING periods, for the half-duplex gate
+    speaking_intervals: collections.deque = field(default_factory=lambda: collections.deque(maxlen=8))
+    speaking_since: float | None = None
+    echo_suppressed: int = 0
+    interruptions: int = 0
+    tts_fallbacks: int = 0
 
     def set_status(self, status: AssistantStatus):
+        if status is AssistantStatus.SPEAKING and self.status is not AssistantStatus.SPEAKING:
+            self.speaking_since = time.monotonic()
+        elif status is not AssistantStatus.SPEAKING and self.speaking_since is not None:
+            self.speaking_intervals.append((self.speaking_since, time.monotonic()))
+            self.speaking_since = None
         self.status = status
 
     def record_command(self, command: str):
@@ -30,3 +76,45 @@ class AssistantContext:
 
     def uptime_seconds(self) -> int:
         return int((datetime.now() - self.session_start).total_seconds())
+
+    def record_stage_timing(self, stage: str, seconds: float):
+        self.stage_timings.setdefault(stage, StageTiming()).record(seconds)
+
+    def record_dropped_utterance(self):
+        self.dropped_utterances += 1
+
+    def record_early_dispatch(self):
+        self.early_dispatches += 1
+
+    def record_echo_suppressed(self):
+        self.echo_suppressed += 1
+
+    def record_interruption(self):
+        self.interruptions += 1
+
+    def record_tts_fallback(self):
+        self.tts_fallbacks += 1
+
+    def record_cascade(self, escalated: bool):
+        if escalated:
+            self.cascade_escalated += 1
+        else:
+            self.cascade_fast += 1
+
+    def record_noise_estimate(self, estimate: dict):
+        self.noise_estimate = estimate
+
+    def queue_depths(self) -> dict[str, int]:
+        return {name: queue.qsize() for name, queue in self.queues.items()}
+
+    def pipeline_stats(self) -> dict:
+        return {
+            "queue_depths": self.queue_depths(),
+            "stages": {stage: timing.as_dict() for stage, timing in self.stage_timings.items()},
+            "dropped_utterances": self.dropped_utterances,
+            "early_dispatches": self.early_dispatches,
+            "echo_suppressed": self.echo_suppressed,
+            "interruptions": self.interruptions,
+            "tts_fallbacks": self.tts_fallbacks,
+            "cascade": {"fast": self.cascade_fast, "escalated": self.cascade_escalated},
+        }
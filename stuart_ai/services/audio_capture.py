@@ -0,0 +1,333 @@
+import math
+import threading
+
+import speech_recognition as sr
+
+from stuart_ai.core.config import settings
+from stuart_ai.core.exceptions import AudioDeviceError
+from stuart_ai.core.logger import logger
+from stuart_ai.utils.audio_utils import ignore_stderr, pcm_rms, start_device_thread
+from stuart_ai.utils.vad import EnergyZcrVAD
+
+
+class AudioRingBuffer:
+    """
+    Fixed-size byte ring buffer fed by a single writer thread.
+
+    Positions are absolute byte offsets since the buffer was created, so readers
+    can keep their own cursor and detect when the writer has lapped them.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._buffer = bytearray(capacity)
+        self._written = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+    @property
+    def written(self) -> int:
+        """Absolute position of the next byte to be written."""
+        return self._written
+
+    @property
+    def oldest(self) -> int:
+        """Absolute position of the oldest byte still held in the buffer."""
+        return max(0, self._written - self.capacity)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def write(self, data: bytes):
+        if len(data) > self.capacity:
+            data = data[-self.capacity:]
+        with self._cond:
+            offset = self._written % self.capacity
+            first = min(len(data), self.capacity - offset)
+            self._buffer[offset:offset + first] = data[:first]
+            self._buffer[:len(data) - first] = data[first:]
+            self._written += len(data)
+            self._cond.notify_all()
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def read(self, start: int, size: int, timeout: float | None = None) -> bytes | None:
+        """
+        Returns ``size`` bytes starting at absolute position ``start``.
+
+        Blocks until the writer has produced them. Returns None if the buffer is
+        closed (or ``timeout`` expires) first. Raises ValueError if the range has
+        already been overwritten.
+        """
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._written >= start + size or self._closed, timeout):
+                return None
+            if self._written < start + size:
+                return None
+            if start < self.oldest:
+                raise ValueError("Requested audio has already been overwritten")
+            offset = start % self.capacity
+            first = min(size, self.capacity - offset)
+            return bytes(self._buffer[offset:offset + first]) + bytes(self._buffer[:size - first])
+
+
+# pylint: disable=broad-except
+class AudioCapture:
+    """
+    Long-lived microphone capture.
+
+    A dedicated thread keeps a single input stream open and writes every chunk
+    into an ``AudioRingBuffer``. Utterances are sliced out of that buffer with a
+    pre-roll, so the start of a phrase is never lost to device reopening.
+    Utterance boundaries come from an energy/zero-crossing VAD whose energy
+    threshold is the recognizer's (calibrated) ``energy_threshold``.
+
+    ``source_factory`` returns anything shaped like ``sr.Microphone`` (see
+    ``services/audio_sources.py`` for corpus replay). A ``lossless`` capture
+    makes the writer wait for ``listen`` instead of overwriting unread audio,
+    for sources that can produce audio faster than real time.
+    """
+
+    def __init__(self, recognizer: sr.Recognizer, source_factory=sr.Microphone,
+                 buffer_seconds: float | None = None, pre_roll_seconds: float | None = None,
+                 lossless: bool = False):
+        self.recognizer = recognizer
+        self.source_factory = source_factory
+        self.lossless = lossless
+        self.vad = EnergyZcrVAD()
+        self.buffer_seconds = buffer_seconds if buffer_seconds is not None else settings.capture_buffer_seconds
+        self.pre_roll_seconds = pre_roll_seconds if pre_roll_seconds is not None else settings.capture_pre_roll_seconds
+
+        self.sample_rate = 0
+        self.sample_width = 0
+        self.chunk = 0
+        self.ring: AudioRingBuffer | None = None
+
+        self._cursor = 0
+        self._discard_before = 0
+        self._phrase_start: int | None = None
+        self._thread: threading.Thread | None = None
+        self._stop_event = threading.Event()
+        self._ready = threading.Event()
+        self._error: AudioDeviceError | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def chunk_bytes(self) -> int:
+        return self.chunk * self.sample_width
+
+    @property
+    def seconds_per_chunk(self) -> float:
+        return self.chunk / self.sample_rate
+
+    def start(self):
+        """Opens the input stream on the capture thread. Blocks until it is ready."""
+        if self.running:
+            return
+        self._stop_event.clear()
+        self._ready.clear()
+        self._error = None
+        self._thread = start_device_thread(self._run, "audio-capture", self._ready, lambda: self._error)
+
+    def stop(self):
+        self._stop_event.set()
+        if self.ring:
+            self.ring.close()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=2)
+
+    def _run(self):
+        try:
+            with ignore_stderr():
+                source = self.source_factory()
+                source.__enter__()
+        except Exception as e:
+            self._error = AudioDeviceError(f"Could not access microphone: {e}")
+            self._ready.set()
+            return
+
+        try:
+            self.sample_rate = source.SAMPLE_RATE
+            self.sample_width = source.SAMPLE_WIDTH
+            self.chunk = source.CHUNK
+            capacity = int(self.buffer_seconds * self.sample_rate) * self.sample_width
+            self.ring = AudioRingBuffer(capacity - capacity % self.chunk_bytes)
+            self._cursor = 0
+            self._discard_before = 0
+            self._ready.set()
+
+            while not self._stop_event.is_set():
+                data = source.stream.read(self.chunk)
+                if not data:
+                    break
+                if self.lossless:
+                    while self._writer_must_wait(len(data)) and not self._stop_event.wait(0.005):
+                        pass
+                self.ring.write(data)
+        except Exception as e:
+            self._error = AudioDeviceError(f"Microphone stream failed: {e}")
+            logger.error("Audio capture stopped: %s", e)
+        finally:
+            if self.ring:
+                self.ring.close()
+            self._ready.set()
+            try:
+                source.__exit__(None, None, None)
+            except Exception:
+                pass
+
+    def _writer_must_wait(self, size: int) -> bool:
+        """Lossless mode: True while writing ``size`` bytes would overwrite audio ``listen`` still needs."""
+        cursor = max(self._cursor, self._discard_before)
+        needed_from = cursor if self._phrase_start is None else min(cursor, self._phrase_start)
+        # Never wait on a reader that has consumed everything: it could not make room
+        return self.ring.written + size - needed_from > self.ring.capacity and self.ring.written > cursor
+
+    def flush(self):
+        """
+        Discards everything captured so far; the next read starts at 'now'.
+
+        Safe to call while another thread is blocked in ``listen``: a phrase in
+        progress is cut at the flush point. A lossless capture is not tied to
+        the wall clock, so there is nothing stale to drop and flushing is a no-op.
+        """
+        if self.ring and not self.lossless:
+            self._discard_before = self.ring.written
+
+    def _read_chunk(self) -> bytes:
+        ring = self.ring
+        if ring is None:
+            raise AudioDeviceError("Audio capture is not running")
+        if self._cursor < self._discard_before:
+            self._cursor = self._discard_before
+        if self._cursor < ring.oldest:
+            lost = (ring.oldest - self._cursor) / (self.sample_rate * self.sample_width)
+            logger.warning("Audio capture consumer fell behind, dropping %.1fs of audio", lost)
+            self._cursor = ring.oldest
+        try:
+            data = ring.read(self._cursor, self.chunk_bytes)
+        except ValueError:
+            # Lapped by the writer between the check and the read
+            self._cursor = ring.oldest
+            return self._read_chunk()
+        if data is None:
+            raise self._error or AudioDeviceError("Audio capture stopped")
+        self._cursor += self.chunk_bytes
+        return data
+
+    def calibrate(self, duration: float = 1):
+        """
+        Equivalent of ``Recognizer.adjust_for_ambient_noise`` on fresh audio
+        from the running stream.
+        """
+        self.flush()
+        elapsed = 0.0
+        while True:
+            elapsed += self.seconds_per_chunk
+            if elapsed > duration:
+                break
+            self._adjust_threshold(pcm_rms(self._read_chunk(), self.sample_width))
+
+    def _adjust_threshold(self, energy: float):
+        # Same asymmetric weighted average as speech_recognition
+        damping = self.recognizer.dynamic_energy_adjustment_damping ** self.seconds_per_chunk
+        target_energy = energy * self.recognizer.dynamic_energy_ratio
+        self.recognizer.energy_threshold = self.recognizer.energy_threshold * damping + target_energy * (1 - damping)
+
+    def _report_partial(self, on_partial, start: int):
+        """Hands the phrase recorded so far to ``on_partial`` without moving the read cursor."""
+        begin = max(start, self.ring.oldest, self._discard_before)
+        if self._cursor <= begin:
+            return
+        try:
+            frame_data = self.ring.read(begin, self._cursor - begin, timeout=0)
+        except ValueError:
+            return
+        if frame_data:
+            on_partial(start, sr.AudioData(frame_data, self.sample_rate, self.sample_width))
+
+    def listen(self, timeout: float | None = None, phrase_time_limit: float | None = None,
+               on_partial=None, partial_interval: float | None = None) -> sr.AudioData:
+        """
+        Returns the next phrase from the stream as ``sr.AudioData``.
+
+        Endpointing is driven by the energy/zero-crossing VAD: the phrase starts
+        at the first speech frame (prefixed with ``pre_roll_seconds`` of audio),
+        ends once ``vad_silence_seconds`` pass without speech (or at
+        ``phrase_time_limit``), and keeps only ``vad_padding_seconds`` of
+        trailing silence. Bursts with less than ``vad_min_speech_seconds`` of
+        speech are dropped and never returned. Raises ``sr.WaitTimeoutError``
+        after ``timeout`` seconds of audio without a phrase.
+
+        With ``on_partial``, the phrase recorded so far is also reported every
+        ``partial_interval`` seconds while the speaker is still talking, as
+        ``on_partial(phrase_start, audio)``; ``phrase_start`` identifies the
+        phrase. The callback runs on the calling thread and must not block.
+        """
+        recognizer = self.recognizer
+        seconds_per_chunk = self.seconds_per_chunk
+        silence_chunks = math.ceil(settings.vad_silence_seconds / seconds_per_chunk)
+        min_speech_chunks = math.ceil(settings.vad_min_speech_seconds / seconds_per_chunk)
+        padding_chunks = math.ceil(settings.vad_padding_seconds / seconds_per_chunk)
+        pre_roll_bytes = math.ceil(self.pre_roll_seconds / seconds_per_chunk) * self.chunk_bytes
+        partial_chunks = max(1, math.ceil((partial_interval or 0) / seconds_per_chunk))
+
+        elapsed = 0.0
+        while True:
+            self._phrase_start = None
+            # Wait for the phrase to start
+            while True:
+                chunk = self._read_chunk()
+                elapsed += seconds_per_chunk
+                if timeout and elapsed > timeout:
+                    raise sr.WaitTimeoutError("listening timed out while waiting for phrase to start")
+                if self.vad.is_speech(chunk, self.sample_width, recognizer.energy_threshold):
+                    break
+                if recognizer.dynamic_energy_threshold:
+                    self._adjust_threshold(pcm_rms(chunk, self.sample_width))
+
+            start = max(self._cursor - self.chunk_bytes - pre_roll_bytes, self.ring.oldest)
+            self._phrase_start = start
+
+            # Record until the speaker has been silent long enough (or the phrase time limit)
+            phrase_count = 1
+            speech_count = 1
+            pause_count = 0
+            while True:
+                if phrase_time_limit and phrase_count * seconds_per_chunk > phrase_time_limit:
+                    break
+                chunk = self._read_chunk()
+                elapsed += seconds_per_chunk
+                phrase_count += 1
+                if self.vad.is_speech(chunk, self.sample_width, recognizer.energy_threshold):
+                    speech_count += 1
+                    pause_count = 0
+                else:
+                    pause_count += 1
+                if pause_count > silence_chunks:
+                    break
+                if on_partial is not None and pause_count == 0 and phrase_count % partial_chunks == 0:
+                    self._report_partial(on_partial, start)
+
+            end = self._cursor - max(0, pause_count - padding_chunks) * self.chunk_bytes
+            start = max(start, self.ring.oldest, self._discard_before)
+            if end <= start:
+                # Flushed while recording
+                continue
+            if speech_count >= min_speech_chunks:
+                break
+            # A click or a cough: drop it and go back to waiting
+            logger.debug("Dropped %.2fs noise burst without enough speech", phrase_count * seconds_per_chunk)
+
+        frame_data = self.ring.read(start, end - start, timeout=0)
+        self._phrase_start = None
+        if frame_data is None:
+            raise self._error or AudioDeviceError("Audio capture stopped")
+        return sr.AudioData(frame_data, self.sample_rate, self.sample_width)
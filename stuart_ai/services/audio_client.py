@@ -0,0 +1,89 @@
+import asyncio
+import subprocess
+
+import aiohttp
+import speech_recognition as sr
+
+from stuart_ai.core.logger import logger
+from stuart_ai.utils.audio_utils import ignore_stderr
+
+
+async def play_mp3(audio: bytes):
+    """Plays one reply through ``mpg123`` reading from stdin; returns once playback ends."""
+    proc = await asyncio.create_subprocess_exec(
+        "mpg123", "-q", "-",
+        stdin=subprocess.PIPE,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    await proc.communicate(audio)
+
+
+class AudioClient:
+    """
+    Thin network client: streams the local microphone to a Stuart server and plays its replies.
+
+    Runs no models. Speaks the ``/ws/audio`` protocol (see
+    ``services/network_audio.py``): a hello with the server's ``token`` and the capture format, raw PCM
+    chunks as binary frames, and a ``played`` event after each reply has been
+    played, so the server knows when it stopped speaking.
+
+    ``source_factory`` returns anything shaped like ``sr.Microphone``;
+    ``player`` is an async callable taking one encoded reply.
+    """
+
+    def __init__(self, url: str, session: str | None = None, source_factory=sr.Microphone, player=play_mp3,
+                 token: str = ""):
+        self.url = url
+        self.session = session
+        self.token = token
+        self.source_factory = source_factory
+        self.player = player
+
+    async def run(self):
+        """Streams until the server closes the connection (or the task is cancelled)."""
+        source = self.source_factory()
+        with ignore_stderr():
+            source.__enter__()
+        try:
+            async with aiohttp.ClientSession() as http, http.ws_connect(self.url) as ws:
+                await ws.send_json({
+                    "type": "hello",
+                    "token": self.token,
+                    "session": self.session,
+                    "sample_rate": source.SAMPLE_RATE,
+                    "sample_width": source.SAMPLE_WIDTH,
+                })
+                ready = await ws.receive()
+                if ready.type != aiohttp.WSMsgType.TEXT:
+                    logger.error("Server at %s refused the session: %s", self.url, ws.close_code or ready.extra)
+                    return
+                logger.info("Connected to %s as session '%s'", self.url, ready.json().get("session"))
+
+                streaming = asyncio.create_task(self._stream(ws, source))
+                try:
+                    await self._receive(ws)
+                finally:
+                    streaming.cancel()
+                    await asyncio.gather(streaming, return_exceptions=True)
+        finally:
+            source.__exit__(None, None, None)
+
+    @staticmethod
+    async def _stream(ws, source):
+        while not ws.closed:
+            data = await asyncio.to_thread(source.stream.read, source.CHUNK)
+            if not data:
+                break
+            await ws.send_bytes(data)
+
+    async def _receive(self, ws):
+        async for message in ws:
+            if message.type == aiohttp.WSMsgType.BINARY:
+                try:
+                    await self.player(message.data)
+                finally:
+                    await ws.send_json({"type": "played"})
+            elif message.type == aiohttp.WSMsgType.ERROR:
+                logger.error("Connection to %s failed: %s", self.url, ws.exception())
+                break
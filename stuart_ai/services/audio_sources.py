@@ -0,0 +1,195 @@
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+
+import numpy as np
+import speech_recognition as sr
+
+from stuart_ai.core.config import settings
+from stuart_ai.core.logger import logger
+from stuart_ai.services.audio_capture import AudioCapture
+from stuart_ai.utils.audio_corpus import (
+    corpus_entries, next_entry, read_sidecar, read_wav, write_pcm_wav, write_sidecar,
+)
+from stuart_ai.utils.audio_utils import WHISPER_SAMPLE_RATE
+
+
+@dataclass
+class ReplayedUtterance:
+    """One corpus entry as it went through the replay stream (monotonic timestamps)."""
+    name: str
+    meta: dict = field(default_factory=dict)
+    started_at: float | None = None
+    ended_at: float | None = None
+
+
+class ReplaySource:
+    """
+    Plays a corpus directory as if it were a microphone.
+
+    Shaped like ``sr.Microphone`` (``SAMPLE_RATE``, ``SAMPLE_WIDTH``, ``CHUNK``,
+    ``stream.read``, context manager), so it plugs into ``AudioCapture`` as a
+    ``source_factory``. Entries are separated by ``gap_seconds`` of silence so
+    the VAD ends each phrase. ``speed`` paces the stream (1.0 = real time);
+    ``None`` delivers it as fast as the reader takes it, which needs a
+    lossless capture. Once the corpus is exhausted ``finished`` is set and the
+    stream keeps producing real-time silence, like an idle microphone.
+    ``timeline`` records when each entry started and ended in the stream.
+    """
+
+    SAMPLE_RATE = WHISPER_SAMPLE_RATE
+    SAMPLE_WIDTH = 2
+    CHUNK = 1024
+
+    def __init__(self, corpus_dir: str, speed: float | None = 1.0, gap_seconds: float = 1.0):
+        self.corpus_dir = corpus_dir
+        self.speed = speed
+        self.gap_bytes = int(gap_seconds * self.SAMPLE_RATE) * self.SAMPLE_WIDTH
+        self.timeline: list[ReplayedUtterance] = []
+        self.finished = threading.Event()
+        self.stream = None
+
+        self._entries = corpus_entries(corpus_dir)
+        self._pending = bytearray()
+        # [start, end, utterance] byte offsets into _pending of entries not fully delivered yet
+        self._marks: list[list] = []
+        self._delivered = 0
+        self._started_at = 0.0
+
+    def __enter__(self):
+        if not self._entries:
+            raise OSError(f"No WAV files in replay corpus {self.corpus_dir}")
+        self.stream = self
+        self._started_at = time.monotonic()
+        return self
+
+    def __exit__(self, *exc):
+        self.stream = None
+        return False
+
+    def _load_next(self) -> bool:
+        """Queues the next entry (preceded by silence). False once the corpus is exhausted."""
+        if not self._entries:
+            return False
+        base = self._entries.pop(0)
+        pcm = (np.clip(read_wav(base + ".wav"), -1.0, 1.0) * 32767).astype("<i2").tobytes()
+        self._pending += bytes(self.gap_bytes)
+        utterance = ReplayedUtterance(os.path.basename(base), read_sidecar(base))
+        self.timeline.append(utterance)
+        self._marks.append([len(self._pending), len(self._pending) + len(pcm), utterance])
+        self._pending += pcm
+        return True
+
+    def _pace(self, size: int):
+        speed = self.speed if not self.finished.is_set() else 1.0
+        if not speed:
+            return
+        due = self._started_at + self._delivered / (self.SAMPLE_RATE * self.SAMPLE_WIDTH) / speed
+        delay = due - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        self._delivered += size
+
+    def read(self, size: int) -> bytes:
+        size *= self.SAMPLE_WIDTH
+        while len(self._pending) < size and not self.finished.is_set():
+            if not self._load_next():
+                # Trailing silence lets the last phrase end, then the stream idles
+                self._pending += bytes(self.gap_bytes)
+                self.finished.set()
+                self._delivered = 0
+                self._started_at = time.monotonic()
+        if len(self._pending) < size:
+            self._pending += bytes(size - len(self._pending))
+
+        self._pace(size)
+        data = bytes(self._pending[:size])
+        self._advance(size)
+        return data
+
+    def _advance(self, size: int):
+        now = time.monotonic()
+        del self._pending[:size]
+        for mark in self._marks:
+            start, end, utterance = mark
+            if utterance.started_at is None and start < size:
+                utterance.started_at = now
+            if end <= size:
+                utterance.ended_at = now
+            mark[0], mark[1] = start - size, end - size
+        self._marks = [mark for mark in self._marks if mark[1] > 0]
+
+
+class UtteranceRecorder:
+    """
+    Capture mode: saves every phrase the assistant hears into a corpus directory.
+
+    Each phrase becomes ``NNNN.wav`` (native rate and width) plus a sidecar
+    with its timing; ``annotate`` adds what the later stages made of it. The
+    entries have no ``wake`` label until someone adds one by hand, so the
+    benchmarks skip them until then.
+    """
+
+    def __init__(self, corpus_dir: str):
+        self.corpus_dir = corpus_dir
+        os.makedirs(corpus_dir, mode=0o700, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def record(self, audio: sr.AudioData, **meta) -> str:
+        """Writes the phrase and returns its base path. Blocking."""
+        with self._lock:
+            base = next_entry(self.corpus_dir)
+            write_pcm_wav(base + ".wav", audio.frame_data, audio.sample_rate, audio.sample_width)
+        duration = len(audio.frame_data) / (audio.sample_rate * audio.sample_width)
+        write_sidecar(base, {
+            "recorded_at": datetime.now().isoformat(timespec="milliseconds"),
+            "duration": round(duration, 3),
+            **meta,
+        })
+        return base
+
+    def annotate(self, base: str, **meta):
+        """Merges ``meta`` into an entry's sidecar. Blocking."""
+        with self._lock:
+            write_sidecar(base, {**read_sidecar(base), **meta})
+
+
+def capture_for_source(recognizer: sr.Recognizer, source: str) -> AudioCapture:
+    """
+    Builds the capture for one session's source spec.
+
+    ``mic`` is the default microphone, ``mic:<index>`` a PyAudio device and
+    ``replay:<dir>`` a corpus played at ``audio_replay_speed`` (file-backed,
+    for load tests without microphones).
+    """
+    kind, _, argument = source.partition(":")
+    if kind == "replay" and argument:
+        speed = settings.audio_replay_speed or None
+        return AudioCapture(recognizer, source_factory=lambda: ReplaySource(argument, speed=speed),
+                            lossless=speed is None)
+    if kind == "mic" and argument:
+        device_index = int(argument)
+        return AudioCapture(recognizer, source_factory=lambda: sr.Microphone(device_index=device_index))
+    if kind != "mic":
+        raise ValueError(f"Unknown audio source '{source}' (expected mic, mic:<index> or replay:<dir>)")
+    return AudioCapture(recognizer)
+
+
+def build_audio_capture(recognizer: sr.Recognizer) -> tuple[AudioCapture, UtteranceRecorder | None]:
+    """Builds the capture for ``settings.audio_source``: live (default), capture or replay."""
+    mode = settings.audio_source
+    corpus_dir = settings.audio_corpus_dir
+    if mode == "replay":
+        speed = settings.audio_replay_speed or None
+        logger.info("Replaying audio corpus %s (%s)", corpus_dir, f"{speed}x" if speed else "as fast as possible")
+        capture = AudioCapture(recognizer, source_factory=lambda: ReplaySource(corpus_dir, speed=speed),
+                               lossless=speed is None)
+        return capture, None
+    if mode == "capture":
+        logger.info("Recording every captured utterance into %s", corpus_dir)
+        return AudioCapture(recognizer), UtteranceRecorder(corpus_dir)
+    if mode != "live":
+        logger.warning("Unknown AUDIO_SOURCE '%s', using the microphone", mode)
+    return AudioCapture(recognizer), None
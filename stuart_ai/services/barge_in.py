@@ -0,0 +1,85 @@
+from enum import Enum
+
+import numpy as np
+
+from stuart_ai.core.config import settings
+from stuart_ai.services.wake_word import WakeWordMatcher, strip_accents
+from stuart_ai.utils.audio_utils import WHISPER_SAMPLE_RATE, greedy_transcribe
+
+# Longest stop request: "stuart, pode parar" after the wake word is removed
+_MAX_STOP_WORDS = 3
+# Share of the decoded words found in the reply being spoken above which it is the reply itself
+_ECHO_WORD_SHARE = 0.6
+
+
+def _words(text: str) -> list[str]:
+    return [w for w in WakeWordMatcher.candidates(strip_accents(text.lower())) if " " not in w]
+
+
+class BargeInKind(Enum):
+    STOP = "stop"  # Only stop talking
+    COMMAND = "command"  # The wake word: a new command follows
+
+
+class BargeInDetector:
+    """
+    Spots the user cutting in while the assistant is speaking.
+
+    Only the latest ``window_seconds`` of what the microphone hears is
+    decoded, greedily and biased towards the keyword and the stop words, so a
+    check costs about as much as a confirmation decode. A short utterance with
+    a stop word ("pare", "Stuart, chega") is a STOP; anything else addressing
+    the assistant is a COMMAND. The assistant's own sentences are long, which
+    keeps a stop word inside them from counting; a reply that says the name
+    itself would still wake it, so a COMMAND whose words come from the reply
+    being spoken is ignored.
+    """
+
+    _MAX_NEW_TOKENS = 12
+    # Most of what is heard here is the assistant's own voice: a looser match
+    # ("tarde" scores 80 against "stuart") would make it interrupt itself
+    _MIN_WAKE_SCORE = 90
+
+    def __init__(self, model, wake_matcher: WakeWordMatcher, stop_words: list[str] | None = None,
+                 window_seconds: float | None = None):
+        self.model = model
+        self.wake_matcher = wake_matcher
+        stop_words = stop_words if stop_words is not None else settings.barge_in_stop_words
+        self.stop_words = {strip_accents(word.lower()) for word in stop_words}
+        self.window_seconds = window_seconds or settings.barge_in_window_seconds
+        keyword = wake_matcher.keywords[0].capitalize()
+        self._prompt = " ".join(f"{keyword}, {word}." for word in stop_words)
+
+    def decode(self, samples: np.ndarray) -> str:
+        """Greedy decode of the end of what was heard. Blocking."""
+        window = samples[-int(self.window_seconds * WHISPER_SAMPLE_RATE):]
+        return greedy_transcribe(self.model, window, self._prompt, self._MAX_NEW_TOKENS)
+
+    def classify(self, text: str, speaking: str | None = None) -> BargeInKind | None:
+        """
+        STOP, COMMAND, or None when the transcript is not meant for the assistant.
+
+        ``speaking`` is the reply playing while ``text`` was heard.
+        """
+        match = self.wake_matcher.match(text)
+        if match is not None and match.score < self._MIN_WAKE_SCORE:
+            match = None
+        words = [w for w in _words(text) if match is None or w not in match.word.split()]
+        if words and len(words) <= _MAX_STOP_WORDS and self.stop_words.intersection(words):
+            return BargeInKind.STOP
+        if match is not None and not (speaking and self._repeats(text, speaking)):
+            return BargeInKind.COMMAND
+        return None
+
+    def _repeats(self, text: str, speaking: str) -> bool:
+        """True when ``text`` is the reply being spoken, name included, heard through the speakers."""
+        if self.wake_matcher.match(speaking) is None:
+            return False
+        spoken = set(_words(speaking))
+        words = _words(text)
+        return sum(word in spoken for word in words) >= _ECHO_WORD_SHARE * len(words)
+
+    def detect(self, samples: np.ndarray, speaking: str | None = None) -> tuple[BargeInKind | None, str]:
+        """Decodes and classifies. Blocking."""
+        text = self.decode(samples)
+        return self.classify(text, speaking), text
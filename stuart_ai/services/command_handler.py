@@ -36,7 +36,8 @@ class CommandHandler:
                     semantic_router: SemanticRouter,
                     memory: ConversationMemory,
                     content_agent: ContentAgent | None = None,
-                    coding_agent: CodingAgent | None = None):
+                    coding_agent: CodingAgent | None = None,
+                    announce_func=None):
         self.speak = speak_func
         self.confirm = confirmation_func
         self.app_aliases = app_aliases
@@ -55,6 +56,7 @@ class CommandHandler:
             local_rag_agent=self.local_rag_agent,
             content_agent=self.content_agent,
             coding_agent=self.coding_agent,
+            announce_func=announce_func,
         )
 
         # Tools available
@@ -157,6 +159,28 @@ class CommandHandler:
             await self.speak("Desculpe, ocorreu um erro ao processar o comando de sistema.")
             return None, True
 
+    def _match_system_route(self, command_lower: str):
+        """Returns ``(actions, match)`` for the first system route matching the command, or None."""
+        for keywords_regex, *actions in self.system_routes:
+            match = re.search(keywords_regex, command_lower)
+            if match:
+                return actions, match
+        return None
+
+    def has_system_route(self, command: str) -> bool:
+        """True when the command would be handled by the regex fast path rather than the LLM router."""
+        return self._match_system_route(command.lower()) is not None
+
+    def is_instant_command(self, command: str) -> bool:
+        """
+        True when the command hits a system route that takes no argument.
+
+        Those commands are complete as soon as the route matches, so a stable
+        partial transcript is enough to dispatch them before the phrase ends.
+        """
+        route = self._match_system_route(command.lower())
+        return route is not None and len(route[0]) == 1
+
     async def process(self, command: str):
         """
         Processes the user command using Hybrid Routing (System Regex -> Semantic Router).
@@ -170,11 +194,9 @@ class CommandHandler:
         command_lower = command.lower()
 
         # 1. Fast Path: System Commands (Regex)
-        for keywords_regex, *actions in self.system_routes:
-            match = re.search(keywords_regex, command_lower)
-            if not match:
-                continue
-
+        route = self._match_system_route(command_lower)
+        if route:
+            actions, match = route
             result, errored = await self._execute_system_actions(actions, command, match)
             if errored:
                 return
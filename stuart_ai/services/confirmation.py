@@ -0,0 +1,71 @@
+from dataclasses import dataclass
+from enum import Enum
+
+import numpy as np
+from rapidfuzz import fuzz
+
+from stuart_ai.core.config import settings
+from stuart_ai.utils.audio_utils import WHISPER_SAMPLE_RATE, greedy_transcribe
+
+
+class ConfirmationAnswer(Enum):
+    YES = "yes"
+    NO = "no"
+    UNCLEAR = "unclear"
+
+
+@dataclass
+class ConfirmationResult:
+    answer: ConfirmationAnswer
+    confidence: float  # 0.0 - 1.0, fuzzy score of the word that decided the answer
+    text: str = ""
+
+
+class ConfirmationRecognizer:
+    """
+    Yes/no recognizer for confirmation-gated tools.
+
+    Whisper cannot be restricted to a grammar, so the vocabulary is enforced
+    on both ends: the decode is biased towards it (prompt + hotwords) and kept
+    tiny (greedy, a few tokens, first seconds of audio only), then every word is
+    fuzzy-matched against the yes/no lists. Anything outside the vocabulary,
+    or a reply mixing both, is UNCLEAR rather than a guess.
+    """
+
+    YES_WORDS = ("sim", "confirmo", "confirma", "pode", "claro", "positivo")
+    NO_WORDS = ("não", "nao", "cancela", "cancelar", "negativo")
+    _PROMPT = "Sim. Não. Confirmo. Cancela."
+    _HOTWORDS = "sim não confirmo cancela"
+    _MAX_NEW_TOKENS = 6
+
+    def __init__(self, model, window_seconds: float | None = None, min_score: int | None = None):
+        self.model = model
+        self.window_seconds = window_seconds or settings.confirmation_window_seconds
+        self.min_score = min_score if min_score is not None else settings.confirmation_confidence
+
+    def decode(self, samples: np.ndarray) -> str:
+        """Greedy decode of the start of the reply. Blocking."""
+        window = samples[:int(self.window_seconds * WHISPER_SAMPLE_RATE)]
+        return greedy_transcribe(self.model, window, self._PROMPT, self._MAX_NEW_TOKENS, hotwords=self._HOTWORDS)
+
+    @staticmethod
+    def _best_score(word: str, vocabulary: tuple[str, ...]) -> int:
+        return round(max(fuzz.ratio(word, candidate) for candidate in vocabulary))
+
+    def classify(self, text: str) -> ConfirmationResult:
+        """Maps a transcript onto YES / NO / UNCLEAR."""
+        words = "".join(c if c.isalnum() else " " for c in text.lower()).split()
+        yes = max((self._best_score(word, self.YES_WORDS) for word in words), default=0)
+        no = max((self._best_score(word, self.NO_WORDS) for word in words), default=0)
+
+        if yes >= self.min_score and no >= self.min_score:
+            return ConfirmationResult(ConfirmationAnswer.UNCLEAR, 0.0, text)
+        if yes >= self.min_score:
+            return ConfirmationResult(ConfirmationAnswer.YES, yes / 100, text)
+        if no >= self.min_score:
+            return ConfirmationResult(ConfirmationAnswer.NO, no / 100, text)
+        return ConfirmationResult(ConfirmationAnswer.UNCLEAR, max(yes, no) / 100, text)
+
+    def recognize(self, samples: np.ndarray) -> ConfirmationResult:
+        """Decodes and classifies a reply. Blocking."""
+        return self.classify(self.decode(samples))
@@ -0,0 +1,153 @@
+import collections
+import io
+import time
+
+import numpy as np
+import speech_recognition as sr
+from faster_whisper import decode_audio
+
+from stuart_ai.core.config import settings
+from stuart_ai.core.logger import logger
+from stuart_ai.utils.audio_utils import WHISPER_SAMPLE_RATE, audio_data_to_float32
+
+
+def correlation_peak(signal: np.ndarray, reference: np.ndarray) -> float:
+    """
+    Highest normalised cross-correlation of ``signal`` against any same-length stretch of ``reference``.
+
+    1.0 means the signal is a scaled copy of part of the reference; unrelated
+    audio stays near 0. Computed with one FFT product over all lags.
+    """
+    if signal.size == 0 or reference.size == 0:
+        return 0.0
+    if reference.size < signal.size:
+        reference = np.pad(reference, (0, signal.size - reference.size))
+
+    signal = signal.astype(np.float64)
+    reference = reference.astype(np.float64)
+    n = 1 << int(np.ceil(np.log2(reference.size + signal.size)))
+    lags = reference.size - signal.size + 1
+    corr = np.fft.irfft(np.fft.rfft(reference, n) * np.conj(np.fft.rfft(signal, n)), n)[:lags]
+
+    energy = np.concatenate(([0.0], np.cumsum(np.square(reference))))
+    window_energy = energy[signal.size:] - energy[:lags]
+    denominator = np.sqrt(np.maximum(window_energy, 0.0) * np.dot(signal, signal))
+    scores = np.divide(corr, denominator, out=np.zeros_like(corr), where=denominator > 1e-9)
+    return float(np.max(np.abs(scores)))
+
+
+def load_reference(audio: str | bytes) -> np.ndarray:
+    """
+    Decodes the audio being played (path or encoded bytes) into the 16 kHz
+    float32 buffer the echo filter compares against.
+    """
+    return decode_audio(io.BytesIO(audio) if isinstance(audio, bytes) else audio, sampling_rate=WHISPER_SAMPLE_RATE)
+
+
+class EchoSuppressor:
+    """
+    Keeps the assistant from transcribing its own voice.
+
+    Half-duplex gate: ``AssistantContext`` records when its status was
+    SPEAKING; audio captured during those intervals (plus ``tail_seconds`` of
+    room echo) is cut from the phrase, and the phrase is discarded when too
+    little is left after the cut.
+
+    Echo filter (optional): the TTS audio is kept as a reference while it
+    plays; a phrase whose normalised cross-correlation with the reference
+    reaches ``correlation_threshold`` is the assistant heard through the
+    speakers and is discarded, even when the half-duplex gate let it through.
+    """
+
+    _MAX_REFERENCES = 4
+
+    def __init__(self, context, half_duplex: bool | None = None, tail_seconds: float | None = None,
+                 filter_enabled: bool | None = None, correlation_threshold: float | None = None,
+                 max_delay_seconds: float | None = None):
+        self.context = context
+        self.half_duplex = settings.half_duplex_enabled if half_duplex is None else half_duplex
+        self.tail_seconds = tail_seconds if tail_seconds is not None else settings.echo_tail_seconds
+        self.filter_enabled = settings.echo_filter_enabled if filter_enabled is None else filter_enabled
+        self.correlation_threshold = (correlation_threshold if correlation_threshold is not None
+                                      else settings.echo_correlation_threshold)
+        self.max_delay_seconds = max_delay_seconds if max_delay_seconds is not None else settings.echo_max_delay_seconds
+        # (monotonic start of playback, 16 kHz samples)
+        self._references: collections.deque[tuple[float, np.ndarray]] = collections.deque(
+            maxlen=self._MAX_REFERENCES
+        )
+        # True when the last phrase ``process`` dropped was recognised as the TTS audio itself
+        self.matched_echo = False
+
+    def add_reference(self, samples: np.ndarray, started_at: float | None = None):
+        """Registers audio that starts playing now (or at ``started_at``)."""
+        self._references.append((started_at if started_at is not None else time.monotonic(), samples))
+
+    def release_from(self, heard_at: float):
+        """
+        Barge-in: the user started talking over the assistant at ``heard_at``.
+
+        Speaking intervals are cut short there (tail included), so the
+        half-duplex gate keeps the interrupting phrase instead of trimming it
+        up to the end of the interrupted speech.
+        """
+        cut = heard_at - self.tail_seconds
+        intervals = [(start, max(start, min(end, cut))) for start, end in self.context.speaking_intervals]
+        self.context.speaking_intervals.clear()
+        self.context.speaking_intervals.extend(intervals)
+
+    def _speech_end_within(self, start: float, end: float) -> float | None:
+        """End (tail included) of the last speaking interval overlapping ``[start, end]``, or None."""
+        intervals = list(self.context.speaking_intervals)
+        if self.context.speaking_since is not None:
+            intervals.append((self.context.speaking_since, time.monotonic()))
+        latest = None
+        for spoke_from, spoke_until in intervals:
+            spoke_until += self.tail_seconds
+            if spoke_from < end and spoke_until > start:
+                latest = spoke_until if latest is None else max(latest, spoke_until)
+        return latest
+
+    def is_echo(self, samples: np.ndarray, start: float) -> bool:
+        """True when the phrase correlates with TTS audio that was playing around ``start``."""
+        end = start + samples.size / WHISPER_SAMPLE_RATE
+        max_lag = int(self.max_delay_seconds * WHISPER_SAMPLE_RATE)
+        for started_at, reference in self._references:
+            if started_at > end or started_at + reference.size / WHISPER_SAMPLE_RATE + self.max_delay_seconds < start:
+                continue
+            offset = int((start - started_at) * WHISPER_SAMPLE_RATE)
+            lo = max(0, offset - max_lag)
+            hi = min(reference.size, max(lo, offset + samples.size + max_lag))
+            peak = correlation_peak(samples, reference[lo:hi])
+            if peak >= self.correlation_threshold:
+                logger.debug("Phrase matches the assistant's own speech (correlation %.2f)", peak)
+                return True
+        return False
+
+    def process(self, audio: sr.AudioData, captured_at: float, min_speech_seconds: float | None = None
+                ) -> sr.AudioData | None:
+        """
+        Returns the part of a captured phrase that is not the assistant speaking, or None. Blocking.
+
+        ``captured_at`` is the monotonic time the phrase ended.
+        """
+        min_speech_seconds = min_speech_seconds if min_speech_seconds is not None else settings.vad_min_speech_seconds
+        self.matched_echo = False
+        bytes_per_second = audio.sample_rate * audio.sample_width
+        start = captured_at - len(audio.frame_data) / bytes_per_second
+
+        if self.half_duplex:
+            speech_end = self._speech_end_within(start, captured_at)
+            if speech_end is not None:
+                keep = captured_at - speech_end
+                if keep < min_speech_seconds:
+                    logger.debug("Discarding a phrase heard while the assistant was speaking")
+                    return None
+                keep_bytes = int(keep * audio.sample_rate) * audio.sample_width
+                audio = sr.AudioData(audio.frame_data[-keep_bytes:], audio.sample_rate, audio.sample_width)
+                start = speech_end
+
+        if self.filter_enabled and self._references:
+            if self.is_echo(audio_data_to_float32(audio), start):
+                self.matched_echo = True
+                return None
+        return audio
@@ -0,0 +1,232 @@
+import asyncio
+import hmac
+import itertools
+import json
+import threading
+
+import speech_recognition as sr
+
+from stuart_ai.core.config import settings
+from stuart_ai.core.logger import logger
+from stuart_ai.services.audio_capture import AudioCapture
+
+# Sample formats a client may stream (16-bit PCM only: the VAD and Whisper conversions assume it)
+SUPPORTED_SAMPLE_RATES = (8000, 16000, 22050, 32000, 44100, 48000)
+SUPPORTED_SAMPLE_WIDTH = 2
+
+
+class NetworkAudioSource:
+    """
+    PCM frames received from a remote client, read as if they came from a microphone.
+
+    Shaped like ``sr.Microphone`` (``SAMPLE_RATE``, ``SAMPLE_WIDTH``, ``CHUNK``,
+    ``stream.read``, context manager), so it plugs into ``AudioCapture`` as a
+    ``source_factory``. The connection handler ``feed``s whatever arrives;
+    ``read`` blocks until a full chunk is there. After ``close`` the stream
+    ends: reads return what is left, then ``b""``, which stops the capture.
+
+    At most ``max_pending_seconds`` of unread audio is held; when the reader
+    falls behind, the oldest frames are dropped, as in the capture's ring buffer.
+    """
+
+    CHUNK = 1024
+
+    def __init__(self, sample_rate: int, sample_width: int = SUPPORTED_SAMPLE_WIDTH,
+                 max_pending_seconds: float = 5.0):
+        self.SAMPLE_RATE = sample_rate  # pylint: disable=invalid-name
+        self.SAMPLE_WIDTH = sample_width  # pylint: disable=invalid-name
+        self.stream = None
+        self.max_pending_bytes = int(max_pending_seconds * sample_rate) * sample_width
+        self._pending = bytearray()
+        self._closed = False
+        self._cond = threading.Condition()
+
+    def __enter__(self):
+        self.stream = self
+        return self
+
+    def __exit__(self, *exc):
+        self.stream = None
+        return False
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def feed(self, data: bytes):
+        with self._cond:
+            if not self._closed:
+                self._pending += data
+                overflow = len(self._pending) - self.max_pending_bytes
+                if overflow > 0:
+                    # Whole frames only, so the samples stay aligned
+                    overflow += -overflow % self.SAMPLE_WIDTH
+                    del self._pending[:overflow]
+                self._cond.notify_all()
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def read(self, size: int) -> bytes:
+        size *= self.SAMPLE_WIDTH
+        with self._cond:
+            self._cond.wait_for(lambda: len(self._pending) >= size or self._closed)
+            data = bytes(self._pending[:size])
+            del self._pending[:size]
+            return data
+
+
+class ProtocolError(ValueError):
+    """The client broke the audio session protocol."""
+
+
+class AuthenticationError(ProtocolError):
+    """The client's hello did not carry the shared secret."""
+
+
+def parse_hello(message: str, token: str | None = None) -> tuple[str | None, int, int]:
+    """
+    Validates a client's opening message. Returns (session name or None, sample rate, sample width).
+
+    ``token`` is the secret the hello must carry (``NETWORK_AUDIO_TOKEN``);
+    an empty one refuses every client, None skips the check.
+    """
+    try:
+        hello = json.loads(message)
+    except json.JSONDecodeError as e:
+        raise ProtocolError(f"Invalid hello message: {e}") from e
+    if not isinstance(hello, dict) or hello.get("type") != "hello":
+        raise ProtocolError("The first message must be {\"type\": \"hello\", ...}")
+    if token is not None:
+        if not token:
+            raise AuthenticationError("NETWORK_AUDIO_TOKEN is not set on the server")
+        sent = hello.get("token")
+        if not isinstance(sent, str) or not hmac.compare_digest(sent.encode(), token.encode()):
+            raise AuthenticationError("Missing or invalid token")
+    sample_rate = hello.get("sample_rate")
+    sample_width = hello.get("sample_width", SUPPORTED_SAMPLE_WIDTH)
+    if sample_rate not in SUPPORTED_SAMPLE_RATES:
+        raise ProtocolError(f"Unsupported sample rate {sample_rate!r}")
+    if sample_width != SUPPORTED_SAMPLE_WIDTH:
+        raise ProtocolError(f"Unsupported sample width {sample_width!r} (16-bit PCM only)")
+    session = hello.get("session")
+    return (str(session) if session else None), sample_rate, sample_width
+
+
+class AudioSession:
+    """
+    Server side of one remote client: a full ``Assistant`` fed by the client's microphone.
+
+    Protocol over a WebSocket (``websocket`` is Starlette-shaped: ``receive``,
+    ``send_json``, ``send_bytes``, ``close``):
+
+    - client → server, text:
+      ``{"type": "hello", "token": ..., "session": ..., "sample_rate": ..., "sample_width": 2}``
+    - server → client, text: ``{"type": "ready", "session": ...}``
+    - client → server, binary: raw little-endian PCM frames
+    - server → client, binary: one encoded (MP3) reply per ``speak``
+    - client → server, text: ``{"type": "played"}`` once that reply has finished playing
+
+    ``speak`` stays in SPEAKING until the client reports playback done (or
+    ``playback_timeout`` passes), so the half-duplex gate still cuts the reply
+    out of the client's microphone stream.
+
+    A hello without ``token`` (``NETWORK_AUDIO_TOKEN``) is refused: the
+    session's assistant can open programs, read files and shut the machine down.
+
+    ``assistant_factory(name, recognizer, capture, speech_output)`` builds the
+    session's ``Assistant``.
+    """
+
+    _anonymous = itertools.count(1)
+
+    def __init__(self, websocket, assistant_factory, playback_timeout: float | None = None,
+                 token: str | None = None):
+        self.websocket = websocket
+        self.assistant_factory = assistant_factory
+        self.token = token if token is not None else settings.network_audio_token
+        self.playback_timeout = (playback_timeout if playback_timeout is not None
+                                 else settings.network_playback_timeout_seconds)
+        self.name: str | None = None
+        self.source: NetworkAudioSource | None = None
+        self.assistant = None
+        self._played = asyncio.Event()
+        self._closing: asyncio.Future | None = None
+
+    async def open(self) -> bool:
+        """
+        Reads the hello, builds the session's ``Assistant`` and acknowledges.
+
+        Returns False if the client left before saying hello; raises ProtocolError on a bad hello
+        (AuthenticationError when its token is wrong).
+        """
+        message = await self.websocket.receive()
+        if message.get("type") == "websocket.disconnect":
+            return False
+        name, sample_rate, sample_width = parse_hello(message.get("text") or "", self.token)
+        self.name = name or f"remote-{next(self._anonymous)}"
+        self.source = NetworkAudioSource(sample_rate, sample_width)
+
+        recognizer = sr.Recognizer()
+        source = self.source
+        capture = AudioCapture(recognizer, source_factory=lambda: source)
+        self.assistant = self.assistant_factory(self.name, recognizer, capture, self.speech_output)
+        await self.websocket.send_json({"type": "ready", "session": self.name})
+        logger.info("Remote audio session '%s' connected (%d Hz)", self.name, sample_rate)
+        return True
+
+    async def speech_output(self, audio: bytes):
+        """Sends one reply to the client and waits until it has been played there."""
+        self._played.clear()
+        await self.websocket.send_bytes(audio)
+        try:
+            await asyncio.wait_for(self._played.wait(), timeout=self.playback_timeout)
+        except TimeoutError:
+            logger.warning("Session '%s' did not confirm playback within %.0fs", self.name, self.playback_timeout)
+
+    def _handle_event(self, text: str):
+        try:
+            event = json.loads(text)
+        except json.JSONDecodeError:
+            logger.warning("Session '%s' sent an invalid message, ignoring it", self.name)
+            return
+        if isinstance(event, dict) and event.get("type") == "played":
+            self._played.set()
+
+    def _assistant_stopped(self, task: asyncio.Task):
+        """Closes the connection once the session's assistant has stopped; ``run`` ends on the disconnect."""
+        error = task.exception() if not task.cancelled() else None
+        if error is not None:
+            logger.error("Assistant of session '%s' stopped: %s", self.name, error)
+            self._closing = asyncio.ensure_future(self.websocket.close(code=1011, reason="Assistant error"))
+        else:
+            self._closing = asyncio.ensure_future(self.websocket.close(code=1000))
+
+    async def run(self):
+        """
+        Runs the assistant on the client's audio until either side ends the session.
+
+        The client disconnecting stops the assistant; the assistant stopping
+        (QUIT, or a crash) closes the connection.
+        """
+        task = asyncio.create_task(self.assistant.listen_continuously())
+        task.add_done_callback(self._assistant_stopped)
+        try:
+            while True:
+                message = await self.websocket.receive()
+                if message.get("type") == "websocket.disconnect":
+                    break
+                if message.get("bytes"):
+                    self.source.feed(message["bytes"])
+                elif message.get("text"):
+                    self._handle_event(message["text"])
+        finally:
+            task.remove_done_callback(self._assistant_stopped)
+            self.source.close()
+            # Unblocks a reply still waiting for its playback confirmation
+            self._played.set()
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            logger.info("Remote audio session '%s' disconnected", self.name)
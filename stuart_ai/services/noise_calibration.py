@@ -0,0 +1,130 @@
+import collections
+import threading
+import time
+
+import numpy as np
+
+from stuart_ai.core.config import settings
+from stuart_ai.core.logger import logger
+from stuart_ai.utils.audio_utils import pcm_to_float32
+
+
+def frame_rms(frame_data: bytes, sample_width: int, frame_samples: int) -> np.ndarray:
+    """RMS energy (in raw sample units, like ``energy_threshold``) of every ``frame_samples``-long frame."""
+    # Keep the native rate: frames must line up with the capture chunks
+    samples = pcm_to_float32(frame_data, sample_width, 1, 1)
+    usable = samples.size - samples.size % frame_samples
+    frames = samples[:usable].reshape(-1, frame_samples)
+    full_scale = 1 << (8 * sample_width - 1)
+    return np.sqrt(np.mean(np.square(frames, dtype=np.float64), axis=1)) * full_scale
+
+
+# pylint: disable=broad-except
+class NoiseCalibrator:
+    """
+    Background noise-floor tracker for the persistent capture stream.
+
+    Reads the capture ring buffer with its own cursor (it never competes with
+    ``listen``) and keeps the RMS of every frame heard over the last
+    ``window_seconds``. Speech is sparse, so a low percentile of that window
+    tracks the room's idle level (minimum statistics) without needing to know
+    where phrases are. Every ``update_seconds`` the recognizer's
+    ``energy_threshold`` is set to ``ratio`` x that floor.
+    """
+
+    # Digital silence would otherwise pull the threshold to zero
+    _MIN_THRESHOLD = 50.0
+
+    def __init__(self, capture, window_seconds: float | None = None, update_seconds: float | None = None,
+                 percentile: float | None = None, ratio: float | None = None, on_update=None):
+        self.capture = capture
+        self.window_seconds = window_seconds or settings.noise_calibration_window_seconds
+        self.update_seconds = update_seconds or settings.noise_calibration_update_seconds
+        self.percentile = percentile if percentile is not None else settings.noise_calibration_percentile
+        self.ratio = ratio or settings.noise_calibration_ratio
+        self.on_update = on_update
+
+        self.noise_floor: float | None = None
+        self.updated_at: float | None = None
+        self._levels: collections.deque[float] = collections.deque()
+        self._thread: threading.Thread | None = None
+        self._stop_event = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="noise-calibration", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=2)
+
+    def estimate(self) -> dict:
+        """Current estimate, for the management API."""
+        return {
+            "noise_floor": round(self.noise_floor, 1) if self.noise_floor is not None else None,
+            "energy_threshold": round(self.capture.recognizer.energy_threshold, 1),
+            "window_frames": len(self._levels),
+            "updated_at": self.updated_at,
+        }
+
+    def feed(self, frame_data: bytes, sample_width: int, frame_samples: int, frames_per_window: int):
+        """Adds a block of audio to the rolling window."""
+        self._levels.extend(frame_rms(frame_data, sample_width, frame_samples).tolist())
+        while len(self._levels) > frames_per_window:
+            self._levels.popleft()
+
+    def update(self):
+        """Recomputes the noise floor and pushes the new threshold to the recognizer."""
+        if not self._levels:
+            return
+        self.noise_floor = float(np.percentile(np.fromiter(self._levels, dtype=np.float32), self.percentile))
+        threshold = max(self._MIN_THRESHOLD, self.noise_floor * self.ratio)
+        self.capture.recognizer.energy_threshold = threshold
+        self.updated_at = time.time()
+        logger.debug("Noise floor %.1f -> energy threshold %.1f", self.noise_floor, threshold)
+        if self.on_update:
+            self.on_update(self.estimate())
+
+    def _run(self):
+        ring = None
+        cursor = 0
+        while not self._stop_event.is_set():
+            try:
+                if self.capture.ring is not ring:
+                    # The stream was (re)opened: start from "now" on the new buffer
+                    ring = self.capture.ring
+                    if ring is None:
+                        self._stop_event.wait(self.update_seconds)
+                        continue
+                    cursor = ring.written
+                    self._levels.clear()
+
+                frame_samples = self.capture.chunk
+                block = int(self.update_seconds * self.capture.sample_rate) * self.capture.sample_width
+                block = max(self.capture.chunk_bytes, block - block % self.capture.chunk_bytes)
+                try:
+                    data = ring.read(cursor, block, timeout=self.update_seconds * 2)
+                except ValueError:
+                    # Fell behind the writer: resume at the oldest audio still buffered
+                    cursor = ring.oldest
+                    continue
+                if data is None:
+                    if ring.closed:
+                        self._stop_event.wait(self.update_seconds)
+                    continue
+                cursor += len(data)
+
+                frames_per_window = int(self.window_seconds / self.capture.seconds_per_chunk)
+                self.feed(data, self.capture.sample_width, frame_samples, frames_per_window)
+                self.update()
+            except Exception as e:
+                logger.error("Noise calibration failed: %s", e)
+                self._stop_event.wait(self.update_seconds)
@@ -0,0 +1,85 @@
+import asyncio
+import re
+
+from stuart_ai.core.config import settings
+
+# Whitespace after sentence punctuation, or a line break
+_SENTENCE_BREAK = re.compile(r"(?<=[.!?…;:])\s+|\s*\n+\s*")
+_END = object()
+
+
+def split_sentences(text: str, min_chars: int | None = None) -> list[str]:
+    """
+    Splits an answer into the sentences synthesized one by one.
+
+    Fragments shorter than ``min_chars`` are joined to the next one, so
+    abbreviations ("Dr. Silva") and one-word sentences do not become
+    separate requests of their own.
+    """
+    min_chars = min_chars if min_chars is not None else settings.tts_min_sentence_chars
+    sentences, current = [], ""
+    for part in _SENTENCE_BREAK.split(text.strip()):
+        if not part:
+            continue
+        current = f"{current} {part}" if current else part
+        if len(current) >= min_chars:
+            sentences.append(current)
+            current = ""
+    if current:
+        if sentences and len(current) < min_chars:
+            sentences[-1] = f"{sentences[-1]} {current}"
+        else:
+            sentences.append(current)
+    return sentences
+
+
+async def _drain(chunks: asyncio.Queue):
+    while True:
+        item = await chunks.get()
+        if item is _END:
+            return
+        if isinstance(item, Exception):
+            raise item
+        yield item
+
+
+# pylint: disable=broad-except
+class SpeechPipeline:
+    """
+    Synthesizes sentence N+1 while sentence N is playing.
+
+    ``synthesize(sentence)`` is an async iterator of encoded audio chunks. A
+    producer task synthesizes the sentences in order, at most ``lookahead``
+    ahead of the one playing; ``run`` hands each sentence's chunks to
+    ``play(index, chunks)`` as they arrive, so the first sentence starts
+    playing while it is still being synthesized. A synthesis error is raised
+    from the chunks of the sentence it hit.
+    """
+
+    def __init__(self, synthesize, lookahead: int | None = None):
+        self.synthesize = synthesize
+        self.lookahead = max(1, lookahead if lookahead is not None else settings.tts_lookahead_sentences)
+
+    async def run(self, sentences: list[str], play):
+        pending: asyncio.Queue[asyncio.Queue] = asyncio.Queue(maxsize=self.lookahead)
+
+        async def produce():
+            for sentence in sentences:
+                chunks = asyncio.Queue()
+                await pending.put(chunks)
+                try:
+                    async for data in self.synthesize(sentence):
+                        chunks.put_nowait(data)
+                except Exception as e:
+                    chunks.put_nowait(e)
+                    return
+                chunks.put_nowait(_END)
+
+        producer = asyncio.create_task(produce())
+        try:
+            for index in range(len(sentences)):
+                await play(index, _drain(await pending.get()))
+        finally:
+            # Cancelled or failed playback: stop synthesizing what will not be heard
+            producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
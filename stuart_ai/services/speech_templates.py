@@ -0,0 +1,174 @@
+import asyncio
+import re
+from dataclasses import dataclass
+from datetime import date
+
+import numpy as np
+
+from stuart_ai.core.config import settings
+from stuart_ai.core.logger import logger
+from stuart_ai.services.tts_playback import OUTPUT_SAMPLE_RATE, OUTPUT_SAMPLE_WIDTH, Mp3Decoder
+
+WEEKDAYS = ["segunda-feira", "terça-feira", "quarta-feira", "quinta-feira", "sexta-feira", "sábado", "domingo"]
+MONTHS = ["janeiro", "fevereiro", "março", "abril", "maio", "junho",
+          "julho", "agosto", "setembro", "outubro", "novembro", "dezembro"]
+
+_UNITS = ["zero", "um", "dois", "três", "quatro", "cinco", "seis", "sete", "oito", "nove",
+          "dez", "onze", "doze", "treze", "quatorze", "quinze", "dezesseis", "dezessete", "dezoito", "dezenove"]
+_TENS = ["", "", "vinte", "trinta", "quarenta", "cinquenta", "sessenta", "setenta", "oitenta", "noventa"]
+_HUNDREDS = ["", "cento", "duzentos", "trezentos", "quatrocentos", "quinhentos",
+             "seiscentos", "setecentos", "oitocentos", "novecentos"]
+_FEMININE = {"um": "uma", "dois": "duas"}
+
+# The replies of AssistantTools._get_time / _get_date
+_TIME = re.compile(r"^São (\d{1,2}):(\d{2})\.$")
+_DATE = re.compile(r"^Hoje é ([\w-]+), (\d{1,2}) de (\w+) de (\d{4})\.$")
+
+# Below this (int16) a decoded piece is leading/trailing silence
+_SILENCE = 300
+
+
+def number_words(n: int, feminine: bool = False) -> str:
+    """pt-BR numeral for 0-9999: 35 -> "trinta e cinco", 2026 -> "dois mil e vinte e seis"."""
+    if not 0 <= n <= 9999:
+        raise ValueError(f"{n} is out of range")
+    if n >= 1000:
+        thousands, rest = divmod(n, 1000)
+        word = "mil" if thousands == 1 else f"{number_words(thousands, feminine)} mil"
+        if rest:
+            # "dois mil e vinte", "dois mil e trezentos", but "dois mil trezentos e vinte"
+            word += (" e " if rest < 100 or rest % 100 == 0 else " ") + number_words(rest, feminine)
+        return word
+    if n >= 100:
+        if n == 100:
+            return "cem"
+        hundreds, rest = divmod(n, 100)
+        return _HUNDREDS[hundreds] + (f" e {number_words(rest, feminine)}" if rest else "")
+    if n >= 20:
+        tens, unit = divmod(n, 10)
+        return _TENS[tens] + (f" e {number_words(unit, feminine)}" if unit else "")
+    word = _UNITS[n]
+    return _FEMININE.get(word, word) if feminine else word
+
+
+def _hour_words(hour: int) -> str:
+    if hour == 0:
+        return "É meia-noite"
+    if hour == 1:
+        return "É uma hora"
+    return f"São {number_words(hour, feminine=True)} horas"
+
+
+def _minute_words(minute: int) -> str:
+    return "e um minuto." if minute == 1 else f"e {number_words(minute)} minutos."
+
+
+def _day_words(day: int) -> str:
+    return "primeiro" if day == 1 else number_words(day)
+
+
+def time_segments(hour: int, minute: int) -> list[str]:
+    """Pieces of "São 14:35.": ["São quatorze horas", "e trinta e cinco minutos."]."""
+    if minute == 0:
+        return [f"{_hour_words(hour)}."]
+    return [_hour_words(hour), _minute_words(minute)]
+
+
+def date_segments(weekday: str, day: int, month: str, year: int) -> list[str]:
+    """Pieces of "Hoje é sexta-feira, 16 de outubro de 2026."."""
+    return [f"Hoje é {weekday},", _day_words(day), f"de {month}", f"de {number_words(year)}."]
+
+
+def spoken_date(day: date) -> str:
+    """The date as ``_get_date`` says it: "Hoje é sexta-feira, 16 de outubro de 2026."."""
+    return f"Hoje é {WEEKDAYS[day.weekday()]}, {day.day} de {MONTHS[day.month - 1]} de {day.year}."
+
+
+@dataclass
+class RenderedSpeech:
+    pcm: bytes  # 16-bit mono at the player's sample rate
+    mp3: bytes  # The pieces' MP3 streams back to back, for network clients and the echo filter
+
+
+class SpeechTemplates:
+    """
+    Time and date replies assembled from pre-synthesized pieces.
+
+    "São 14:35." changes every minute, so the phrase cache never hits. Its
+    pieces do: ``prepare`` synthesizes once (through the TTS cache) every
+    hour, minute, weekday, day, month and the current years, decodes them and
+    keeps the PCM with the silence trimmed. ``render`` then joins the pieces
+    of a matching reply with ``gap_seconds`` pauses, with no synthesis at all.
+    A reply whose pieces are not ready yet returns None and is synthesized
+    as usual.
+    """
+
+    def __init__(self, synthesizer, sample_rate: int = OUTPUT_SAMPLE_RATE, gap_seconds: float | None = None):
+        self.synthesizer = synthesizer
+        self.sample_rate = sample_rate
+        gap = gap_seconds if gap_seconds is not None else settings.tts_template_gap_seconds
+        self._gap = bytes(int(gap * sample_rate) * OUTPUT_SAMPLE_WIDTH)
+        # Piece text -> (trimmed PCM, MP3)
+        self._pieces: dict[str, tuple[bytes, bytes]] = {}
+
+    @staticmethod
+    def segments(text: str) -> list[str] | None:
+        """The pieces a reply is made of, or None when no template matches it."""
+        text = text.strip()
+        if match := _TIME.match(text):
+            hour, minute = int(match.group(1)), int(match.group(2))
+            if hour < 24 and minute < 60:
+                return time_segments(hour, minute)
+        elif match := _DATE.match(text):
+            weekday, day, month, year = match.group(1), int(match.group(2)), match.group(3), int(match.group(4))
+            if weekday in WEEKDAYS and month in MONTHS and 1 <= day <= 31:
+                return date_segments(weekday, day, month, year)
+        return None
+
+    @staticmethod
+    def fixed_segments(years: list[int]) -> list[str]:
+        """Every piece a time or a date in ``years`` can need."""
+        pieces = [_hour_words(hour) + end for hour in range(24) for end in ("", ".")]
+        pieces += [_minute_words(minute) for minute in range(1, 60)]
+        pieces += [f"Hoje é {weekday}," for weekday in WEEKDAYS]
+        pieces += [_day_words(day) for day in range(1, 32)]
+        pieces += [f"de {month}" for month in MONTHS]
+        pieces += [f"de {number_words(year)}." for year in years]
+        return pieces
+
+    def _decode(self, mp3: bytes) -> bytes:
+        decoder = Mp3Decoder(self.sample_rate)
+        samples = np.frombuffer(decoder.decode(mp3) + decoder.flush(), dtype=np.int16)
+        voiced = np.flatnonzero(np.abs(samples) > _SILENCE)
+        if voiced.size == 0:
+            return b""
+        return samples[voiced[0]:voiced[-1] + 1].tobytes()
+
+    # pylint: disable=broad-except
+    async def prepare(self, years: list[int] | None = None, concurrency: int = 4) -> int:
+        """Synthesizes and decodes the pieces not loaded yet. Returns how many are ready."""
+        this_year = date.today().year
+        pieces = [p for p in self.fixed_segments(years or [this_year, this_year + 1]) if p not in self._pieces]
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def load(piece: str):
+            async with semaphore:
+                try:
+                    mp3 = await self.synthesizer.synthesize(piece)
+                    pcm = await asyncio.to_thread(self._decode, mp3)
+                except Exception as e:
+                    logger.warning("Could not prepare the speech piece '%s': %s", piece, e)
+                    return
+            if pcm:
+                self._pieces[piece] = (pcm, mp3)
+
+        await asyncio.gather(*(load(piece) for piece in pieces))
+        logger.info("Speech templates: %d piece(s) ready", len(self._pieces))
+        return len(self._pieces)
+
+    def render(self, text: str) -> RenderedSpeech | None:
+        segments = self.segments(text)
+        if segments is None or any(segment not in self._pieces for segment in segments):
+            return None
+        pieces = [self._pieces[segment] for segment in segments]
+        return RenderedSpeech(self._gap.join(pcm for pcm, _ in pieces), b"".join(mp3 for _, mp3 in pieces))
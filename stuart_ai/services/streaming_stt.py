@@ -0,0 +1,52 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from stuart_ai.core.config import settings
+from stuart_ai.utils.audio_utils import WHISPER_SAMPLE_RATE, greedy_transcribe
+
+
+def normalize_partial(text: str) -> str:
+    """Lower-cases and strips punctuation so successive partials can be compared."""
+    return " ".join("".join(c for c in text.lower() if c.isalnum() or c.isspace()).split())
+
+
+@dataclass
+class PhraseProgress:
+    """Streaming state of one phrase while it is still being spoken."""
+    phrase_id: int
+    last_text: str = ""
+    stable_count: int = 0
+    dispatched: bool = False
+    finalized: bool = False
+
+    def observe(self, text: str, stable_passes: int) -> bool:
+        """Records a partial transcript. Returns True once it has not changed for ``stable_passes`` decodes."""
+        normalized = normalize_partial(text)
+        if normalized and normalized == self.last_text:
+            self.stable_count += 1
+        else:
+            self.last_text = normalized
+            self.stable_count = 1
+        return self.stable_count >= stable_passes
+
+
+class PartialTranscriber:
+    """
+    Greedy decodes of a phrase that is still being recorded.
+
+    Every decode covers the whole phrase so far (each chunk overlaps the
+    previous one), capped to the last ``phrase_time_limit`` seconds. Decoding is
+    greedy and does not condition on earlier text, so a partial is cheap and
+    never drags a stale hypothesis into the next one.
+    """
+
+    def __init__(self, model, initial_prompt: str | None = None, max_seconds: float | None = None):
+        self.model = model
+        self.initial_prompt = initial_prompt
+        self.max_seconds = max_seconds or settings.phrase_time_limit
+
+    def decode(self, samples: np.ndarray) -> str:
+        """Transcribes the phrase recorded so far. Blocking."""
+        limit = int(self.max_seconds * WHISPER_SAMPLE_RATE)
+        return greedy_transcribe(self.model, samples[-limit:], self.initial_prompt)
@@ -0,0 +1,153 @@
+import bisect
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from stuart_ai.core.config import settings
+from stuart_ai.core.exceptions import TranscriptionError
+from stuart_ai.core.logger import logger
+from stuart_ai.utils.audio_utils import WHISPER_SAMPLE_RATE
+
+
+@dataclass
+class _Request:
+    audio: np.ndarray
+    options: dict
+    key: tuple
+    done: threading.Event = field(default_factory=threading.Event)
+    segments: list = field(default_factory=list)
+    error: Exception | None = None
+
+
+def _options_key(options: dict) -> tuple:
+    """Requests can share a decode only when every option matches."""
+    return tuple(sorted((name, repr(value)) for name, value in options.items()))
+
+
+# pylint: disable=broad-except
+class BatchedTranscriber:
+    """
+    One command model shared by several sessions, decoding concurrent utterances together.
+
+    ``transcribe`` has ``WhisperModel.transcribe``'s shape, so it drops in as
+    an ``Assistant``'s ``whisper_model``. Calls are queued; a single thread
+    collects up to ``max_batch`` requests with identical options (waiting at
+    most ``max_wait_seconds`` for company), lays their audio end to end and
+    decodes them in one ``BatchedInferencePipeline`` call with one clip per
+    utterance. Segments are handed back to each caller by timestamp.
+    """
+
+    def __init__(self, model=None, max_batch: int | None = None, max_wait_seconds: float | None = None,
+                 pipeline=None):
+        if pipeline is None:
+            from faster_whisper import BatchedInferencePipeline  # pylint: disable=import-outside-toplevel
+            pipeline = BatchedInferencePipeline(model)
+        self.pipeline = pipeline
+        self.max_batch = max(1, max_batch or settings.stt_batch_size)
+        self.max_wait_seconds = (max_wait_seconds if max_wait_seconds is not None
+                                 else settings.stt_batch_wait_ms / 1000)
+
+        self.batches = 0
+        self.utterances = 0
+        self._queue: queue.Queue[_Request | None] = queue.Queue()
+        self._pending: list[_Request] = []
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="stt-batcher", daemon=True)
+                self._thread.start()
+
+    def close(self):
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def stats(self) -> dict:
+        return {
+            "batches": self.batches,
+            "utterances": self.utterances,
+            "avg_batch": round(self.utterances / self.batches, 2) if self.batches else 0.0,
+        }
+
+    def transcribe(self, audio: np.ndarray, **options):
+        """Queues the utterance and blocks until its batch is decoded."""
+        request = _Request(np.asarray(audio, dtype=np.float32), options, _options_key(options))
+        if request.audio.size == 0:
+            return [], None
+        self.start()
+        self._queue.put(request)
+        request.done.wait()
+        if request.error is not None:
+            raise TranscriptionError(f"Batched transcription failed: {request.error}") from request.error
+        return request.segments, None
+
+    def _next_batch(self) -> list[_Request] | None:
+        if self._pending:
+            first = self._pending.pop(0)
+        else:
+            first = self._queue.get()
+            if first is None:
+                return None
+        batch = [first]
+
+        # Requests set aside earlier go first, then whatever arrives before the deadline
+        for request in [r for r in self._pending if r.key == first.key][:self.max_batch - 1]:
+            self._pending.remove(request)
+            batch.append(request)
+        deadline = time.monotonic() + self.max_wait_seconds
+        while len(batch) < self.max_batch:
+            try:
+                request = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                break
+            if request is None:
+                # Finish this batch, then stop
+                self._queue.put(None)
+                break
+            if request.key == first.key:
+                batch.append(request)
+            else:
+                self._pending.append(request)
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                break
+            try:
+                self._decode(batch)
+            except Exception as e:
+                logger.error("Batched transcription of %d utterance(s) failed: %s", len(batch), e)
+                for request in batch:
+                    request.error = e
+            finally:
+                for request in batch:
+                    request.done.set()
+
+    def _decode(self, batch: list[_Request]):
+        starts, clips, offset = [], [], 0
+        for request in batch:
+            starts.append(offset / WHISPER_SAMPLE_RATE)
+            clips.append({"start": offset / WHISPER_SAMPLE_RATE,
+                          "end": (offset + request.audio.size) / WHISPER_SAMPLE_RATE})
+            offset += request.audio.size
+        audio = np.concatenate([request.audio for request in batch])
+
+        options = {**batch[0].options, "vad_filter": False, "clip_timestamps": clips, "batch_size": len(batch)}
+        segments, _ = self.pipeline.transcribe(audio, **options)
+        for segment in segments:
+            # Timestamps are absolute in the joined audio: the midpoint tells whose clip it came from
+            index = bisect.bisect_right(starts, (segment.start + segment.end) / 2) - 1
+            batch[max(0, index)].segments.append(segment)
+
+        self.batches += 1
+        self.utterances += len(batch)
+        logger.debug("Decoded a batch of %d utterance(s)", len(batch))
@@ -0,0 +1,61 @@
+from dataclasses import dataclass
+
+from stuart_ai.core.config import settings
+
+
+@dataclass
+class Transcript:
+    """Decoded text plus the confidence statistics faster-whisper reports per segment (worst segment kept)."""
+    text: str
+    avg_logprob: float = 0.0
+    no_speech_prob: float = 0.0
+    compression_ratio: float = 0.0
+
+
+def summarize_segments(segments) -> Transcript:
+    """
+    Joins the segment texts and keeps the least confident value of each statistic.
+
+    A command is only as reliable as its worst segment: one garbled word in
+    the middle is enough to route it wrong.
+    """
+    texts = []
+    avg_logprob, no_speech_prob, compression_ratio = 0.0, 0.0, 0.0
+    for segment in segments:
+        texts.append(segment.text)
+        avg_logprob = min(avg_logprob, segment.avg_logprob)
+        no_speech_prob = max(no_speech_prob, segment.no_speech_prob)
+        compression_ratio = max(compression_ratio, segment.compression_ratio)
+    return Transcript(" ".join(texts), avg_logprob, no_speech_prob, compression_ratio)
+
+
+class TranscriptionCascade:
+    """
+    Two-pass command transcription: a fast model first, the configured one when in doubt.
+
+    ``doubt`` returns why a first-pass transcript should not be trusted — low
+    average log-probability, likely non-speech, or a repetitive decode (high
+    compression ratio, Whisper's hallucination signal) — or None when it can
+    be used as is. The caller adds its own checks (wake word, routing) on top.
+    """
+
+    def __init__(self, fast_model, min_avg_logprob: float | None = None,
+                 max_no_speech_prob: float | None = None, max_compression_ratio: float | None = None):
+        self.fast_model = fast_model
+        self.min_avg_logprob = (min_avg_logprob if min_avg_logprob is not None
+                                else settings.stt_cascade_min_avg_logprob)
+        self.max_no_speech_prob = (max_no_speech_prob if max_no_speech_prob is not None
+                                   else settings.stt_cascade_max_no_speech_prob)
+        self.max_compression_ratio = (max_compression_ratio if max_compression_ratio is not None
+                                      else settings.stt_cascade_max_compression_ratio)
+
+    def doubt(self, transcript: Transcript) -> str | None:
+        if not transcript.text.strip():
+            return "empty transcript"
+        if transcript.avg_logprob < self.min_avg_logprob:
+            return f"avg_logprob {transcript.avg_logprob:.2f}"
+        if transcript.no_speech_prob > self.max_no_speech_prob:
+            return f"no_speech_prob {transcript.no_speech_prob:.2f}"
+        if transcript.compression_ratio > self.max_compression_ratio:
+            return f"compression_ratio {transcript.compression_ratio:.2f}"
+        return None
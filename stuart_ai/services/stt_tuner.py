@@ -0,0 +1,114 @@
+import itertools
+import os
+import re
+import time
+from dataclasses import dataclass
+
+import numpy as np
+
+from stuart_ai.services.wake_word import WakeWordMatcher
+from stuart_ai.utils.audio_utils import WHISPER_SAMPLE_RATE
+
+MODEL_SIZES = ("tiny", "base", "small")
+COMPUTE_TYPES = ("int8", "int8_float32", "float32")
+BEAM_SIZES = (1, 3, 5)
+
+
+@dataclass(frozen=True)
+class TuningProfile:
+    """One point of the search space: everything that goes into ``WhisperModel`` and ``transcribe``."""
+    model_size: str
+    compute_type: str
+    cpu_threads: int
+    beam_size: int
+
+    def as_env(self) -> dict[str, str]:
+        return {
+            "WHISPER_MODEL_SIZE": self.model_size,
+            "WHISPER_COMPUTE_TYPE": self.compute_type,
+            "WHISPER_CPU_THREADS": str(self.cpu_threads),
+            "WHISPER_BEAM_SIZE": str(self.beam_size),
+        }
+
+
+@dataclass
+class ProfileResult:
+    profile: TuningProfile
+    rtf: float  # Decode wall time / audio time: below 1.0 keeps up with speech
+    keyword_accuracy: float  # Share of utterances whose wake/no-wake label the transcript reproduces
+
+
+def default_thread_counts(cpu_count: int | None = None) -> list[int]:
+    """A few thread counts up to the number of logical CPUs: 2, 4, half and all of them."""
+    cpu_count = cpu_count or os.cpu_count() or 1
+    return sorted({n for n in (2, 4, cpu_count // 2, cpu_count) if 1 <= n <= cpu_count} or {1})
+
+
+def candidate_profiles(model_sizes=MODEL_SIZES, compute_types=COMPUTE_TYPES,
+                       thread_counts=None, beam_sizes=BEAM_SIZES) -> list[TuningProfile]:
+    """Search space, grouped so profiles sharing a loaded model are adjacent and beams go up."""
+    thread_counts = thread_counts or default_thread_counts()
+    return [
+        TuningProfile(size, compute_type, threads, beam)
+        for size, compute_type, threads in itertools.product(model_sizes, compute_types, thread_counts)
+        for beam in sorted(beam_sizes)
+    ]
+
+
+def measure_profile(model, profile: TuningProfile, samples: list[np.ndarray], labels: list[bool],
+                    matcher: WakeWordMatcher, initial_prompt: str | None = None) -> ProfileResult:
+    """Decodes every sample with ``profile``'s beam size and scores speed and keyword accuracy. Blocking."""
+    audio_seconds = sum(s.size for s in samples) / WHISPER_SAMPLE_RATE
+    correct = 0
+    started = time.perf_counter()
+    for audio, wake in zip(samples, labels):
+        segments, _ = model.transcribe(
+            audio,
+            language="pt",
+            initial_prompt=initial_prompt,
+            beam_size=profile.beam_size,
+            condition_on_previous_text=False,
+        )
+        text = " ".join(segment.text for segment in segments)
+        correct += (matcher.match(text) is not None) == wake
+    elapsed = time.perf_counter() - started
+    return ProfileResult(profile, elapsed / max(audio_seconds, 1e-9), correct / max(1, len(samples)))
+
+
+def pick_best(results: list[ProfileResult], max_rtf: float = 0.5,
+              accuracy_tolerance: float = 0.0) -> ProfileResult | None:
+    """
+    Most accurate profile that keeps up with speech, fastest among near-ties.
+
+    Profiles slower than ``max_rtf`` are discarded; of the rest, the fastest
+    one within ``accuracy_tolerance`` of the best keyword accuracy wins. When
+    none is fast enough the fastest profile is returned: the most accurate one
+    is usually the slowest, and would fall further behind speech.
+    """
+    if not results:
+        return None
+    fast_enough = [r for r in results if r.rtf <= max_rtf]
+    if not fast_enough:
+        return min(results, key=lambda r: (r.rtf, -r.keyword_accuracy))
+    best_accuracy = max(r.keyword_accuracy for r in fast_enough)
+    contenders = [r for r in fast_enough if r.keyword_accuracy >= best_accuracy - accuracy_tolerance]
+    return min(contenders, key=lambda r: (r.rtf, -r.keyword_accuracy))
+
+
+def update_env_file(path: str, values: dict[str, str]):
+    """Sets ``KEY=value`` lines in a .env file, keeping every other line (and comments) as they were."""
+    lines = []
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+
+    pending = dict(values)
+    for i, line in enumerate(lines):
+        match = re.match(r"\s*([A-Za-z_][A-Za-z0-9_]*)\s*=", line)
+        if match and match.group(1).upper() in pending:
+            key = match.group(1).upper()
+            lines[i] = f"{key}={pending.pop(key)}"
+    lines.extend(f"{key}={value}" for key, value in pending.items())
+
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
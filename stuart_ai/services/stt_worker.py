@@ -0,0 +1,238 @@
+import multiprocessing as mp
+import queue
+import threading
+from multiprocessing import shared_memory
+from typing import NamedTuple
+
+import numpy as np
+
+from stuart_ai.core.config import settings
+from stuart_ai.core.exceptions import TranscriptionError
+from stuart_ai.core.logger import logger
+from stuart_ai.utils.audio_utils import WHISPER_SAMPLE_RATE
+
+_FLOAT32_BYTES = 4
+
+
+class WorkerSegment(NamedTuple):
+    """Picklable subset of ``faster_whisper.transcribe.Segment`` sent back by a worker."""
+    text: str
+    start: float
+    end: float
+    avg_logprob: float
+    no_speech_prob: float
+    compression_ratio: float
+
+
+def load_whisper_model(model_size: str, compute_type: str, cpu_threads: int):
+    """Default model factory, called inside the worker process."""
+    from faster_whisper import WhisperModel  # pylint: disable=import-outside-toplevel
+    return WhisperModel(model_size, device="cpu", compute_type=compute_type, cpu_threads=cpu_threads)
+
+
+# pylint: disable=broad-except
+def _worker_main(conn, model_factory, factory_args):
+    """Worker process loop: owns the model, reads PCM from shared memory, replies over the pipe."""
+    try:
+        model = model_factory(*factory_args)
+    except Exception as e:
+        conn.send(("error", f"Could not load model: {type(e).__name__}: {e}"))
+        return
+    conn.send(("ready", None))
+
+    shm = None
+    while True:
+        try:
+            message = conn.recv()
+        except EOFError:
+            break
+        if message[0] == "stop":
+            break
+
+        _, shm_name, n_samples, options = message
+        try:
+            if shm is None or shm.name != shm_name:
+                if shm is not None:
+                    shm.close()
+                shm = shared_memory.SharedMemory(name=shm_name, track=False)
+            audio = np.ndarray((n_samples,), dtype=np.float32, buffer=shm.buf)
+            segments, _ = model.transcribe(audio, **options)
+            result = [
+                WorkerSegment(
+                    segment.text,
+                    getattr(segment, "start", 0.0),
+                    getattr(segment, "end", 0.0),
+                    getattr(segment, "avg_logprob", 0.0),
+                    getattr(segment, "no_speech_prob", 0.0),
+                    getattr(segment, "compression_ratio", 0.0),
+                )
+                for segment in segments
+            ]
+            # Release every view on the shared buffer before it can be closed
+            del audio, segments
+            conn.send(("ok", result))
+        except Exception as e:
+            conn.send(("error", f"{type(e).__name__}: {e}"))
+
+    if shm is not None:
+        shm.close()
+
+
+class _Worker:
+    """Parent-side handle: one process, one pipe and one shared PCM buffer."""
+
+    def __init__(self, ctx, model_factory, factory_args, capacity_samples: int):
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(
+            target=_worker_main, args=(child_conn, model_factory, factory_args),
+            name="stt-worker", daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+        self.shm = shared_memory.SharedMemory(create=True, size=capacity_samples * _FLOAT32_BYTES)
+
+    def wait_ready(self):
+        kind, payload = self.conn.recv()
+        if kind != "ready":
+            raise TranscriptionError(payload)
+
+    def _ensure_capacity(self, n_samples: int):
+        if n_samples * _FLOAT32_BYTES <= self.shm.size:
+            return
+        # Grow with headroom; the worker re-attaches when it sees the new name
+        self._release_shm()
+        self.shm = shared_memory.SharedMemory(create=True, size=n_samples * 2 * _FLOAT32_BYTES)
+
+    def transcribe(self, samples: np.ndarray, options: dict) -> list[WorkerSegment]:
+        self._ensure_capacity(samples.size)
+        shared = np.ndarray((samples.size,), dtype=np.float32, buffer=self.shm.buf)
+        shared[:] = samples
+        del shared
+        self.conn.send(("transcribe", self.shm.name, samples.size, options))
+        kind, payload = self.conn.recv()
+        if kind != "ok":
+            raise TranscriptionError(f"STT worker failed: {payload}")
+        return payload
+
+    def _release_shm(self):
+        try:
+            self.shm.close()
+            self.shm.unlink()
+        except (OSError, BufferError):
+            pass
+
+    def close(self):
+        try:
+            self.conn.send(("stop",))
+        except (OSError, ValueError):
+            pass
+        self.process.join(timeout=2)
+        if self.process.is_alive():
+            self.process.kill()
+        self.conn.close()
+        self._release_shm()
+
+
+class WhisperWorkerPool:
+    """
+    Out-of-process Whisper: a small pool of worker processes, each owning a WhisperModel.
+
+    Audio is copied once into a per-worker ``multiprocessing.shared_memory``
+    buffer rather than pickled; only the sample count and decode options go
+    through the pipe, and segments come back as small tuples. ``transcribe``
+    matches ``WhisperModel.transcribe`` closely enough to be a drop-in for the
+    assistant and is thread-safe: concurrent calls run on different workers.
+
+    A worker that dies is replaced straight away; if its replacement cannot
+    be started either, the pool runs short and the next call tries again.
+    """
+
+    def __init__(self, model_size: str | None = None, compute_type: str | None = None,
+                 workers: int | None = None, cpu_threads: int | None = None,
+                 model_factory=load_whisper_model, factory_args: tuple | None = None):
+        self.workers = workers or settings.stt_workers or 1
+        if factory_args is None:
+            factory_args = (
+                model_size or settings.whisper_model_size,
+                compute_type or settings.whisper_compute_type,
+                cpu_threads if cpu_threads is not None else settings.stt_worker_cpu_threads,
+            )
+        self._model_factory = model_factory
+        self._factory_args = factory_args
+        self._ctx = mp.get_context("spawn")
+        # Room for the longest phrase the capture can produce
+        max_seconds = settings.phrase_time_limit + settings.capture_pre_roll_seconds + 1
+        self._capacity = int(max_seconds * WHISPER_SAMPLE_RATE)
+        self._idle: queue.Queue[_Worker] = queue.Queue()
+        self._all: list[_Worker] = []
+        self._lock = threading.Lock()
+
+    def _spawn(self) -> _Worker:
+        worker = _Worker(self._ctx, self._model_factory, self._factory_args, self._capacity)
+        try:
+            worker.wait_ready()
+        except (EOFError, TranscriptionError):
+            worker.close()
+            raise
+        self._all.append(worker)
+        return worker
+
+    def start(self):
+        """Spawns the missing workers and waits until every model is loaded. Blocking."""
+        with self._lock:
+            for _ in range(self.workers - len(self._all)):
+                try:
+                    worker = self._spawn()
+                except EOFError as e:
+                    raise TranscriptionError(f"STT worker exited while loading the model: {e}") from e
+                self._idle.put(worker)
+
+    def _top_up(self):
+        """Replaces workers lost earlier; without any worker left a failure is raised."""
+        with self._lock:
+            missing = len(self._all) < self.workers
+        if not missing:
+            return
+        try:
+            self.start()
+        except TranscriptionError as e:
+            with self._lock:
+                remaining = len(self._all)
+            if not remaining:
+                raise
+            logger.error("Could not restart an STT worker, running with %d: %s", remaining, e)
+
+    def transcribe(self, audio: np.ndarray, **options) -> tuple[list[WorkerSegment], None]:
+        self._top_up()
+        samples = np.ascontiguousarray(audio, dtype=np.float32)
+        worker = self._idle.get()
+        try:
+            return worker.transcribe(samples, options), None
+        except (EOFError, OSError) as e:
+            # The worker died (e.g. OOM): replace it so the pool stays at full size
+            logger.error("STT worker crashed, restarting it: %s", e)
+            self._discard(worker)
+            try:
+                self.start()
+            except TranscriptionError as spawn_error:
+                logger.error("Could not restart the STT worker, retrying on the next call: %s", spawn_error)
+            raise TranscriptionError(f"STT worker crashed: {e}") from e
+        finally:
+            # Only live pool members go back; a crashed worker was replaced above
+            if worker in self._all:
+                if worker.process.is_alive():
+                    self._idle.put(worker)
+                else:
+                    self._discard(worker)
+
+    def _discard(self, worker: _Worker):
+        with self._lock:
+            if worker in self._all:
+                self._all.remove(worker)
+        worker.close()
+
+    def close(self):
+        for worker in self._all:
+            worker.close()
+        self._all.clear()
+        self._idle = queue.Queue()
@@ -0,0 +1,217 @@
+import asyncio
+import io
+import shutil
+import time
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+
+import av
+import edge_tts
+
+from stuart_ai.core.config import settings
+from stuart_ai.core.exceptions import SpeechSynthesisError
+from stuart_ai.core.logger import logger
+
+
+class TTSBackend(ABC):
+    """
+    Text-to-speech engine for one sentence at a time.
+
+    ``stream(text)`` is an async iterator of MP3 chunks: the cache, the
+    local decoder and network clients all take MP3. ``voice`` and ``rate``
+    identify what the backend produces (they are part of the cache key).
+    """
+
+    name = ""
+
+    def __init__(self, voice: str, rate: str):
+        self.voice = voice
+        self.rate = rate
+
+    @abstractmethod
+    async def stream(self, text: str) -> AsyncIterator[bytes]:
+        """Async iterator of the MP3 chunks for ``text``."""
+        yield b""  # Declares an async generator, like every override
+
+
+class EdgeTTSBackend(TTSBackend):
+    """Microsoft Edge neural voices: natural, but online — every sentence is a network round-trip."""
+
+    name = "edge"
+
+    def __init__(self, voice: str | None = None, rate: str | None = None):
+        super().__init__(voice or settings.tts_voice, rate or settings.tts_rate)
+
+    async def stream(self, text: str) -> AsyncIterator[bytes]:
+        async for chunk in edge_tts.Communicate(text, self.voice, rate=self.rate).stream():
+            if chunk["type"] == "audio":
+                yield chunk["data"]
+
+
+def wav_to_mp3(wav: bytes) -> bytes:
+    """Re-encodes a WAV file as mono MP3 at its own sample rate. Blocking."""
+    output = io.BytesIO()
+    with av.open(io.BytesIO(wav)) as source, av.open(output, "w", format="mp3") as target:
+        audio = source.streams.audio[0]
+        stream = target.add_stream("libmp3lame", rate=audio.rate, layout="mono")
+        resampler = av.AudioResampler(format="s16p", layout="mono", rate=audio.rate)
+        for frame in source.decode(audio):
+            for resampled in resampler.resample(frame):
+                for packet in stream.encode(resampled):
+                    target.mux(packet)
+        for packet in stream.encode(None):
+            target.mux(packet)
+    return output.getvalue()
+
+
+class EspeakBackend(TTSBackend):
+    """
+    espeak-ng in a local subprocess: robotic, but offline and tens of
+    milliseconds a sentence. The text goes through stdin, never argv.
+    """
+
+    name = "espeak"
+
+    def __init__(self, voice: str | None = None, speed: int | None = None, executable: str = "espeak-ng"):
+        self.espeak_voice = voice or settings.espeak_voice
+        self.speed = speed or settings.espeak_speed
+        self.executable = executable
+        super().__init__(f"espeak-ng/{self.espeak_voice}", str(self.speed))
+
+    def available(self) -> bool:
+        return shutil.which(self.executable) is not None
+
+    async def stream(self, text: str) -> AsyncIterator[bytes]:
+        try:
+            process = await asyncio.create_subprocess_exec(
+                self.executable, "-v", self.espeak_voice, "-s", str(self.speed), "--stdin", "--stdout",
+                stdin=asyncio.subprocess.PIPE, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
+            )
+        except OSError as e:
+            raise SpeechSynthesisError(f"Could not start {self.executable}: {e}") from e
+        wav, error = await process.communicate(text.encode("utf-8"))
+        if process.returncode != 0 or not wav:
+            raise SpeechSynthesisError(
+                f"{self.executable} exited with {process.returncode}: {error.decode(errors='replace').strip()}"
+            )
+        yield await asyncio.to_thread(wav_to_mp3, wav)
+
+
+BACKENDS = {backend.name: backend for backend in (EdgeTTSBackend, EspeakBackend)}
+
+
+def create_backend(name: str) -> TTSBackend:
+    """The backend registered as ``name`` (``TTS_BACKEND``, ``TTS_FALLBACK_BACKEND``)."""
+    try:
+        return BACKENDS[name]()
+    except KeyError:
+        raise ValueError(f"Unknown TTS backend '{name}' (available: {', '.join(BACKENDS)})") from None
+
+
+# pylint: disable=broad-except
+class Synthesizer:
+    """
+    Speech for one sentence: from the cache, the main backend or the fallback.
+
+    Audio already in the cache is served whole. Otherwise the main backend
+    streams it; with a fallback configured, a main backend that fails or has
+    not produced its first chunk within ``budget_seconds`` is abandoned for
+    the fallback, and skipped for ``cooldown_seconds`` afterwards so that an
+    unreachable service costs the budget once instead of on every sentence.
+    Audio is cached under the backend that produced it.
+    """
+
+    def __init__(self, backend: TTSBackend, fallback: TTSBackend | None = None, cache=None,
+                 budget_seconds: float | None = None, cooldown_seconds: float | None = None, on_fallback=None):
+        self.backend = backend
+        self.fallback = fallback
+        self.cache = cache
+        self.budget_seconds = budget_seconds if budget_seconds is not None else settings.tts_first_audio_budget_seconds
+        self.cooldown_seconds = (cooldown_seconds if cooldown_seconds is not None
+                                 else settings.tts_fallback_cooldown_seconds)
+        self.on_fallback = on_fallback
+        self._main_skipped_until = 0.0
+
+    async def stream(self, text: str):
+        if self.fallback is not None and time.monotonic() < self._main_skipped_until:
+            async for chunk in self._stream_from(self.fallback, text):
+                yield chunk
+            return
+
+        budget = self.budget_seconds if self.fallback is not None else None
+        started = False
+        try:
+            async for chunk in self._stream_from(self.backend, text, budget):
+                started = True
+                yield chunk
+            return
+        except SpeechSynthesisError as e:
+            # Part of the sentence was already heard: switching voices now would repeat it
+            if self.fallback is None or started:
+                raise
+            logger.warning("%s TTS: %s — speaking with %s for the next %.0fs",
+                           self.backend.name, e, self.fallback.name, self.cooldown_seconds)
+        self._main_skipped_until = time.monotonic() + self.cooldown_seconds
+        if self.on_fallback is not None:
+            self.on_fallback()
+        async for chunk in self._stream_from(self.fallback, text):
+            yield chunk
+
+    async def synthesize(self, text: str) -> bytes:
+        """
+        The complete MP3 for ``text`` from the main backend, through the cache.
+
+        Never the fallback: this is for audio assembled from pieces, where a
+        second voice would stand out.
+        """
+        return b"".join([chunk async for chunk in self._stream_from(self.backend, text)])
+
+    async def _stream_from(self, backend: TTSBackend, text: str, budget: float | None = None):
+        """
+        Cached or synthesized audio from ``backend``. Whatever stops it before
+        the first chunk (an error, or ``budget`` running out) is raised as
+        SpeechSynthesisError; later errors propagate unchanged.
+        """
+        if self.cache is not None:
+            cached = await asyncio.to_thread(self.cache.get, text, backend.voice, backend.rate)
+            if cached is not None:
+                yield cached
+                return
+
+        chunks = aiter(backend.stream(text))
+        try:
+            try:
+                first = await asyncio.wait_for(anext(chunks, None), budget)
+            except SpeechSynthesisError:
+                raise
+            except TimeoutError as e:
+                raise SpeechSynthesisError(f"no audio after {budget:.1f}s") from e
+            except Exception as e:
+                raise SpeechSynthesisError(str(e) or type(e).__name__) from e
+            if first is None:
+                return
+
+            audio = bytearray(first)
+            yield first
+            async for chunk in chunks:
+                audio += chunk
+                yield chunk
+        finally:
+            # Also after a timeout or a barge-in: releases the backend's connection or process
+            await chunks.aclose()
+        if self.cache is not None:
+            try:
+                await asyncio.to_thread(self.cache.put, text, backend.voice, backend.rate, bytes(audio))
+            except OSError as e:
+                logger.warning("Could not cache the synthesized speech: %s", e)
+
+
+def create_synthesizer(cache=None, on_fallback=None) -> Synthesizer:
+    """The synthesizer configured in ``Settings``; a fallback whose program is missing is left out."""
+    fallback = None
+    if settings.tts_fallback_backend and settings.tts_fallback_backend != settings.tts_backend:
+        fallback = create_backend(settings.tts_fallback_backend)
+        if isinstance(fallback, EspeakBackend) and not fallback.available():
+            logger.warning("TTS fallback '%s' not found, speech needs %s", fallback.executable, settings.tts_backend)
+            fallback = None
+    return Synthesizer(create_backend(settings.tts_backend), fallback, cache=cache, on_fallback=on_fallback)
@@ -0,0 +1,176 @@
+import ast
+import asyncio
+import hashlib
+import os
+import threading
+from pathlib import Path
+
+from stuart_ai.core.config import settings
+from stuart_ai.core.logger import logger
+from stuart_ai.services.speech_pipeline import split_sentences
+from stuart_ai.services.tts_backends import EdgeTTSBackend, TTSBackend
+
+_PACKAGE_DIR = Path(__file__).resolve().parent.parent
+
+# Modules whose fixed strings are spoken. True: returned strings are replies too
+PHRASE_SOURCES = {
+    "core/assistant.py": False,
+    "services/command_handler.py": True,
+    "tools/system_tools.py": True,
+}
+_SPEAKING_CALLS = {"speak", "announce", "ask_confirmation"}
+
+
+class TTSCache:
+    """
+    Content-addressed on-disk cache of synthesized speech.
+
+    Each entry is the MP3 for one (text, voice, rate), stored as
+    ``<sha256>.mp3``. Hits refresh the file's mtime; once the directory
+    passes ``max_bytes`` the least recently used entries are deleted.
+    Blocking: call through ``asyncio.to_thread``.
+    """
+
+    def __init__(self, cache_dir: str | None = None, max_bytes: int | None = None):
+        self.cache_dir = cache_dir or settings.tts_cache_dir
+        self.max_bytes = max_bytes if max_bytes is not None else int(settings.tts_cache_max_mb * 1024 * 1024)
+        os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(text: str, voice: str, rate: str) -> str:
+        return hashlib.sha256(f"{voice}\0{rate}\0{text}".encode("utf-8")).hexdigest()
+
+    def _path(self, text: str, voice: str, rate: str) -> str:
+        return os.path.join(self.cache_dir, self.key(text, voice, rate) + ".mp3")
+
+    def __contains__(self, entry: tuple[str, str, str]) -> bool:
+        return os.path.exists(self._path(*entry))
+
+    def get(self, text: str, voice: str, rate: str) -> bytes | None:
+        path = self._path(text, voice, rate)
+        try:
+            with open(path, "rb") as f:
+                audio = f.read()
+            os.utime(path)
+        except OSError:
+            return None
+        return audio or None
+
+    def put(self, text: str, voice: str, rate: str, audio: bytes):
+        if not audio:
+            return
+        path = self._path(text, voice, rate)
+        partial = f"{path}.{threading.get_ident()}.part"
+        fd = os.open(partial, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(audio)
+        # Atomic: readers never see a half-written entry
+        os.replace(partial, path)
+        self._evict()
+
+    def size(self) -> int:
+        return sum(entry.stat().st_size for entry in os.scandir(self.cache_dir) if entry.name.endswith(".mp3"))
+
+    def _evict(self):
+        with self._lock:
+            entries = []
+            for entry in os.scandir(self.cache_dir):
+                if entry.name.endswith(".mp3"):
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total -= size
+
+
+def static_phrases(source: str, returns: bool = False) -> list[str]:
+    """
+    Fixed strings a module speaks, found by walking its AST.
+
+    Collects literal first arguments of ``speak``/``announce``/``ask_confirmation`` calls,
+    literals assigned to ``response_text`` and, with ``returns``, literal
+    return values. f-strings are skipped: their text is only known at run time.
+    """
+    found = []
+
+    def literal(node) -> str | None:
+        if isinstance(node, ast.Constant) and isinstance(node.value, str) and node.value.strip():
+            return node.value
+        return None
+
+    for node in ast.walk(ast.parse(source)):
+        phrase = None
+        if isinstance(node, ast.Call) and node.args:
+            name = node.func.attr if isinstance(node.func, ast.Attribute) else getattr(node.func, "id", None)
+            if name in _SPEAKING_CALLS:
+                phrase = literal(node.args[0])
+        elif isinstance(node, ast.Assign):
+            if any(isinstance(target, ast.Name) and target.id == "response_text" for target in node.targets):
+                phrase = literal(node.value)
+        elif returns and isinstance(node, ast.Return) and node.value is not None:
+            phrase = literal(node.value)
+        if phrase:
+            found.append((node.lineno, node.col_offset, phrase))
+
+    phrases = []
+    for _, _, phrase in sorted(found):
+        if phrase not in phrases:
+            phrases.append(phrase)
+    return phrases
+
+
+def collect_static_phrases(sources: dict[str, bool] | None = None) -> list[str]:
+    """Every fixed phrase in ``PHRASE_SOURCES`` (paths relative to the ``stuart_ai`` package)."""
+    phrases = []
+    for relative, returns in (sources or PHRASE_SOURCES).items():
+        path = _PACKAGE_DIR / relative
+        try:
+            source = path.read_text(encoding="utf-8")
+        except OSError as e:
+            logger.warning("Could not scan %s for static phrases: %s", path, e)
+            continue
+        phrases.extend(p for p in static_phrases(source, returns) if p not in phrases)
+    return phrases
+
+
+# pylint: disable=broad-except
+async def presynthesize(cache: TTSCache, phrases: list[str], backend: TTSBackend | None = None,
+                        concurrency: int = 4) -> int:
+    """
+    Synthesizes the phrases missing from the cache (with Edge TTS by default). Returns how many were added.
+
+    ``speak`` looks up the cache one sentence at a time, so each phrase is
+    cached as the units ``split_sentences`` makes of it.
+    """
+    backend = backend or EdgeTTSBackend()
+    sentences = []
+    for phrase in phrases:
+        sentences.extend(s for s in split_sentences(phrase) if s not in sentences)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def add(phrase: str) -> bool:
+        if (phrase, backend.voice, backend.rate) in cache:
+            return False
+        async with semaphore:
+            try:
+                audio = b"".join([chunk async for chunk in backend.stream(phrase)])
+                await asyncio.to_thread(cache.put, phrase, backend.voice, backend.rate, audio)
+                return bool(audio)
+            except Exception as e:
+                logger.warning("Could not pre-synthesize '%s': %s", phrase, e)
+                return False
+
+    added = sum(await asyncio.gather(*(add(sentence) for sentence in sentences)))
+    logger.info("TTS cache: %d fixed phrase(s) in %d sentence(s), %d newly synthesized",
+                len(phrases), len(sentences), added)
+    return added
@@ -0,0 +1,271 @@
+import asyncio
+import platform
+import subprocess
+import threading
+import uuid
+from asyncio.subprocess import Process
+
+import av
+from playsound import playsound
+import speech_recognition as sr
+
+from stuart_ai.core.config import settings
+from stuart_ai.core.exceptions import AudioDeviceError
+from stuart_ai.core.logger import logger
+from stuart_ai.utils.audio_utils import ignore_stderr, start_device_thread
+from stuart_ai.utils.tmp_file_handler import TempFileHandler
+
+# Edge TTS voices are 24 kHz mono
+OUTPUT_SAMPLE_RATE = 24000
+OUTPUT_SAMPLE_WIDTH = 2
+
+
+class Mp3Decoder:
+    """
+    Incremental MP3 → 16-bit mono PCM decoder for audio that arrives in chunks.
+
+    One decoder per utterance: it keeps the parser state across ``decode``
+    calls, so chunks may split MP3 frames anywhere, and concatenated MP3
+    streams (one per sentence) decode as one. ``flush`` returns what is left
+    once the last chunk has been fed.
+    """
+
+    def __init__(self, sample_rate: int = OUTPUT_SAMPLE_RATE):
+        self._codec = av.CodecContext.create("mp3", "r")
+        self._resampler = av.AudioResampler(format="s16", layout="mono", rate=sample_rate)
+
+    def _frames(self, packets) -> bytes:
+        pcm = bytearray()
+        for packet in packets:
+            try:
+                frames = self._codec.decode(packet)
+            except av.error.InvalidDataError:
+                # ID3 tags and stray bytes between streams
+                continue
+            for frame in frames:
+                for resampled in self._resampler.resample(frame):
+                    pcm += resampled.to_ndarray().tobytes()
+        return bytes(pcm)
+
+    def decode(self, chunk: bytes) -> bytes:
+        return self._frames(self._codec.parse(chunk))
+
+    def flush(self) -> bytes:
+        pcm = self._frames(self._codec.parse(None))
+        pcm += self._frames([None])
+        for resampled in self._resampler.resample(None):
+            pcm += resampled.to_ndarray().tobytes()
+        return pcm
+
+
+class _PyAudioOutput:
+    """Blocking PyAudio output stream, opened through SpeechRecognition's PyAudio import."""
+
+    def __init__(self, sample_rate: int, sample_width: int, frames_per_buffer: int):
+        pyaudio = sr.Microphone.get_pyaudio()
+        self._audio = pyaudio.PyAudio()
+        try:
+            self._stream = self._audio.open(
+                format=self._audio.get_format_from_width(sample_width), channels=1, rate=sample_rate,
+                output=True, frames_per_buffer=frames_per_buffer,
+            )
+        except Exception:
+            self._audio.terminate()
+            raise
+
+    def write(self, data: bytes):
+        self._stream.write(data)
+
+    def close(self):
+        try:
+            self._stream.stop_stream()
+            self._stream.close()
+        finally:
+            self._audio.terminate()
+
+
+# pylint: disable=broad-except
+class AudioPlayer:
+    """
+    Long-lived PCM sink for the assistant's voice.
+
+    A dedicated thread keeps one output stream open and writes queued PCM to
+    it in ``CHUNK``-frame blocks, so no player process is started per reply
+    and playback can be cut off between two blocks.
+
+    - ``enqueue`` adds PCM (waits while more than ``max_buffered_seconds`` is queued)
+    - ``flush`` waits until everything enqueued so far has been played
+    - ``interrupt`` drops whatever has not been played yet
+
+    ``stream_factory()`` returns an object with blocking ``write`` and
+    ``close`` (PyAudio by default).
+    """
+
+    CHUNK = 1024
+
+    def __init__(self, stream_factory=None, sample_rate: int = OUTPUT_SAMPLE_RATE,
+                 max_buffered_seconds: float | None = None):
+        self.sample_rate = sample_rate
+        self.sample_width = OUTPUT_SAMPLE_WIDTH
+        self.stream_factory = stream_factory or (
+            lambda: _PyAudioOutput(self.sample_rate, self.sample_width, self.CHUNK)
+        )
+        buffered = max_buffered_seconds if max_buffered_seconds is not None else settings.audio_output_buffer_seconds
+        self.max_buffered_bytes = int(buffered * sample_rate) * self.sample_width
+
+        self._buffer = bytearray()
+        # Absolute byte counts: everything ever enqueued / written to the device or dropped
+        self._queued = 0
+        self._played = 0
+        self._cond = threading.Condition()
+        self._stop = False
+        self._thread: threading.Thread | None = None
+        self._ready = threading.Event()
+        self._error: AudioDeviceError | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def buffered_seconds(self) -> float:
+        return len(self._buffer) / (self.sample_rate * self.sample_width)
+
+    def start(self):
+        """Opens the output stream on the playback thread. Blocks until it is ready; raises AudioDeviceError."""
+        if self.running:
+            return
+        self._stop = False
+        self._ready.clear()
+        self._error = None
+        self._thread = start_device_thread(self._run, "audio-player", self._ready, lambda: self._error)
+
+    def close(self):
+        with self._cond:
+            self._stop = True
+            self._cond.notify_all()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=2)
+
+    def _run(self):
+        try:
+            with ignore_stderr():
+                stream = self.stream_factory()
+        except Exception as e:
+            self._error = AudioDeviceError(f"Could not open the audio output: {e}")
+            self._ready.set()
+            return
+
+        self._ready.set()
+        block_bytes = self.CHUNK * self.sample_width
+        try:
+            while True:
+                with self._cond:
+                    self._cond.wait_for(lambda: self._buffer or self._stop)
+                    if self._stop:
+                        break
+                    block = bytes(self._buffer[:block_bytes])
+                    del self._buffer[:block_bytes]
+                    self._cond.notify_all()
+                stream.write(block)
+                with self._cond:
+                    self._played += len(block)
+                    self._cond.notify_all()
+        except Exception as e:
+            logger.error("Audio output stopped: %s", e)
+        finally:
+            with self._cond:
+                self._stop = True
+                self._cond.notify_all()
+            try:
+                stream.close()
+            except Exception:
+                pass
+
+    def _wait(self, predicate):
+        with self._cond:
+            self._cond.wait_for(lambda: predicate() or self._stop)
+
+    async def enqueue(self, pcm: bytes):
+        if not pcm:
+            return
+        if len(self._buffer) > self.max_buffered_bytes:
+            await asyncio.to_thread(self._wait, lambda: len(self._buffer) <= self.max_buffered_bytes)
+        with self._cond:
+            if self._stop:
+                raise AudioDeviceError("Audio output is not running")
+            self._buffer += pcm
+            self._queued += len(pcm)
+            self._cond.notify_all()
+
+    async def flush(self):
+        target = self._queued
+        if self._played < target:
+            await asyncio.to_thread(self._wait, lambda: self._played >= target)
+
+    def interrupt(self):
+        with self._cond:
+            self._played += len(self._buffer)
+            self._buffer.clear()
+            self._cond.notify_all()
+
+
+class StreamingPlayer:
+    """
+    Plays MP3 as it is synthesized: chunks go straight into ``mpg123 -q -``'s stdin.
+
+    Fallback for when no PyAudio output works: playback still starts with the
+    first chunk instead of after the whole reply was written to disk.
+    ``start`` returns False where mpg123 is not available (non-Linux systems,
+    or not installed); callers then play the complete audio with
+    ``play_mp3_file``.
+    """
+
+    def __init__(self):
+        self._proc: Process | None = None
+
+    async def start(self) -> bool:
+        if platform.system() != "Linux":
+            return False
+        try:
+            self._proc = await asyncio.create_subprocess_exec(
+                "mpg123", "-q", "-", stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            )
+        except OSError:
+            logger.warning("mpg123 not found, falling back to playsound...")
+            return False
+        return True
+
+    async def write(self, chunk: bytes):
+        self._proc.stdin.write(chunk)
+        await self._proc.stdin.drain()
+
+    async def finish(self):
+        """Signals the end of the audio and waits until mpg123 has played it."""
+        if self._proc is None:
+            return
+        try:
+            self._proc.stdin.close()
+            await self._proc.wait()
+        finally:
+            self._proc = None
+
+    async def abort(self):
+        """Stops playback right away."""
+        if self._proc is None:
+            return
+        try:
+            self._proc.kill()
+            await self._proc.wait()
+        except ProcessLookupError:
+            pass
+        finally:
+            self._proc = None
+
+
+async def play_mp3_file(audio: bytes):
+    """Plays complete MP3 audio with playsound, which needs it in a (owner-only) temp file."""
+    with TempFileHandler(f"{settings.temp_dir}/response_{uuid.uuid4()}.mp3") as path:
+        with open(path, "wb") as f:
+            f.write(audio)
+        await asyncio.to_thread(playsound, path)
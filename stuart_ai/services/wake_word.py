@@ -0,0 +1,196 @@
+import functools
+import re
+import unicodedata
+from dataclasses import dataclass
+
+import numpy as np
+from rapidfuzz import fuzz, process
+
+from stuart_ai.core.config import settings
+from stuart_ai.core.logger import logger
+from stuart_ai.utils.audio_utils import WHISPER_SAMPLE_RATE, greedy_transcribe
+
+# Spellings Whisper produces for the keyword that the phonetic rules alone do not bring back
+KNOWN_MISTRANSCRIPTIONS = {
+    "stuart": ("stewart", "steward", "stuard", "stward", "estuarte", "estiuarte", "istuart", "stuarte", "stu art"),
+}
+
+# pt-BR sound-alike rules, applied in order to an accent-free lower-case word
+_PHONETIC_RULES = [
+    (re.compile(r"^[ei](?=s[^aeiou])"), ""),  # prosthetic vowel: "estuarte", "istuart"
+    (re.compile(r"ch|sh"), "x"),
+    (re.compile(r"lh"), "l"),
+    (re.compile(r"nh"), "n"),
+    (re.compile(r"ph"), "f"),
+    (re.compile(r"th"), "t"),
+    (re.compile(r"qu?"), "k"),
+    (re.compile(r"gu(?=[ei])"), "g"),
+    (re.compile(r"c(?=[ei])"), "s"),
+    (re.compile(r"c"), "k"),
+    (re.compile(r"z"), "s"),
+    (re.compile(r"w"), "u"),
+    (re.compile(r"y"), "i"),
+    (re.compile(r"h"), ""),
+    (re.compile(r"[ei]u"), "u"),  # glide before u: "stiuart", "stewart"
+    (re.compile(r"(?<=[^aeiou])e$"), ""),  # epenthetic final e: "stuarte"
+    (re.compile(r"d$"), "t"),  # final devoicing: "stuard"
+    (re.compile(r"(.)\1+"), r"\1"),
+]
+
+_TOKEN = re.compile(r"\w+")
+
+
+def strip_accents(text: str) -> str:
+    return "".join(c for c in unicodedata.normalize("NFD", text) if unicodedata.category(c) != "Mn")
+
+
+@functools.lru_cache(maxsize=4096)
+def phonetic_key(word: str) -> str:
+    """Metaphone-style key for pt-BR: "stuart", "stiuart", "estuarte" and "stewart" all become "stuart"."""
+    key = strip_accents(word.lower()).replace("ç", "s").replace(" ", "")
+    for pattern, replacement in _PHONETIC_RULES:
+        key = pattern.sub(replacement, key)
+    return key
+
+
+@dataclass(frozen=True)
+class WakeWordMatch:
+    word: str  # As it appears in the lower-cased transcript
+    keyword: str
+    score: int
+
+
+class WakeWordMatcher:
+    """
+    Batched phonetic keyword spotter for transcripts.
+
+    Keys for every configured keyword and its known mis-transcriptions are
+    computed once. A transcript is split into tokens plus adjacent token pairs
+    (Whisper sometimes splits the name: "stu art"), every candidate is mapped
+    to its phonetic key and all of them are scored against all keyword keys in
+    one rapidfuzz ``cdist`` call.
+
+    A fuzzy score only counts between keys of the same length: one dropped or
+    extra sound in a six-letter name still scores 91-92, which is how ordinary
+    speech ("start", "os stuarts", "sua arte") used to wake the assistant.
+    Missing or extra sounds have to come from the phonetic rules or
+    ``KNOWN_MISTRANSCRIPTIONS``. Pairs are only considered when no single
+    token matches.
+
+    With equal lengths, one changed sound in a six-letter key scores 83, so
+    the default ``wake_word_confidence`` of 85 means exact phonetic-key
+    matching. That is deliberate: at 80, "estudar" and "start o" already
+    score 83 against "stuart". The looser gate (``wake_gate_confidence``)
+    does accept one changed sound.
+    """
+
+    def __init__(self, keywords: list[str], min_score: int, variants: dict[str, tuple[str, ...]] | None = None):
+        self.keywords = [k.lower() for k in keywords]
+        self.min_score = min_score
+        variants = KNOWN_MISTRANSCRIPTIONS if variants is None else variants
+
+        self._strict = [(k, re.compile(rf"\b{re.escape(k)}\b")) for k in self.keywords]
+        owners: dict[str, str] = {}
+        for keyword in self.keywords:
+            for spelling in (keyword, *variants.get(keyword, ())):
+                owners.setdefault(phonetic_key(spelling), keyword)
+        self._keys = list(owners)
+        self._owners = list(owners.values())
+        self._key_lengths = np.array([len(key) for key in self._keys])
+
+    @staticmethod
+    def candidates(text: str) -> list[str]:
+        """Tokens of the lower-cased transcript followed by adjacent token pairs."""
+        tokens = _TOKEN.findall(text.lower())
+        return tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+
+    def match(self, text: str) -> WakeWordMatch | None:
+        text_lower = text.lower()
+        for keyword, pattern in self._strict:
+            if pattern.search(text_lower):
+                return WakeWordMatch(keyword, keyword, 100)
+
+        candidates = self.candidates(text_lower)
+        if not candidates:
+            return None
+        keys = [phonetic_key(c) for c in candidates]
+        scores = process.cdist(keys, self._keys, scorer=fuzz.ratio, dtype=np.uint8, score_cutoff=self.min_score)
+        scores[np.array([len(key) for key in keys])[:, None] != self._key_lengths[None, :]] = 0
+
+        tokens = (len(candidates) + 1) // 2  # n tokens, then n - 1 pairs
+        for rows in (slice(0, tokens), slice(tokens, None)):
+            part = scores[rows]
+            if part.size == 0:
+                continue
+            best = np.unravel_index(np.argmax(part), part.shape)
+            score = int(part[best])
+            if score >= self.min_score:
+                return WakeWordMatch(candidates[rows][best[0]], self._owners[best[1]], score)
+        return None
+
+
+@functools.lru_cache(maxsize=16)
+def _matcher(keywords: tuple[str, ...], min_score: int) -> WakeWordMatcher:
+    return WakeWordMatcher(list(keywords), min_score)
+
+
+def find_wake_word(text: str, keyword: str | list[str], min_score: int) -> tuple[str, int] | None:
+    """
+    Looks for the wake word in a transcript.
+
+    Returns ``(matched_word, score)`` — the keyword itself with score 100 for a
+    strict match, or the transcribed word whose phonetic key is close enough to
+    a keyword's (``min_score``). Returns None otherwise.
+    """
+    keywords = (keyword,) if isinstance(keyword, str) else tuple(keyword)
+    match = _matcher(keywords, min_score).match(text)
+    return (match.word, match.score) if match else None
+
+
+class WakeWordGate:
+    """
+    Cheap keyword-spotting stage that runs before the full transcription.
+
+    Slides a short window over the start of the utterance and decodes each
+    window greedily (beam 1, no temperature fallback, a handful of tokens).
+    Only utterances where the keyword is likely present go on to the full,
+    beam-searched decode of the whole phrase.
+    """
+
+    # A window only needs to hold "Stuart" plus a word or two of context
+    _MAX_NEW_TOKENS = 12
+
+    def __init__(self, model, keyword: str | None = None,
+                 extra_keywords: list[str] | None = None,
+                 window_seconds: float | None = None,
+                 search_seconds: float | None = None,
+                 min_score: int | None = None):
+        self.model = model
+        self.keyword = (keyword or settings.assistant_keyword).lower()
+        self.window_seconds = window_seconds or settings.wake_gate_window_seconds
+        self.search_seconds = search_seconds or settings.wake_gate_search_seconds
+        self.min_score = min_score if min_score is not None else settings.wake_gate_confidence
+        extra = settings.wake_keywords if extra_keywords is None else extra_keywords
+        self.matcher = WakeWordMatcher([self.keyword, *extra], self.min_score)
+
+    def windows(self, samples: np.ndarray):
+        """Yields overlapping windows (50% hop) covering the first ``search_seconds``."""
+        window = int(self.window_seconds * WHISPER_SAMPLE_RATE)
+        hop = max(1, window // 2)
+        limit = min(samples.size, int(self.search_seconds * WHISPER_SAMPLE_RATE))
+
+        for start in range(0, max(0, limit - window) + 1, hop):
+            yield samples[start:start + window]
+
+    def _decode(self, window: np.ndarray) -> str:
+        return greedy_transcribe(self.model, window, max_new_tokens=self._MAX_NEW_TOKENS)
+
+    def detect(self, samples: np.ndarray) -> bool:
+        """Returns True as soon as one window contains the keyword. Blocking."""
+        for window in self.windows(samples):
+            text = self._decode(window)
+            match = self.matcher.match(text)
+            if match:
+                logger.debug("Wake gate hit ('%s', score %d): %s", match.word, match.score, text)
+                return True
+        return False
@@ -16,6 +16,7 @@ from stuart_ai.agents.productivity.calendar_manager import CalendarManager
 from stuart_ai.core.enums import AssistantSignal
 from stuart_ai.core.logger import logger
 from stuart_ai.core.config import settings
+from stuart_ai.services.speech_templates import spoken_date
 
 
 # pylint: disable=unused-argument
@@ -23,13 +24,18 @@ class AssistantTools:
     """
     A class to encapsulate all the tools available to the assistant's router agent.
     Each tool should return a string to be spoken by the command handler.
+
+    Progress messages go through ``announce``, which returns as soon as the
+    message is queued so the slow work starts while it is being spoken
+    (without an ``announce_func`` it falls back to the blocking ``speak``).
     """
 
     def __init__(self, speak_func, confirmation_func,
                  app_aliases, web_search_agent: WebSearchAgent,
                  local_rag_agent: LocalRAGAgent,
-                 content_agent=None, coding_agent=None):
+                 content_agent=None, coding_agent=None, announce_func=None):
         self.speak = speak_func
+        self.announce = announce_func or speak_func
         self.confirm = confirmation_func
         self.app_aliases = app_aliases
         self.web_search_agent = web_search_agent
@@ -51,7 +57,7 @@ class AssistantTools:
             if not title or not datetime_str:
                 return "Preciso do nome do evento e da data/hora."
 
-            await self.speak(f"Agendando {title} para {datetime_str}...")
+            await self.announce(f"Agendando {title} para {datetime_str}...")
             return await asyncio.to_thread(self.calendar_manager.add_event, title, datetime_str)
         except (ValueError, TypeError) as e:
             logger.error("Error adding event: %s", e)
@@ -59,7 +65,7 @@ class AssistantTools:
 
     async def _check_calendar(self, date_str: str | dict | None = None) -> str:
         """Consultar agenda."""
-        await self.speak("Consultando sua agenda...")
+        await self.announce("Consultando sua agenda...")
 
         # Handle dict arguments from LLM (e.g. {"date": "amanhã"})
         if isinstance(date_str, dict):
@@ -74,7 +80,7 @@ class AssistantTools:
 
     async def _delete_calendar_event(self, event_title: str) -> str:
         """Excluir um compromisso."""
-        await self.speak(f"Excluindo o evento {event_title}...")
+        await self.announce(f"Excluindo o evento {event_title}...")
         return await asyncio.to_thread(self.calendar_manager.delete_event, event_title)
 
     async def _search_local_files(self, query: str) -> str:
@@ -84,7 +90,7 @@ class AssistantTools:
         if not query:
             return "O que você gostaria de pesquisar nos seus arquivos?"
 
-        await self.speak("Pesquisando nos seus arquivos...")
+        await self.announce("Pesquisando nos seus arquivos...")
         try:
             return await self.local_rag_agent.run(query)
         except (ValueError, TypeError, RuntimeError) as e:
@@ -145,7 +151,7 @@ class AssistantTools:
             limit_mb = settings.index_max_file_size // (1024 * 1024)
             return f"Arquivo muito grande. O limite é {limit_mb} MB."
 
-        await self.speak(f"Processando o arquivo {resolved.name}...")
+        await self.announce(f"Processando o arquivo {resolved.name}...")
         try:
             await asyncio.to_thread(
                 self.local_rag_agent.document_store.add_document, str(resolved)
@@ -164,10 +170,8 @@ class AssistantTools:
 
     def _get_date(self, *args, **kwargs) -> str:
         """Retorna a data atual. Use quando o usuário perguntar que dia é hoje."""
-        now = datetime.now()
-        # Format: Segunda-feira, 05 de Janeiro de 2026 (requires locale)
-        # Or simple: 05/01/2026
-        return f"Hoje é {now.strftime('%d/%m/%Y')}."
+        # Weekday and month names without depending on the system locale
+        return spoken_date(datetime.now().date())
 
     async def _tell_joke(self, *args, **kwargs) -> str:
         """Conta uma piada aleatória em português.\
@@ -304,7 +308,7 @@ class AssistantTools:
         if not search_query:
             return "Claro, o que você gostaria que eu pesquisasse na web?"
 
-        await self.speak(f"Ok, pesquisando na web sobre {search_query}.\
+        await self.announce(f"Ok, pesquisando na web sobre {search_query}.\
                           Isso pode levar um momento.")
         try:
             # Agent run might be blocking, run in thread
@@ -392,7 +396,7 @@ class AssistantTools:
             return "Qual URL você gostaria que eu resumisse?"
         if not self.content_agent:
             return "Agente de conteúdo não está disponível."
-        await self.speak(f"Resumindo o artigo em {url}...")
+        await self.announce(f"Resumindo o artigo em {url}...")
         try:
             return await self.content_agent.summarize_url(url)
         except (ValueError, RuntimeError) as e:
@@ -405,7 +409,7 @@ class AssistantTools:
             return "Qual URL do YouTube você gostaria que eu resumisse?"
         if not self.content_agent:
             return "Agente de conteúdo não está disponível."
-        await self.speak("Buscando o transcript do vídeo, aguarde...")
+        await self.announce("Buscando o transcript do vídeo, aguarde...")
         try:
             return await self.content_agent.summarize_youtube(url)
         except (ValueError, RuntimeError) as e:
@@ -420,7 +424,7 @@ class AssistantTools:
             return "Qual erro você gostaria que eu explicasse?"
         if not self.coding_agent:
             return "Agente de código não está disponível."
-        await self.speak("Analisando o erro, um momento...")
+        await self.announce("Analisando o erro, um momento...")
         try:
             return await self.coding_agent.explain_error(stack_trace)
         except (ValueError, RuntimeError) as e:
@@ -433,7 +437,7 @@ class AssistantTools:
             return "O que você gostaria que o script fizesse?"
         if not self.coding_agent:
             return "Agente de código não está disponível."
-        await self.speak(f"Gerando script para: {description}...")
+        await self.announce(f"Gerando script para: {description}...")
         try:
             return await self.coding_agent.generate_script(description)
         except (ValueError, RuntimeError) as e:
@@ -0,0 +1,69 @@
+"""
+On-disk utterance corpus shared by the replay source, the capture recorder and the benchmarks.
+
+A corpus is a directory of ``NNNN.wav`` files (mono PCM) with a ``NNNN.json``
+sidecar. Labelled entries carry at least ``{"text": ..., "wake": bool}``;
+entries written in capture mode carry timing metadata and the live
+transcript, and can be labelled by hand afterwards.
+"""
+import json
+import os
+import wave
+
+import numpy as np
+
+from stuart_ai.utils.audio_utils import WHISPER_SAMPLE_RATE, pcm_to_float32
+
+
+def write_wav(path: str, samples: np.ndarray, sample_rate: int = WHISPER_SAMPLE_RATE):
+    """Writes float32 samples as 16-bit mono PCM."""
+    pcm = (np.clip(samples, -1.0, 1.0) * 32767).astype("<i2")
+    write_pcm_wav(path, pcm.tobytes(), sample_rate, 2)
+
+
+def write_pcm_wav(path: str, frame_data: bytes, sample_rate: int, sample_width: int):
+    # pylint infers wave.open() as Wave_read whatever the mode; "wb" returns a Wave_write
+    # pylint: disable=no-member
+    with wave.open(path, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(sample_width)
+        wav.setframerate(sample_rate)
+        wav.writeframes(frame_data)
+
+
+def read_wav(path: str) -> np.ndarray:
+    """Reads a mono WAV file as Whisper input (16 kHz float32)."""
+    with wave.open(path, "rb") as wav:
+        if wav.getnchannels() != 1:
+            raise ValueError(f"{path}: only mono corpora are supported")
+        return pcm_to_float32(wav.readframes(wav.getnframes()), wav.getsampwidth(), wav.getframerate())
+
+
+def read_sidecar(base: str) -> dict:
+    """Metadata of the entry at ``base`` (path without extension); empty if it has none."""
+    if not os.path.exists(base + ".json"):
+        return {}
+    with open(base + ".json", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def write_sidecar(base: str, meta: dict):
+    with open(base + ".json", "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False, indent=2)
+
+
+def corpus_entries(corpus_dir: str) -> list[str]:
+    """Base paths (without extension) of every WAV in the corpus, in name order."""
+    if not os.path.isdir(corpus_dir):
+        return []
+    return [os.path.join(corpus_dir, name[:-4]) for name in sorted(os.listdir(corpus_dir)) if name.endswith(".wav")]
+
+
+def next_entry(corpus_dir: str) -> str:
+    """Base path for a new entry, numbered after the last one."""
+    entries = corpus_entries(corpus_dir)
+    index = 0
+    if entries:
+        last = os.path.basename(entries[-1])
+        index = int(last) + 1 if last.isdigit() else len(entries)
+    return os.path.join(corpus_dir, f"{index:04d}")
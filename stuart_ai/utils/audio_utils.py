@@ -1,6 +1,12 @@
 import os
 import sys
 import contextlib
+import threading
+
+import numpy as np
+
+# Faster Whisper expects 16 kHz mono float32 samples in [-1.0, 1.0]
+WHISPER_SAMPLE_RATE = 16000
 
 @contextlib.contextmanager
 def ignore_stderr():
@@ -26,3 +32,105 @@ def ignore_stderr():
     except Exception:
         # If anything goes wrong with the suppression, just yield
         yield
+
+
+def start_device_thread(target, name: str, ready: threading.Event, error) -> threading.Thread:
+    """
+    Starts the daemon thread that owns an audio stream and waits until it has opened the device.
+
+    The thread sets ``ready`` once the device is open or has failed;
+    ``error()`` then returns the exception it recorded (or None), which is
+    raised here.
+    """
+    thread = threading.Thread(target=target, name=name, daemon=True)
+    thread.start()
+    ready.wait()
+    failure = error()
+    if failure:
+        thread.join(timeout=1)
+        raise failure
+    return thread
+
+
+def pcm_to_float32(frame_data: bytes, sample_width: int, sample_rate: int,
+                   target_rate: int = WHISPER_SAMPLE_RATE) -> np.ndarray:
+    """
+    Converts raw little-endian mono PCM into a float32 buffer at ``target_rate``.
+
+    The input bytes are viewed in place with ``np.frombuffer``; the only copy is
+    the unavoidable int -> float32 conversion (plus resampling when the device
+    rate differs from ``target_rate``).
+    """
+    if sample_width == 1:
+        # 8-bit PCM is unsigned, centred on 128
+        samples = (np.frombuffer(frame_data, dtype=np.uint8).astype(np.float32) - 128.0) / 128.0
+    elif sample_width == 2:
+        samples = np.frombuffer(frame_data, dtype="<i2").astype(np.float32) / 32768.0
+    elif sample_width == 3:
+        # 24-bit PCM: pad each sample to 32 bits (low byte zero) and treat it as int32
+        raw = np.frombuffer(frame_data, dtype=np.uint8).reshape(-1, 3)
+        padded = np.zeros((raw.shape[0], 4), dtype=np.uint8)
+        padded[:, 1:] = raw
+        samples = padded.view("<i4").reshape(-1).astype(np.float32) / 2147483648.0
+    elif sample_width == 4:
+        samples = np.frombuffer(frame_data, dtype="<i4").astype(np.float32) / 2147483648.0
+    else:
+        raise ValueError(f"Unsupported sample width: {sample_width}")
+
+    return resample(samples, sample_rate, target_rate)
+
+
+def resample(samples: np.ndarray, sample_rate: int, target_rate: int = WHISPER_SAMPLE_RATE) -> np.ndarray:
+    """Resamples a mono float32 buffer to ``target_rate``."""
+    if sample_rate == target_rate or samples.size == 0:
+        return samples
+
+    # Common microphone rates (32/48 kHz) are integer multiples of 16 kHz:
+    # averaging each group is a cheap anti-aliasing decimator.
+    if sample_rate % target_rate == 0:
+        factor = sample_rate // target_rate
+        usable = samples.size - (samples.size % factor)
+        return samples[:usable].reshape(-1, factor).mean(axis=1, dtype=np.float32)
+
+    # Arbitrary ratios (e.g. 44.1 kHz): linear interpolation
+    duration = samples.size / sample_rate
+    target_len = int(round(duration * target_rate))
+    source_times = np.arange(samples.size, dtype=np.float64) / sample_rate
+    target_times = np.arange(target_len, dtype=np.float64) / target_rate
+    return np.interp(target_times, source_times, samples).astype(np.float32)
+
+
+def pcm_rms(frame_data: bytes, sample_width: int) -> float:
+    """Root-mean-square energy of a PCM chunk in raw sample units (same scale as ``audioop.rms``)."""
+    if not frame_data:
+        return 0.0
+    samples = pcm_to_float32(frame_data, sample_width, WHISPER_SAMPLE_RATE, WHISPER_SAMPLE_RATE)
+    return float(np.sqrt(np.mean(np.square(samples, dtype=np.float64)))) * (1 << (8 * sample_width - 1))
+
+
+def audio_data_to_float32(audio, target_rate: int = WHISPER_SAMPLE_RATE) -> np.ndarray:
+    """Converts a ``speech_recognition.AudioData`` into a Whisper-ready float32 buffer."""
+    return pcm_to_float32(audio.frame_data, audio.sample_width, audio.sample_rate, target_rate)
+
+
+def greedy_transcribe(model, samples: np.ndarray, initial_prompt: str | None = None,
+                      max_new_tokens: int | None = None, **options) -> str:
+    """
+    Fast single-pass pt-BR decode for short checks (wake gate, partials, confirmations, barge-in).
+
+    Beam 1, no temperature fallback, no timestamps and no conditioning on
+    earlier text; ``max_new_tokens`` caps how much is decoded. Blocking.
+    """
+    segments, _ = model.transcribe(
+        samples,
+        language="pt",
+        initial_prompt=initial_prompt,
+        beam_size=1,
+        best_of=1,
+        temperature=0.0,
+        without_timestamps=True,
+        condition_on_previous_text=False,
+        max_new_tokens=max_new_tokens,
+        **options,
+    )
+    return " ".join(segment.text for segment in segments).strip()
@@ -0,0 +1,41 @@
+import numpy as np
+
+from stuart_ai.utils.audio_utils import pcm_to_float32
+
+
+def zero_crossing_rate(samples: np.ndarray) -> float:
+    """Fraction of consecutive sample pairs that change sign."""
+    if samples.size < 2:
+        return 0.0
+    signs = np.signbit(samples)
+    return float(np.count_nonzero(signs[1:] != signs[:-1])) / (samples.size - 1)
+
+
+class EnergyZcrVAD:
+    """
+    Frame-level voice activity detector based on RMS energy and zero-crossing rate.
+
+    Voiced speech is loud, so anything above the energy threshold counts as
+    speech. Unvoiced fricatives (the "s" and "t" that open "Stuart") are quiet
+    but noisy: frames between ``weak_energy_ratio`` x threshold and the
+    threshold count as speech only when their zero-crossing rate is high.
+    Low-frequency hum and room tone fall below both rules.
+    """
+
+    def __init__(self, weak_energy_ratio: float = 0.5, fricative_zcr: float = 0.25):
+        self.weak_energy_ratio = weak_energy_ratio
+        self.fricative_zcr = fricative_zcr
+
+    def is_speech(self, frame_data: bytes, sample_width: int, energy_threshold: float) -> bool:
+        if not frame_data:
+            return False
+        # Keep the native rate: ZCR is only compared between frames of the same stream
+        samples = pcm_to_float32(frame_data, sample_width, 1, 1)
+        full_scale = 1 << (8 * sample_width - 1)
+        energy = float(np.sqrt(np.mean(np.square(samples, dtype=np.float64)))) * full_scale
+
+        if energy > energy_threshold:
+            return True
+        if energy > energy_threshold * self.weak_energy_ratio:
+            return zero_crossing_rate(samples) >= self.fricative_zcr
+        return False
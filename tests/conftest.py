@@ -0,0 +1,27 @@
+import io
+
+import av
+import numpy as np
+import pytest
+
+
+def encode_mp3(seconds: float, rate: int = 24000, frequency: float = 440.0) -> bytes:
+    """A mono sine tone encoded like Edge TTS output (24 kHz MP3)."""
+    t = np.arange(int(seconds * rate)) / rate
+    samples = (0.3 * np.sin(2 * np.pi * frequency * t) * 32767).astype(np.int16)
+    buffer = io.BytesIO()
+    with av.open(buffer, "w", format="mp3") as container:
+        stream = container.add_stream("libmp3lame", rate=rate, layout="mono")
+        for start in range(0, samples.size, 1152):
+            frame = av.AudioFrame.from_ndarray(samples[None, start:start + 1152], format="s16", layout="mono")
+            frame.sample_rate = rate
+            for packet in stream.encode(frame):
+                container.mux(packet)
+        for packet in stream.encode(None):
+            container.mux(packet)
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def mp3_tone():
+    return encode_mp3
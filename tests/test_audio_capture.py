@@ -0,0 +1,154 @@
+import numpy as np
+import pytest
+import speech_recognition as sr
+
+from stuart_ai.core.exceptions import AudioDeviceError
+from stuart_ai.services.audio_capture import AudioCapture, AudioRingBuffer
+
+CHUNK = 1600  # 0.1 s at 16 kHz
+SILENCE = bytes(CHUNK * 2)
+SPEECH = np.full(CHUNK, 10000, dtype="<i2").tobytes()
+
+
+class FakeMicrophone:
+    """Mimics sr.Microphone: plays a scripted list of chunks, then reports end of stream."""
+
+    SAMPLE_RATE = 16000
+    SAMPLE_WIDTH = 2
+    CHUNK = CHUNK
+
+    def __init__(self, chunks):
+        self._chunks = list(chunks)
+        self.stream = self
+
+    def read(self, size):
+        return self._chunks.pop(0) if self._chunks else b""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+def _recognizer():
+    recognizer = sr.Recognizer()
+    recognizer.energy_threshold = 300
+    recognizer.dynamic_energy_threshold = False
+    return recognizer
+
+
+def test_ring_buffer_wraps_around():
+    ring = AudioRingBuffer(capacity=8)
+    ring.write(b"abcdef")
+    ring.write(b"ghij")
+    assert ring.written == 10
+    assert ring.oldest == 2
+    assert ring.read(4, 6) == b"efghij"
+    with pytest.raises(ValueError):
+        ring.read(0, 4)
+
+
+def test_ring_buffer_read_returns_none_when_closed():
+    ring = AudioRingBuffer(capacity=8)
+    ring.write(b"ab")
+    ring.close()
+    assert ring.read(0, 4) is None
+    assert ring.read(0, 2) == b"ab"
+
+
+def test_listen_slices_phrase_with_pre_roll():
+    chunks = [SILENCE] * 10 + [SPEECH] * 5 + [SILENCE] * 12
+    capture = AudioCapture(_recognizer(), source_factory=lambda: FakeMicrophone(chunks),
+                           buffer_seconds=30, pre_roll_seconds=0.2)
+    capture.start()
+    try:
+        audio = capture.listen(timeout=5)
+    finally:
+        capture.stop()
+
+    assert isinstance(audio, sr.AudioData)
+    assert audio.sample_rate == 16000
+    # 2 pre-roll chunks + 5 speech chunks + vad_padding_seconds (0.2 s) of trailing silence
+    assert len(audio.frame_data) == 9 * CHUNK * 2
+    assert audio.frame_data[:2 * CHUNK * 2] == SILENCE * 2
+    assert audio.frame_data[2 * CHUNK * 2:7 * CHUNK * 2] == SPEECH * 5
+
+
+def test_listen_times_out_without_speech():
+    capture = AudioCapture(_recognizer(), source_factory=lambda: FakeMicrophone([SILENCE] * 20))
+    capture.start()
+    try:
+        with pytest.raises(sr.WaitTimeoutError):
+            capture.listen(timeout=0.5)
+    finally:
+        capture.stop()
+
+
+def test_flush_discards_captured_audio():
+    chunks = [SPEECH] * 5 + [SILENCE] * 12
+    capture = AudioCapture(_recognizer(), source_factory=lambda: FakeMicrophone(chunks))
+    capture.start()
+    capture._thread.join(timeout=2)  # wait until the scripted stream is fully buffered
+    capture.flush()
+    with pytest.raises(AudioDeviceError):
+        capture.listen(timeout=5)
+
+
+def test_start_raises_audio_device_error():
+    def broken_microphone():
+        raise OSError("No Default Input Device Available")
+
+    capture = AudioCapture(_recognizer(), source_factory=broken_microphone)
+    with pytest.raises(AudioDeviceError):
+        capture.start()
+    assert not capture.running
+
+
+def test_listen_drops_bursts_without_enough_speech():
+    # A 0.1 s click, then a real phrase
+    chunks = [SILENCE] * 3 + [SPEECH] + [SILENCE] * 10 + [SPEECH] * 4 + [SILENCE] * 10
+    capture = AudioCapture(_recognizer(), source_factory=lambda: FakeMicrophone(chunks),
+                           pre_roll_seconds=0)
+    capture.start()
+    try:
+        audio = capture.listen(timeout=5)
+    finally:
+        capture.stop()
+
+    assert audio.frame_data.startswith(SPEECH * 4)
+    assert len(audio.frame_data) == 6 * CHUNK * 2
+
+
+def test_listen_ends_phrase_after_vad_silence():
+    # The utterance must end ~0.5 s after speech stops, long before the stream does
+    chunks = [SPEECH] * 5 + [SILENCE] * 6 + [SPEECH] * 20 + [SILENCE] * 10
+    capture = AudioCapture(_recognizer(), source_factory=lambda: FakeMicrophone(chunks),
+                           pre_roll_seconds=0)
+    capture.start()
+    try:
+        first = capture.listen(timeout=5)
+        second = capture.listen(timeout=5)
+    finally:
+        capture.stop()
+
+    assert len(first.frame_data) == 7 * CHUNK * 2
+    assert second.frame_data.startswith(SPEECH * 20)
+
+
+def test_listen_reports_growing_partials_while_speaking():
+    chunks = [SILENCE] * 3 + [SPEECH] * 10 + [SILENCE] * 10
+    capture = AudioCapture(_recognizer(), source_factory=lambda: FakeMicrophone(chunks),
+                           pre_roll_seconds=0)
+    partials = []
+    capture.start()
+    try:
+        audio = capture.listen(timeout=5, on_partial=lambda start, a: partials.append((start, a)),
+                               partial_interval=0.3)
+    finally:
+        capture.stop()
+
+    # Reported every 0.3 s of speech, never during the trailing silence
+    assert [len(a.frame_data) // (CHUNK * 2) for _, a in partials] == [3, 6, 9]
+    assert len({start for start, _ in partials}) == 1
+    assert audio.frame_data.startswith(partials[-1][1].frame_data)
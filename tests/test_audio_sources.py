@@ -0,0 +1,102 @@
+import numpy as np
+import pytest
+import speech_recognition as sr
+
+from stuart_ai.core.config import settings
+from stuart_ai.services.audio_capture import AudioCapture
+from stuart_ai.services.audio_sources import ReplaySource, UtteranceRecorder, build_audio_capture, capture_for_source
+from stuart_ai.utils.audio_corpus import corpus_entries, next_entry, read_sidecar, write_sidecar, write_wav
+
+
+def _tone(seconds, amplitude=0.3):
+    t = np.arange(int(seconds * 16000)) / 16000
+    return (np.sin(2 * np.pi * 220 * t) * amplitude).astype(np.float32)
+
+
+def _corpus(tmp_path, durations):
+    for index, seconds in enumerate(durations):
+        base = str(tmp_path / f"{index:04d}")
+        write_wav(base + ".wav", _tone(seconds))
+        write_sidecar(base, {"text": f"frase {index}", "wake": index == 0})
+    return str(tmp_path)
+
+
+def _recognizer():
+    recognizer = sr.Recognizer()
+    recognizer.energy_threshold = 300
+    recognizer.dynamic_energy_threshold = False
+    return recognizer
+
+
+def test_replay_feeds_corpus_through_capture_as_fast_as_possible(tmp_path):
+    source = ReplaySource(_corpus(tmp_path, [0.6, 1.0]), speed=None, gap_seconds=0.8)
+    capture = AudioCapture(_recognizer(), source_factory=lambda: source, pre_roll_seconds=0,
+                           buffer_seconds=2, lossless=True)
+    capture.start()
+    try:
+        first = capture.listen(timeout=5)
+        second = capture.listen(timeout=5)
+    finally:
+        capture.stop()
+
+    seconds = [len(a.frame_data) / (a.sample_rate * a.sample_width) for a in (first, second)]
+    # Speech plus at most a chunk of onset slack and the VAD padding
+    assert 0.6 <= seconds[0] < 0.9
+    assert 1.0 <= seconds[1] < 1.3
+    assert [u.name for u in source.timeline] == ["0000", "0001"]
+    assert source.timeline[0].meta["wake"] is True
+    assert all(u.started_at <= u.ended_at for u in source.timeline)
+
+
+def test_replay_idles_with_silence_after_the_corpus(tmp_path):
+    source = ReplaySource(_corpus(tmp_path, [0.1]), speed=None, gap_seconds=0.1)
+    with source:
+        data = b"".join(source.stream.read(1024) for _ in range(4))
+        assert source.finished.is_set()
+        assert source.timeline[0].ended_at is not None
+        assert source.stream.read(1024) == bytes(2048)
+    assert len(data) == 4 * 2048
+
+
+def test_recorder_numbers_entries_and_merges_annotations(tmp_path):
+    recorder = UtteranceRecorder(str(tmp_path))
+    audio = sr.AudioData(b"\x00\x01" * 8000, 16000, 2)
+    first = recorder.record(audio, listen_ms=12.5)
+    second = recorder.record(audio)
+    recorder.annotate(first, transcript="Stuart, que horas são?")
+
+    assert [e.rsplit("/", 1)[-1] for e in corpus_entries(str(tmp_path))] == ["0000", "0001"]
+    assert second.endswith("0001")
+    meta = read_sidecar(first)
+    assert meta["duration"] == 0.5
+    assert meta["listen_ms"] == 12.5
+    assert meta["transcript"] == "Stuart, que horas são?"
+    assert next_entry(str(tmp_path)).endswith("0002")
+
+
+def test_build_audio_capture_modes(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "audio_corpus_dir", str(tmp_path))
+
+    capture, recorder = build_audio_capture(_recognizer())
+    assert capture.source_factory is sr.Microphone and recorder is None
+
+    monkeypatch.setattr(settings, "audio_source", "capture")
+    capture, recorder = build_audio_capture(_recognizer())
+    assert capture.source_factory is sr.Microphone and isinstance(recorder, UtteranceRecorder)
+
+    monkeypatch.setattr(settings, "audio_source", "replay")
+    monkeypatch.setattr(settings, "audio_replay_speed", 0)
+    capture, recorder = build_audio_capture(_recognizer())
+    assert isinstance(capture.source_factory(), ReplaySource)
+    assert capture.lossless and recorder is None
+
+
+def test_capture_for_session_sources(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "audio_replay_speed", 0)
+
+    assert capture_for_source(_recognizer(), "mic").source_factory is sr.Microphone
+    replay = capture_for_source(_recognizer(), f"replay:{_corpus(tmp_path, [0.5])}")
+    assert isinstance(replay.source_factory(), ReplaySource) and replay.lossless
+
+    with pytest.raises(ValueError):
+        capture_for_source(_recognizer(), "bluetooth:1")
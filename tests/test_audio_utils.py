@@ -1,6 +1,12 @@
 import sys
 import os
-from stuart_ai.utils.audio_utils import ignore_stderr
+import numpy as np
+import pytest
+import speech_recognition as sr
+from unittest.mock import MagicMock
+from stuart_ai.utils.audio_utils import (
+    ignore_stderr, pcm_to_float32, audio_data_to_float32, resample, greedy_transcribe,
+)
 
 def test_ignore_stderr():
     """Test that ignore_stderr context manager enters and exits correctly."""
@@ -25,3 +31,55 @@ def test_ignore_stderr():
         
     finally:
         os.close(original_stderr_fd)
+
+
+def test_pcm_to_float32_int16_scaling():
+    pcm = np.array([0, 16384, -32768, 32767], dtype="<i2").tobytes()
+    samples = pcm_to_float32(pcm, sample_width=2, sample_rate=16000)
+    assert samples.dtype == np.float32
+    np.testing.assert_allclose(samples, [0.0, 0.5, -1.0, 32767 / 32768], rtol=1e-6)
+
+
+def test_pcm_to_float32_other_widths():
+    eight_bit = pcm_to_float32(bytes([128, 255, 0]), sample_width=1, sample_rate=16000)
+    np.testing.assert_allclose(eight_bit, [0.0, 127 / 128, -1.0], rtol=1e-6)
+
+    # 24-bit little-endian: 0x400000 is half scale
+    twenty_four = pcm_to_float32(b"\x00\x00\x40\x00\x00\xc0", sample_width=3, sample_rate=16000)
+    np.testing.assert_allclose(twenty_four, [0.5, -0.5], rtol=1e-6)
+
+    with pytest.raises(ValueError):
+        pcm_to_float32(b"\x00" * 10, sample_width=5, sample_rate=16000)
+
+
+def test_resample_to_whisper_rate():
+    one_second_48k = np.ones(48000, dtype=np.float32)
+    assert resample(one_second_48k, 48000).shape == (16000,)
+
+    one_second_44k = np.linspace(-1, 1, 44100, dtype=np.float32)
+    resampled = resample(one_second_44k, 44100)
+    assert resampled.shape == (16000,)
+    assert resampled.dtype == np.float32
+
+
+def test_audio_data_to_float32():
+    audio = sr.AudioData(np.full(3200, 8192, dtype="<i2").tobytes(), 32000, 2)
+    samples = audio_data_to_float32(audio)
+    assert samples.shape == (1600,)
+    np.testing.assert_allclose(samples, 0.25)
+
+
+def test_greedy_transcribe_decodes_in_one_pass():
+    model = MagicMock()
+    model.transcribe.return_value = ([MagicMock(text=" Stuart,"), MagicMock(text=" pare. ")], None)
+    samples = np.zeros(16000, dtype=np.float32)
+
+    text = greedy_transcribe(model, samples, "Stuart, pare.", 12, hotwords="pare")
+
+    assert text == "Stuart,  pare."
+    kwargs = model.transcribe.call_args.kwargs
+    assert model.transcribe.call_args.args[0] is samples
+    assert (kwargs["beam_size"], kwargs["best_of"], kwargs["temperature"]) == (1, 1, 0.0)
+    assert kwargs["without_timestamps"] is True
+    assert kwargs["condition_on_previous_text"] is False
+    assert (kwargs["initial_prompt"], kwargs["max_new_tokens"], kwargs["hotwords"]) == ("Stuart, pare.", 12, "pare")
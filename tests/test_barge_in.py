@@ -0,0 +1,206 @@
+import asyncio
+import time
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+import speech_recognition as sr
+
+from stuart_ai.core.assistant import Assistant, CapturedUtterance
+from stuart_ai.core.enums import AssistantSignal
+from stuart_ai.core.state import AssistantContext, AssistantStatus
+from stuart_ai.services.barge_in import BargeInDetector, BargeInKind
+from stuart_ai.services.tts_playback import AudioPlayer
+from stuart_ai.services.wake_word import WakeWordMatcher
+
+SPEECH = sr.AudioData(b"\x00\x10" * 16000 * 3, 16000, 2)
+RATE = 24000
+
+
+def _segments(text):
+    segment = MagicMock()
+    segment.text = text
+    return [segment], None
+
+
+def _detector(model=None):
+    return BargeInDetector(model or MagicMock(), WakeWordMatcher(["stuart"], 80),
+                           stop_words=["pare", "chega", "silêncio"], window_seconds=2.0)
+
+
+def test_classify_tells_stop_requests_and_commands_apart():
+    detector = _detector()
+
+    assert detector.classify("Pare!") is BargeInKind.STOP
+    assert detector.classify("Stuart, silencio.") is BargeInKind.STOP
+    assert detector.classify("Stewart, que horas são?") is BargeInKind.COMMAND
+    # The assistant's own sentences are long: a stop word inside them does not count
+    assert detector.classify("O trânsito pare de piorar depois das seis da tarde") is None
+    assert detector.classify("bom dia") is None
+    assert detector.classify("") is None
+
+
+def test_reply_that_says_the_name_does_not_interrupt_itself():
+    detector = _detector()
+    reply = "Olá, eu sou o Stuart, seu assistente pessoal."
+
+    # The speakers heard through the microphone
+    assert detector.classify("Eu sou o Stuart, seu assistente", speaking=reply) is None
+    assert detector.classify("Stuart.", speaking=reply) is None
+    # The user talking over it
+    assert detector.classify("Stuart, abre o navegador", speaking=reply) is BargeInKind.COMMAND
+    assert detector.classify("Stuart, pare", speaking=reply) is BargeInKind.STOP
+    # A reply without the name cannot be mistaken for it
+    assert detector.classify("Stuart, que horas são?", speaking="São três horas.") is BargeInKind.COMMAND
+
+
+def test_only_the_end_of_the_audio_is_decoded():
+    model = MagicMock()
+    model.transcribe.return_value = _segments(" pare")
+    detector = _detector(model)
+
+    kind, text = detector.detect(np.zeros(16000 * 5, dtype=np.float32))
+
+    assert (kind, text) == (BargeInKind.STOP, "pare")
+    window = model.transcribe.call_args.args[0]
+    assert window.size == 16000 * 2
+    assert model.transcribe.call_args.kwargs["beam_size"] == 1
+
+
+class SlowOutput:
+    """Real-time output stream that records what reached the speakers."""
+
+    def __init__(self):
+        self.written = bytearray()
+
+    def write(self, data):
+        time.sleep(len(data) / 2 / RATE)
+        self.written += data
+
+    def close(self):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_cancelled_speech_stops_within_a_block(mp3_tone):
+    output = SlowOutput()
+    assistant = Assistant(MagicMock(), MagicMock(), MagicMock(), MagicMock(), MagicMock(), MagicMock(), MagicMock(),
+                          audio_player=AudioPlayer(stream_factory=lambda: output))
+
+    async def synthesize(text):
+        yield mp3_tone(3.0)
+
+    assistant._synthesize = synthesize
+    try:
+        task = asyncio.create_task(assistant.speak("Uma resposta bem longa."))
+        while not output.written:
+            await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        played = len(output.written)
+        await asyncio.sleep(0.3)
+
+        # At most the block being written when the reply was cancelled
+        assert len(output.written) - played <= AudioPlayer.CHUNK * 2
+        assert assistant.audio_player.buffered_seconds == 0
+        assert assistant.context.status is AssistantStatus.LISTENING
+        assert len(assistant.context.speaking_intervals) == 1
+    finally:
+        assistant.audio_player.close()
+
+
+@pytest.fixture
+def assistant():
+    model = MagicMock()
+    assistant = Assistant(MagicMock(), MagicMock(), MagicMock(), MagicMock(), MagicMock(),
+                          model, MagicMock(), context=AssistantContext(), wake_model=model)
+    assistant.wake_gate = None
+    return assistant
+
+
+def _speaking_command(assistant, cancelled):
+    """handle_command replacement: the first command speaks until it is cancelled, the next one quits."""
+    calls = []
+
+    async def handle_command(text):
+        calls.append(text)
+        if len(calls) > 1:
+            return AssistantSignal.QUIT
+        assistant.context.set_status(AssistantStatus.SPEAKING)
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.set()
+            assistant.context.set_status(AssistantStatus.LISTENING)
+            raise
+
+    return handle_command
+
+
+@pytest.mark.asyncio
+async def test_stop_word_interrupts_the_reply_and_the_next_command_runs(assistant):
+    cancelled = asyncio.Event()
+    assistant.handle_command = _speaking_command(assistant, cancelled)
+    assistant.model.transcribe.return_value = _segments(" Pare.")
+    command_queue, barge_in_queue, audio_queue = asyncio.Queue(), asyncio.Queue(maxsize=1), asyncio.Queue()
+    barge_in = asyncio.create_task(assistant._barge_in_stage(barge_in_queue, audio_queue))
+    executing = asyncio.create_task(assistant._execute_stage(command_queue))
+    try:
+        await command_queue.put(CapturedUtterance(np.zeros(1), time.monotonic(), "stuart, me conte uma história"))
+        while not assistant._barge_in_armed():
+            await asyncio.sleep(0.01)
+
+        await barge_in_queue.put((SPEECH, time.monotonic(), False))
+        await asyncio.wait_for(cancelled.wait(), timeout=2)
+        await command_queue.put(CapturedUtterance(np.zeros(1), time.monotonic(), "stuart, sair"))
+        await asyncio.wait_for(executing, timeout=2)
+    finally:
+        barge_in.cancel()
+        await asyncio.gather(barge_in, return_exceptions=True)
+
+    assert assistant.context.interruptions == 1
+    assert assistant.context.pipeline_stats()["interruptions"] == 1
+    assert assistant.context.status is AssistantStatus.LISTENING
+    # A stop request is not a command of its own
+    assert audio_queue.empty()
+
+
+@pytest.mark.asyncio
+async def test_wake_word_in_a_finished_phrase_goes_to_transcription(assistant):
+    cancelled = asyncio.Event()
+    assistant.handle_command = _speaking_command(assistant, cancelled)
+    assistant.model.transcribe.return_value = _segments(" Stuart, que horas são?")
+    command_queue, barge_in_queue, audio_queue = asyncio.Queue(), asyncio.Queue(maxsize=1), asyncio.Queue()
+    barge_in = asyncio.create_task(assistant._barge_in_stage(barge_in_queue, audio_queue))
+    executing = asyncio.create_task(assistant._execute_stage(command_queue))
+    try:
+        await command_queue.put(CapturedUtterance(np.zeros(1), time.monotonic(), "stuart, leia as notícias"))
+        while not assistant._barge_in_armed():
+            await asyncio.sleep(0.01)
+
+        await barge_in_queue.put((SPEECH, time.monotonic(), True))
+        utterance = await asyncio.wait_for(audio_queue.get(), timeout=2)
+    finally:
+        for task in (barge_in, executing):
+            task.cancel()
+        await asyncio.gather(barge_in, executing, return_exceptions=True)
+
+    assert cancelled.is_set()
+    assert utterance.samples.size == 16000 * 2
+    assert assistant.context.interruptions == 1
+
+
+@pytest.mark.asyncio
+async def test_speech_outside_a_reply_is_not_checked(assistant):
+    barge_in_queue, audio_queue = asyncio.Queue(maxsize=1), asyncio.Queue()
+    barge_in = asyncio.create_task(assistant._barge_in_stage(barge_in_queue, audio_queue))
+    try:
+        await barge_in_queue.put((SPEECH, time.monotonic(), False))
+        await asyncio.sleep(0.05)
+    finally:
+        barge_in.cancel()
+        await asyncio.gather(barge_in, return_exceptions=True)
+
+    assistant.model.transcribe.assert_not_called()
+    assert assistant.context.interruptions == 0
@@ -140,6 +140,14 @@ async def test_semantic_route_general_chat(command_handler_fixture):
     
     mock_speak.assert_called_once_with("Entendi. Como posso ajudar com isso?")
 
+def test_is_instant_command_only_for_argumentless_routes(command_handler_fixture):
+    handler, _, _ = command_handler_fixture
+    assert handler.is_instant_command("que horas são")
+    assert handler.is_instant_command("Aumentar volume")
+    # open_app needs its argument, which may still be coming
+    assert not handler.is_instant_command("abra o navegador")
+    assert not handler.is_instant_command("pesquise sobre gatos")
+
 @pytest.mark.asyncio
 async def test_extract_argument_removes_articles(command_handler_fixture):
     """Tests that _extract_argument correctly removes articles from the beginning."""
@@ -0,0 +1,68 @@
+from unittest.mock import MagicMock, AsyncMock
+
+import numpy as np
+import pytest
+
+from stuart_ai.core.assistant import Assistant
+from stuart_ai.services.confirmation import ConfirmationAnswer, ConfirmationRecognizer
+
+
+def _model(*texts):
+    model = MagicMock()
+    results = []
+    for text in texts:
+        segment = MagicMock()
+        segment.text = text
+        results.append(([segment], None))
+    model.transcribe.side_effect = results
+    return model
+
+
+@pytest.mark.parametrize("text, answer", [
+    (" Sim.", ConfirmationAnswer.YES),
+    (" Sim, pode desligar.", ConfirmationAnswer.YES),
+    (" Confirmo", ConfirmationAnswer.YES),
+    (" Não!", ConfirmationAnswer.NO),
+    (" nao", ConfirmationAnswer.NO),
+    (" Cancela.", ConfirmationAnswer.NO),
+    (" Sim, quer dizer, não.", ConfirmationAnswer.UNCLEAR),
+    (" O que você disse?", ConfirmationAnswer.UNCLEAR),
+    ("", ConfirmationAnswer.UNCLEAR),
+])
+def test_classify(text, answer):
+    recognizer = ConfirmationRecognizer(MagicMock(), min_score=80)
+    assert recognizer.classify(text).answer is answer
+
+
+def test_classify_reports_confidence_of_fuzzy_match():
+    recognizer = ConfirmationRecognizer(MagicMock(), min_score=80)
+    exact = recognizer.classify("sim")
+    fuzzy = recognizer.classify("simm")
+    assert exact.confidence == 1.0
+    assert fuzzy.answer is ConfirmationAnswer.YES
+    assert 0.8 <= fuzzy.confidence < 1.0
+
+
+def test_decode_only_reads_the_start_of_the_reply():
+    model = _model(" sim")
+    recognizer = ConfirmationRecognizer(model, window_seconds=2.0)
+    result = recognizer.recognize(np.zeros(16000 * 5, dtype=np.float32))
+
+    assert result.answer is ConfirmationAnswer.YES
+    args, kwargs = model.transcribe.call_args
+    assert args[0].shape == (32000,)
+    assert kwargs["max_new_tokens"] == 6
+    assert kwargs["temperature"] == 0.0
+
+
+@pytest.mark.asyncio
+async def test_unclear_reply_is_asked_once_more():
+    whisper = _model(" hein?", " não")
+    assistant = Assistant(MagicMock(), MagicMock(), MagicMock(), MagicMock(), MagicMock(), whisper, MagicMock())
+    assistant.speak = AsyncMock()
+    assistant.capture = MagicMock()
+    assistant.capture.listen.return_value = np.zeros(1600, dtype=np.float32)
+
+    assert await assistant.listen_for_confirmation("Tem certeza?") is False
+    prompts = [call.args[0] for call in assistant.speak.call_args_list]
+    assert prompts == ["Tem certeza?", "Não entendi. Responda sim ou não."]
@@ -0,0 +1,110 @@
+import time
+
+import numpy as np
+import speech_recognition as sr
+
+from stuart_ai.core.state import AssistantContext, AssistantStatus
+from stuart_ai.services.echo_suppression import EchoSuppressor, correlation_peak
+
+RATE = 16000
+
+
+def _audio(seconds, seed=0):
+    samples = np.random.default_rng(seed).normal(0, 0.1, int(seconds * RATE)).astype(np.float32)
+    return samples
+
+
+def _as_audio_data(samples):
+    pcm = (np.clip(samples, -1, 1) * 32767).astype("<i2").tobytes()
+    return sr.AudioData(pcm, RATE, 2)
+
+
+def test_context_records_speaking_intervals():
+    context = AssistantContext()
+    context.set_status(AssistantStatus.SPEAKING)
+    assert context.speaking_since is not None
+    context.set_status(AssistantStatus.LISTENING)
+
+    assert context.speaking_since is None
+    (start, end), = context.speaking_intervals
+    assert start <= end
+
+
+def test_correlation_peak_finds_a_delayed_copy():
+    reference = _audio(2.0)
+    echo = 0.3 * reference[8000:24000]
+
+    assert correlation_peak(echo, reference) > 0.99
+    assert correlation_peak(_audio(1.0, seed=1), reference) < 0.1
+    assert correlation_peak(np.zeros(0, dtype=np.float32), reference) == 0.0
+
+
+def test_phrase_inside_playback_is_discarded():
+    context = AssistantContext()
+    now = time.monotonic()
+    context.speaking_intervals.append((now - 3.0, now - 0.5))
+    suppressor = EchoSuppressor(context, half_duplex=True, tail_seconds=0.3, filter_enabled=False)
+
+    # 2 s phrase ending now: started during playback, 0.2 s left after the echo tail
+    assert suppressor.process(_as_audio_data(_audio(2.0)), now, min_speech_seconds=0.25) is None
+    # Dropped for its timing only: may still be the user cutting in
+    assert not suppressor.matched_echo
+
+
+def test_phrase_overlapping_playback_end_is_trimmed():
+    context = AssistantContext()
+    now = time.monotonic()
+    context.speaking_intervals.append((now - 3.0, now - 1.3))
+    suppressor = EchoSuppressor(context, half_duplex=True, tail_seconds=0.3, filter_enabled=False)
+
+    audio = suppressor.process(_as_audio_data(_audio(2.0)), now, min_speech_seconds=0.25)
+
+    # Playback + tail ended 1.0 s ago: only that last second is kept
+    assert abs(len(audio.frame_data) - RATE * 2) <= 2
+
+
+def test_phrase_after_playback_passes_untouched():
+    context = AssistantContext()
+    now = time.monotonic()
+    context.speaking_intervals.append((now - 10.0, now - 5.0))
+    suppressor = EchoSuppressor(context, half_duplex=True, tail_seconds=0.3, filter_enabled=False)
+    original = _as_audio_data(_audio(1.0))
+
+    assert suppressor.process(original, now) is original
+
+
+def test_echo_filter_drops_the_assistants_voice_but_keeps_the_user():
+    context = AssistantContext()
+    suppressor = EchoSuppressor(context, half_duplex=False, filter_enabled=True,
+                                correlation_threshold=0.5, max_delay_seconds=0.5)
+    now = time.monotonic()
+    reference = _audio(3.0)
+    suppressor.add_reference(reference, started_at=now - 3.0)
+
+    # Mic heard the second half of the playback, 0.1 s late and attenuated
+    heard = 0.5 * reference[int(1.4 * RATE):int(2.9 * RATE)]
+    assert suppressor.process(_as_audio_data(heard), now) is None
+    assert suppressor.matched_echo
+
+    user = _audio(1.5, seed=7)
+    assert suppressor.process(_as_audio_data(user), now) is not None
+    assert not suppressor.matched_echo
+
+
+def test_barge_in_releases_the_phrase_from_where_the_user_cut_in():
+    context = AssistantContext()
+    now = time.monotonic()
+    context.speaking_intervals.append((now - 4.0, now - 0.5))
+    suppressor = EchoSuppressor(context, half_duplex=True, tail_seconds=0.3, filter_enabled=False)
+
+    suppressor.release_from(now - 1.5)
+    audio = suppressor.process(_as_audio_data(_audio(3.0)), now, min_speech_seconds=0.25)
+
+    # Kept from the barge-in on, not from the end of the interrupted speech
+    assert abs(len(audio.frame_data) - RATE * 2 * 1.5) <= 2
+
+
+def test_explicit_zero_correlation_threshold_is_kept():
+    suppressor = EchoSuppressor(AssistantContext(), correlation_threshold=0.0)
+
+    assert suppressor.correlation_threshold == 0.0
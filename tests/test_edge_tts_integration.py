@@ -2,6 +2,7 @@ import pytest
 from unittest.mock import MagicMock, AsyncMock, patch
 from stuart_ai.core.assistant import Assistant
 from stuart_ai.core.config import settings
+from stuart_ai.services.tts_playback import AudioPlayer
 
 @pytest.fixture
 def mock_components():
@@ -14,29 +15,110 @@ def mock_components():
     recognizer = MagicMock()
     return llm, web, rag, router, memory, whisper, recognizer
 
+def _streamed(*chunks):
+    """Stand-in for ``Communicate.stream()``: metadata plus the given audio chunks."""
+    async def stream():
+        yield {"type": "WordBoundary", "offset": 0, "duration": 0, "text": "Olá"}
+        for chunk in chunks:
+            yield {"type": "audio", "data": chunk}
+    return stream
+
+
+class _RecordingPlayer:
+    """AudioPlayer stand-in that collects the PCM it is given."""
+    sample_rate = 24000
+    running = True
+
+    def __init__(self):
+        self.pcm = bytearray()
+        self.flushed = False
+
+    async def enqueue(self, pcm):
+        self.pcm += pcm
+
+    async def flush(self):
+        self.flushed = True
+
+    def interrupt(self):
+        pass
+
+    def close(self):
+        pass
+
+
 @pytest.mark.asyncio
-async def test_speak_uses_edge_tts(mock_components, mocker):
+async def test_speak_uses_edge_tts(mock_components, mocker, mp3_tone):
     llm, web, rag, router, memory, whisper, recognizer = mock_components
-    
-    assistant = Assistant(llm, web, rag, router, memory, whisper, recognizer)
-    
-    # Mock subprocess to avoid playing audio
-    mocker.patch("asyncio.create_subprocess_exec", new_callable=AsyncMock)
-    mocker.patch("stuart_ai.core.assistant.subprocess.DEVNULL")
+    player = _RecordingPlayer()
+    assistant = Assistant(llm, web, rag, router, memory, whisper, recognizer, audio_player=player)
+    spawn = mocker.patch("asyncio.create_subprocess_exec", new_callable=AsyncMock)
     
     # Mock edge_tts
+    mp3 = mp3_tone(0.5)
     mock_communicate = MagicMock()
-    mock_communicate.save = AsyncMock()
+    mock_communicate.stream = _streamed(mp3[:1000], mp3[1000:])
     
     # We need to patch the class constructor to return our mock instance
-    with patch("stuart_ai.core.assistant.edge_tts.Communicate", return_value=mock_communicate) as mock_cls:
+    with patch("stuart_ai.services.tts_backends.edge_tts.Communicate", return_value=mock_communicate) as mock_cls:
         await assistant.speak("Olá mundo")
         
         # Verify constructor call
-        mock_cls.assert_called_with("Olá mundo", "pt-BR-AntonioNeural")
-        
-        # Verify save call
-        assert mock_communicate.save.called
-        # Check args passed to save (temp file path)
-        args, _ = mock_communicate.save.call_args
-        assert args[0].endswith(".mp3")
+        mock_cls.assert_called_with("Olá mundo", "pt-BR-AntonioNeural", rate="+0%")
+
+    # Decoded into the long-lived player, no process spawned and no temp file
+    spawn.assert_not_called()
+    assert 0.5 <= len(player.pcm) / 2 / player.sample_rate < 0.6
+    assert player.flushed
+    assert assistant.context.stage_timings["tts_first_audio"].count == 1
+
+
+@pytest.mark.asyncio
+async def test_speak_falls_back_to_playsound_without_audio_output_or_mpg123(mock_components, mocker, tmp_path):
+    llm, web, rag, router, memory, whisper, recognizer = mock_components
+
+    def no_device():
+        raise OSError("no default output device")
+
+    assistant = Assistant(llm, web, rag, router, memory, whisper, recognizer,
+                          audio_player=AudioPlayer(stream_factory=no_device))
+    mocker.patch("stuart_ai.services.tts_playback.platform.system", return_value="Linux")
+    mocker.patch("asyncio.create_subprocess_exec", side_effect=FileNotFoundError("mpg123"))
+    mocker.patch("stuart_ai.services.tts_playback.settings.temp_dir", str(tmp_path))
+    played = []
+    mocker.patch("stuart_ai.services.tts_playback.playsound",
+                 side_effect=lambda path: played.append(open(path, "rb").read()))
+
+    mock_communicate = MagicMock()
+    mock_communicate.stream = _streamed(b"abc", b"def")
+    with patch("stuart_ai.services.tts_backends.edge_tts.Communicate", return_value=mock_communicate):
+        await assistant.speak("Olá mundo")
+
+    assert played == [b"abcdef"]
+    assert not list(tmp_path.iterdir())
+
+
+@pytest.mark.asyncio
+async def test_speak_streams_to_mpg123_without_audio_output(mock_components, mocker):
+    llm, web, rag, router, memory, whisper, recognizer = mock_components
+
+    def no_device():
+        raise OSError("no default output device")
+
+    assistant = Assistant(llm, web, rag, router, memory, whisper, recognizer,
+                          audio_player=AudioPlayer(stream_factory=no_device))
+    mocker.patch("stuart_ai.services.tts_playback.platform.system", return_value="Linux")
+    proc = MagicMock()
+    proc.stdin.drain = AsyncMock()
+    proc.wait = AsyncMock(return_value=0)
+    spawn = mocker.patch("asyncio.create_subprocess_exec", new_callable=AsyncMock, return_value=proc)
+    playsound = mocker.patch("stuart_ai.services.tts_playback.playsound")
+
+    mock_communicate = MagicMock()
+    mock_communicate.stream = _streamed(b"abc", b"def")
+    with patch("stuart_ai.services.tts_backends.edge_tts.Communicate", return_value=mock_communicate):
+        await assistant.speak("Olá mundo")
+
+    assert spawn.call_args.args[:3] == ("mpg123", "-q", "-")
+    assert [c.args[0] for c in proc.stdin.write.call_args_list] == [b"abc", b"def"]
+    proc.stdin.close.assert_called_once()
+    playsound.assert_not_called()
@@ -1,4 +1,4 @@
-from thefuzz import process, fuzz
+from rapidfuzz import process, fuzz
 
 def test_fuzzy_wake_word_matching():
     keyword = "stuart"
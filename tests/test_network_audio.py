@@ -0,0 +1,248 @@
+import asyncio
+import socket
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+import uvicorn
+from fastapi.testclient import TestClient
+
+from stuart_ai.api import app as api
+from stuart_ai.core.assistant import Assistant
+from stuart_ai.core.config import settings
+from stuart_ai.core.state import AssistantContext
+from stuart_ai.services.audio_client import AudioClient
+from stuart_ai.services.network_audio import AudioSession, NetworkAudioSource, ProtocolError, parse_hello
+
+CHUNK_BYTES = NetworkAudioSource.CHUNK * 2
+
+
+class _EchoAssistant:
+    """Stands in for Assistant: answers the first chunk it hears with a fake reply."""
+
+    def __init__(self, name, recognizer, capture, speech_output):
+        self.context = AssistantContext(session=name)
+        self.recognizer = recognizer
+        self.capture = capture
+        self.speech_output = speech_output
+        self.replied = asyncio.Event()
+
+    async def listen_continuously(self):
+        await asyncio.to_thread(self.capture.start)
+        try:
+            chunk = await asyncio.to_thread(self.capture._read_chunk)  # pylint: disable=protected-access
+            await self.speech_output(b"reply:" + chunk[:2])
+            self.replied.set()
+            await asyncio.Event().wait()
+        finally:
+            self.capture.stop()
+
+
+TOKEN = "segredo"
+
+
+@pytest.fixture
+def network_api(monkeypatch):
+    monkeypatch.setattr(settings, "network_audio_token", TOKEN)
+    assistants = []
+
+    def factory(*args):
+        assistants.append(_EchoAssistant(*args))
+        return assistants[-1]
+
+    api.set_session_factory(factory)
+    api.set_sessions([])
+    yield assistants
+    api.set_session_factory(None)
+    api.set_sessions([])
+
+
+def test_network_source_reads_fed_chunks_then_ends_on_close():
+    source = NetworkAudioSource(16000)
+    with source:
+        source.feed(b"\x01\x00" * 1500)
+        assert source.stream.read(1024) == b"\x01\x00" * 1024
+
+        source.close()
+        # What was left is still delivered, then the stream ends
+        assert len(source.stream.read(1024)) == 476 * 2
+        assert source.stream.read(1024) == b""
+
+
+def test_network_source_read_waits_for_data():
+    source = NetworkAudioSource(16000)
+    threading.Timer(0.05, source.feed, args=(bytes(CHUNK_BYTES),)).start()
+
+    assert source.read(1024) == bytes(CHUNK_BYTES)
+
+
+def test_network_source_drops_the_oldest_audio_when_the_reader_falls_behind():
+    source = NetworkAudioSource(16000, max_pending_seconds=0.1)
+    source.feed(b"\x01\x00" * 1000)
+    source.feed(b"\x02\x00" * 1000)
+
+    # 0.1 s at 16 kHz: only the newest 1600 samples are kept, frame-aligned
+    assert source.read(1600) == b"\x01\x00" * 600 + b"\x02\x00" * 1000
+
+
+class _IdleWebSocket:
+    """WebSocket stand-in whose client sends nothing after the hello, and answers a close with a disconnect."""
+
+    def __init__(self):
+        self.closed_with = None
+        self._closed = asyncio.Event()
+
+    async def receive(self):
+        await self._closed.wait()
+        return {"type": "websocket.disconnect", "code": self.closed_with}
+
+    async def close(self, code=1000, reason=""):
+        self.closed_with = code
+        self._closed.set()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("listen, code", [(AsyncMock(return_value=None), 1000),
+                                          (AsyncMock(side_effect=RuntimeError("boom")), 1011)])
+async def test_session_closes_the_socket_when_the_assistant_stops(listen, code):
+    websocket = _IdleWebSocket()
+    session = AudioSession(websocket, assistant_factory=None, token=TOKEN)
+    session.source = NetworkAudioSource(16000)
+    session.assistant = MagicMock(listen_continuously=listen)
+
+    await asyncio.wait_for(session.run(), timeout=2)
+
+    assert websocket.closed_with == code
+    assert session.source.closed
+
+
+def test_parse_hello_validates_the_format():
+    assert parse_hello('{"type": "hello", "session": "sala", "sample_rate": 16000}') == ("sala", 16000, 2)
+    assert parse_hello('{"type": "hello", "sample_rate": 44100, "sample_width": 2}') == (None, 44100, 2)
+    for bad in ("", "not json", '{"type": "pcm"}', '{"type": "hello", "sample_rate": 12345}',
+                '{"type": "hello", "sample_rate": 16000, "sample_width": 4}'):
+        with pytest.raises(ProtocolError):
+            parse_hello(bad)
+
+
+def test_websocket_session_round_trip(network_api):
+    client = TestClient(api.app)
+    with client.websocket_connect("/ws/audio") as ws:
+        ws.send_json({"type": "hello", "token": TOKEN, "session": "cozinha", "sample_rate": 16000, "sample_width": 2})
+        assert ws.receive_json() == {"type": "ready", "session": "cozinha"}
+
+        ws.send_bytes(b"\x07\x00" * 1024)
+        assert ws.receive_bytes() == b"reply:\x07\x00"
+        assert [s["session"] for s in client.get("/sessions").json()["sessions"]] == ["cozinha"]
+        ws.send_json({"type": "played"})
+
+    # Disconnecting removes the session
+    deadline = time.monotonic() + 2
+    while client.get("/sessions").json()["sessions"] and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert client.get("/sessions").json()["sessions"] == []
+    assert network_api[0].context.session == "cozinha"
+
+
+def test_websocket_rejects_bad_hello_and_disabled_mode(network_api):
+    client = TestClient(api.app)
+    with client.websocket_connect("/ws/audio") as ws:
+        ws.send_json({"type": "hello", "token": TOKEN, "sample_rate": 11111})
+        assert ws.receive()["type"] == "websocket.close"
+    assert not network_api
+
+    api.set_session_factory(None)
+    with client.websocket_connect("/ws/audio") as ws:
+        assert ws.receive()["code"] == 1008
+
+
+@pytest.mark.parametrize("hello", [
+    {"type": "hello", "sample_rate": 16000},
+    {"type": "hello", "token": "errado", "sample_rate": 16000},
+    {"type": "hello", "token": None, "sample_rate": 16000},
+])
+def test_websocket_refuses_a_hello_without_the_token(network_api, hello):
+    client = TestClient(api.app)
+    with client.websocket_connect("/ws/audio") as ws:
+        ws.send_json(hello)
+        assert ws.receive()["code"] == 1008
+    assert not network_api
+
+
+def test_websocket_refuses_everyone_without_a_configured_token(network_api, monkeypatch):
+    monkeypatch.setattr(settings, "network_audio_token", "")
+    client = TestClient(api.app)
+    with client.websocket_connect("/ws/audio") as ws:
+        ws.send_json({"type": "hello", "token": "", "sample_rate": 16000})
+        assert ws.receive()["code"] == 1008
+    assert not network_api
+
+
+class _FakeMicrophone:
+    SAMPLE_RATE = 16000
+    SAMPLE_WIDTH = 2
+    CHUNK = 1024
+
+    def __init__(self):
+        self.stream = None
+
+    def __enter__(self):
+        self.stream = self
+        return self
+
+    def __exit__(self, *exc):
+        self.stream = None
+
+    def read(self, size):
+        time.sleep(0.01)
+        return b"\x05\x00" * size
+
+
+@pytest.mark.asyncio
+async def test_client_and_server_over_loopback(network_api):
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    port = sock.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(api.app, log_level="warning"))
+    thread = threading.Thread(target=server.run, kwargs={"sockets": [sock]}, daemon=True)
+    thread.start()
+    try:
+        while not server.started:
+            await asyncio.sleep(0.01)
+
+        played = []
+        client = AudioClient(f"ws://127.0.0.1:{port}/ws/audio", session="escritorio", token=TOKEN,
+                             source_factory=_FakeMicrophone, player=AsyncMock(side_effect=played.append))
+        task = asyncio.create_task(client.run())
+        for _ in range(200):
+            if played:
+                break
+            await asyncio.sleep(0.01)
+        assert played == [b"reply:\x05\x00"]
+        assert network_api[0].context.session == "escritorio"
+
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+    finally:
+        server.should_exit = True
+        thread.join(timeout=5)
+
+
+@pytest.mark.asyncio
+async def test_speak_hands_the_audio_to_speech_output(mocker):
+    create_subprocess = mocker.patch("asyncio.create_subprocess_exec", new_callable=AsyncMock)
+    speech_output = AsyncMock()
+    assistant = Assistant(MagicMock(), MagicMock(), MagicMock(), MagicMock(), MagicMock(), MagicMock(), MagicMock(),
+                          speech_output=speech_output)
+
+    async def stream():
+        yield {"type": "audio", "data": b"mp3 "}
+        yield {"type": "audio", "data": b"bytes"}
+
+    communicate = MagicMock(stream=stream)
+    with patch("stuart_ai.services.tts_backends.edge_tts.Communicate", return_value=communicate):
+        await assistant.speak("Olá")
+
+    speech_output.assert_awaited_once_with(b"mp3 bytes")
+    create_subprocess.assert_not_called()
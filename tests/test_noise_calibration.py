@@ -0,0 +1,94 @@
+import time
+from unittest.mock import MagicMock
+
+import numpy as np
+import speech_recognition as sr
+
+from stuart_ai.services.audio_capture import AudioCapture
+from stuart_ai.services.noise_calibration import NoiseCalibrator, frame_rms
+
+CHUNK = 1600  # 0.1 s at 16 kHz
+
+
+def _chunk(amplitude, seed=0):
+    rng = np.random.default_rng(seed)
+    return (rng.standard_normal(CHUNK) * amplitude).astype("<i2").tobytes()
+
+
+class SlowMicrophone:
+    """Endless scripted stream, ten times faster than real time."""
+
+    SAMPLE_RATE = 16000
+    SAMPLE_WIDTH = 2
+    CHUNK = CHUNK
+
+    def __init__(self, pattern):
+        self._pattern = pattern
+        self._index = 0
+        self.stream = self
+
+    def read(self, size):
+        time.sleep(0.01)
+        self._index += 1
+        return self._pattern[self._index % len(self._pattern)]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+def test_frame_rms_matches_raw_units():
+    data = np.full(CHUNK * 2, 1000, dtype="<i2").tobytes()
+    levels = frame_rms(data, 2, CHUNK)
+    assert levels.shape == (2,)
+    np.testing.assert_allclose(levels, 1000, rtol=1e-3)
+
+
+def test_noise_floor_ignores_sparse_speech():
+    capture = MagicMock()
+    capture.recognizer.energy_threshold = 4000
+    updates = []
+    calibrator = NoiseCalibrator(capture, percentile=20, ratio=2.0, on_update=updates.append)
+
+    # 8 s of room noise around 100 RMS with 2 s of loud speech mixed in
+    block = b"".join(_chunk(100, i) for i in range(80)) + b"".join(_chunk(5000, i) for i in range(20))
+    calibrator.feed(block, 2, CHUNK, frames_per_window=300)
+    calibrator.update()
+
+    assert 80 < calibrator.noise_floor < 110
+    assert capture.recognizer.energy_threshold == calibrator.noise_floor * 2.0
+    assert updates[-1]["noise_floor"] == round(calibrator.noise_floor, 1)
+
+
+def test_window_forgets_old_noise():
+    capture = MagicMock()
+    calibrator = NoiseCalibrator(capture, percentile=20, ratio=2.0)
+    calibrator.feed(b"".join(_chunk(1000, i) for i in range(50)), 2, CHUNK, frames_per_window=50)
+    calibrator.feed(b"".join(_chunk(100, i) for i in range(50)), 2, CHUNK, frames_per_window=50)
+    calibrator.update()
+    assert calibrator.noise_floor < 110
+
+
+def test_background_thread_follows_the_stream():
+    recognizer = sr.Recognizer()
+    recognizer.energy_threshold = 4000
+    pattern = [_chunk(200, i) for i in range(9)] + [_chunk(6000, 9)]
+    capture = AudioCapture(recognizer, source_factory=lambda: SlowMicrophone(pattern))
+    updates = []
+    calibrator = NoiseCalibrator(capture, window_seconds=5, update_seconds=0.3, percentile=20,
+                                 ratio=2.0, on_update=updates.append)
+    capture.start()
+    calibrator.start()
+    try:
+        deadline = time.monotonic() + 3
+        while len(updates) < 2 and time.monotonic() < deadline:
+            time.sleep(0.02)
+    finally:
+        calibrator.stop()
+        capture.stop()
+
+    assert len(updates) >= 2
+    assert not calibrator.running
+    assert 300 < recognizer.energy_threshold < 450
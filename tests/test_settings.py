@@ -84,3 +84,18 @@ def test_api_port_override(monkeypatch):
     monkeypatch.setenv("API_PORT", "9000")
     s = Settings()
     assert s.api_port == 9000
+
+
+def test_two_tier_whisper_defaults():
+    """Verifies the wake screening model defaults to a small greedy tier."""
+    s = Settings()
+    assert s.wake_model_size == "tiny"
+    assert s.whisper_compute_type == "int8"
+    assert s.wake_compute_type == "int8"
+
+
+def test_wake_model_size_override(monkeypatch):
+    """Verifies the wake model tier can be changed via env."""
+    monkeypatch.setenv("WAKE_MODEL_SIZE", "base")
+    s = Settings()
+    assert s.wake_model_size == "base"
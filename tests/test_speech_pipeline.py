@@ -0,0 +1,130 @@
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from stuart_ai.core.assistant import Assistant
+from stuart_ai.services.speech_pipeline import SpeechPipeline, split_sentences
+
+
+def test_split_sentences_keeps_short_fragments_together():
+    text = ("Dr. Silva confirmou a reunião de amanhã. O tempo em São Paulo está nublado!\n"
+            "Quer saber mais? Sim.")
+
+    assert split_sentences(text, min_chars=20) == [
+        "Dr. Silva confirmou a reunião de amanhã.",
+        "O tempo em São Paulo está nublado!",
+        "Quer saber mais? Sim.",
+    ]
+    assert split_sentences("Olá mundo", min_chars=20) == ["Olá mundo"]
+    assert split_sentences("  ", min_chars=20) == []
+
+
+@pytest.mark.asyncio
+async def test_next_sentence_is_synthesized_while_the_current_one_plays():
+    events = []
+
+    async def synthesize(sentence):
+        events.append(("synth", sentence))
+        yield sentence.encode()
+
+    async def play(index, chunks):
+        audio = b"".join([data async for data in chunks])
+        events.append(("play", audio.decode()))
+        # Gives the producer time to run ahead
+        await asyncio.sleep(0.01)
+
+    await SpeechPipeline(synthesize, lookahead=1).run(["a", "b", "c", "d"], play)
+
+    assert [e for e in events if e[0] == "play"] == [("play", s) for s in "abcd"]
+    # Sentence b is synthesized before a has finished playing, but never more than one ahead
+    assert events.index(("synth", "b")) < events.index(("play", "b"))
+    for played, sentence in enumerate("abcd"):
+        synthesized = sum(1 for e in events[:events.index(("play", sentence))] if e[0] == "synth")
+        assert synthesized <= played + 2
+
+
+@pytest.mark.asyncio
+async def test_first_sentence_plays_before_its_synthesis_ends():
+    release = asyncio.Event()
+    first_chunk = asyncio.Event()
+
+    async def synthesize(sentence):
+        yield b"1"
+        await release.wait()
+        yield b"2"
+
+    async def play(index, chunks):
+        async for data in chunks:
+            if data == b"1":
+                first_chunk.set()
+
+    task = asyncio.create_task(SpeechPipeline(synthesize).run(["frase"], play))
+    await asyncio.wait_for(first_chunk.wait(), timeout=1)
+    release.set()
+    await task
+
+
+@pytest.mark.asyncio
+async def test_synthesis_error_stops_the_pipeline():
+    played = []
+
+    async def synthesize(sentence):
+        if sentence == "b":
+            raise ConnectionError("offline")
+        yield sentence.encode()
+
+    async def play(index, chunks):
+        played.append(b"".join([data async for data in chunks]))
+
+    with pytest.raises(ConnectionError):
+        await SpeechPipeline(synthesize).run(["a", "b", "c"], play)
+    assert played == [b"a"]
+
+
+@pytest.mark.asyncio
+async def test_speak_synthesizes_each_sentence(mocker):
+    speech_output = AsyncMock()
+    assistant = Assistant(MagicMock(), MagicMock(), MagicMock(), MagicMock(), MagicMock(), MagicMock(), MagicMock(),
+                          speech_output=speech_output)
+    texts = []
+
+    def communicate(text, voice, rate):
+        texts.append(text)
+
+        async def stream():
+            yield {"type": "audio", "data": text.encode()}
+        return MagicMock(stream=stream)
+
+    mocker.patch("stuart_ai.services.tts_backends.edge_tts.Communicate", side_effect=communicate)
+    await assistant.speak("A pesquisa encontrou três resultados. O primeiro é de ontem e fala de clima.")
+
+    assert texts == ["A pesquisa encontrou três resultados.", "O primeiro é de ontem e fala de clima."]
+    assert [c.args[0] for c in speech_output.await_args_list] == [t.encode() for t in texts]
+
+
+@pytest.mark.asyncio
+async def test_announce_returns_at_once_and_the_answer_plays_after_it():
+    played = []
+
+    async def speech_output(audio):
+        await asyncio.sleep(0.1)
+        played.append(audio.decode())
+
+    assistant = Assistant(MagicMock(), MagicMock(), MagicMock(), MagicMock(), MagicMock(), MagicMock(), MagicMock(),
+                          speech_output=speech_output)
+
+    async def synthesize(text):
+        yield text.encode()
+
+    assistant._synthesize = synthesize
+    started = time.monotonic()
+    await assistant.announce("Pesquisando na web...")
+    # The announced work starts right away
+    assert time.monotonic() - started < 0.05
+    assert not played
+
+    await assistant.speak("A pesquisa encontrou três resultados.")
+
+    assert played == ["Pesquisando na web...", "A pesquisa encontrou três resultados."]
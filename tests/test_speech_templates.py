@@ -0,0 +1,138 @@
+import pytest
+from unittest.mock import MagicMock
+
+from stuart_ai.core.assistant import Assistant
+from stuart_ai.services.speech_templates import SpeechTemplates, number_words
+
+RATE = 24000
+
+
+class _FakeSynthesizer:
+    """Every piece is a tone; pieces listed in ``failing`` cannot be synthesized."""
+
+    def __init__(self, mp3_tone, failing=()):
+        self.mp3 = mp3_tone(0.2)
+        self.failing = set(failing)
+        self.requested = []
+
+    async def synthesize(self, text):
+        self.requested.append(text)
+        if text in self.failing:
+            raise OSError("offline")
+        return self.mp3
+
+
+class _RecordingPlayer:
+    sample_rate = RATE
+    running = True
+
+    def __init__(self):
+        self.pcm = bytearray()
+        self.flushed = False
+
+    async def enqueue(self, pcm):
+        self.pcm += pcm
+
+    async def flush(self):
+        self.flushed = True
+
+    def interrupt(self):
+        pass
+
+    def close(self):
+        pass
+
+
+@pytest.mark.parametrize("n, feminine, words", [
+    (0, False, "zero"),
+    (1, True, "uma"),
+    (2, True, "duas"),
+    (16, False, "dezesseis"),
+    (35, False, "trinta e cinco"),
+    (100, False, "cem"),
+    (142, False, "cento e quarenta e dois"),
+    (2026, False, "dois mil e vinte e seis"),
+    (2300, False, "dois mil e trezentos"),
+    (2320, False, "dois mil trezentos e vinte"),
+])
+def test_number_words(n, feminine, words):
+    assert number_words(n, feminine) == words
+
+
+def test_number_words_rejects_out_of_range():
+    with pytest.raises(ValueError):
+        number_words(10000)
+
+
+@pytest.mark.parametrize("text, segments", [
+    ("São 14:35.", ["São quatorze horas", "e trinta e cinco minutos."]),
+    ("São 01:01.", ["É uma hora", "e um minuto."]),
+    ("São 00:00.", ["É meia-noite."]),
+    ("São 22:00.", ["São vinte e duas horas."]),
+    ("Hoje é sexta-feira, 16 de outubro de 2026.",
+     ["Hoje é sexta-feira,", "dezesseis", "de outubro", "de dois mil e vinte e seis."]),
+    ("Hoje é domingo, 1 de março de 2027.",
+     ["Hoje é domingo,", "primeiro", "de março", "de dois mil e vinte e sete."]),
+    ("São 25:00.", None),
+    ("Hoje é feriado, 16 de outubro de 2026.", None),
+    ("A pesquisa terminou.", None),
+])
+def test_segments(text, segments):
+    assert SpeechTemplates.segments(text) == segments
+
+
+def test_fixed_segments_cover_every_time_and_date():
+    pieces = set(SpeechTemplates.fixed_segments([2026]))
+
+    for hour in range(24):
+        for minute in range(60):
+            assert set(SpeechTemplates.segments(f"São {hour:02d}:{minute:02d}.")) <= pieces
+    assert set(SpeechTemplates.segments("Hoje é quarta-feira, 31 de dezembro de 2026.")) <= pieces
+    assert not set(SpeechTemplates.segments("Hoje é quarta-feira, 31 de dezembro de 2027.")) <= pieces
+
+
+@pytest.mark.asyncio
+async def test_render_joins_prepared_pieces_with_gaps(mp3_tone):
+    synthesizer = _FakeSynthesizer(mp3_tone)
+    templates = SpeechTemplates(synthesizer, sample_rate=RATE, gap_seconds=0.1)
+
+    ready = await templates.prepare(years=[2026])
+
+    assert ready == len(SpeechTemplates.fixed_segments([2026]))
+    rendered = templates.render("São 14:35.")
+    # Two trimmed tones of about 0.2s around a 0.1s pause
+    assert 0.45 <= len(rendered.pcm) / 2 / RATE < 0.55
+    assert rendered.mp3 == synthesizer.mp3 * 2
+    assert templates.render("Uma resposta qualquer.") is None
+
+    # Pieces already loaded are not synthesized again
+    synthesizer.requested.clear()
+    await templates.prepare(years=[2026])
+    assert synthesizer.requested == []
+
+
+@pytest.mark.asyncio
+async def test_render_needs_every_piece(mp3_tone):
+    templates = SpeechTemplates(_FakeSynthesizer(mp3_tone, failing={"e trinta e cinco minutos."}), sample_rate=RATE)
+
+    await templates.prepare(years=[2026])
+
+    assert templates.render("São 14:35.") is None
+    assert templates.render("São 14:36.") is not None
+
+
+@pytest.mark.asyncio
+async def test_speak_plays_rendered_reply_without_synthesis(mp3_tone):
+    templates = SpeechTemplates(_FakeSynthesizer(mp3_tone), sample_rate=RATE, gap_seconds=0.1)
+    await templates.prepare(years=[2026])
+    player = _RecordingPlayer()
+    synthesizer = MagicMock()
+    assistant = Assistant(MagicMock(), MagicMock(), MagicMock(), MagicMock(), MagicMock(), MagicMock(), MagicMock(),
+                          audio_player=player, synthesizer=synthesizer, speech_templates=templates)
+
+    await assistant.speak("São 14:35.")
+
+    synthesizer.stream.assert_not_called()
+    assert bytes(player.pcm) == templates.render("São 14:35.").pcm
+    assert player.flushed
+    assert assistant.context.stage_timings["tts_first_audio"].count == 1
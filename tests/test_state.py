@@ -0,0 +1,34 @@
+import asyncio
+
+from stuart_ai.core.state import AssistantContext, AssistantStatus, StageTiming
+
+
+def test_record_command_and_status():
+    context = AssistantContext()
+    assert context.status == AssistantStatus.IDLE
+    context.set_status(AssistantStatus.LISTENING)
+    context.record_command("que horas são")
+    assert context.status == AssistantStatus.LISTENING
+    assert context.last_command == "que horas são"
+    assert context.command_count == 1
+
+
+def test_stage_timing_aggregates():
+    timing = StageTiming()
+    timing.record(0.1)
+    timing.record(0.3)
+    assert timing.as_dict() == {"count": 2, "avg_ms": 200.0, "last_ms": 300.0, "max_ms": 300.0}
+
+
+def test_pipeline_stats():
+    context = AssistantContext()
+    queue = asyncio.Queue(maxsize=4)
+    queue.put_nowait("utterance")
+    context.queues["audio"] = queue
+    context.record_stage_timing("stt", 0.5)
+    context.record_dropped_utterance()
+
+    stats = context.pipeline_stats()
+    assert stats["queue_depths"] == {"audio": 1}
+    assert stats["stages"]["stt"]["count"] == 1
+    assert stats["dropped_utterances"] == 1
@@ -0,0 +1,80 @@
+import threading
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from stuart_ai.core.exceptions import TranscriptionError
+from stuart_ai.services.stt_batcher import BatchedTranscriber
+
+
+class ClipPipeline:
+    """Stands in for BatchedInferencePipeline: one segment per clip, text = clip length in samples."""
+
+    def __init__(self, fail=False):
+        self.calls = []
+        self.fail = fail
+
+    def transcribe(self, audio, clip_timestamps=None, batch_size=None, **options):
+        self.calls.append((len(clip_timestamps), batch_size, options))
+        if self.fail:
+            raise RuntimeError("out of memory")
+        segments = []
+        for clip in clip_timestamps:
+            start, end = int(round(clip["start"] * 16000)), int(round(clip["end"] * 16000))
+            segments.append(SimpleNamespace(text=f"{end - start}:{audio[start]:.0f}",
+                                            start=round(clip["start"], 3), end=round(clip["end"], 3)))
+        return iter(segments), None
+
+
+def _concurrently(transcriber, requests):
+    results = [None] * len(requests)
+    barrier = threading.Barrier(len(requests))
+
+    def run(index, audio, options):
+        barrier.wait()
+        results[index] = transcriber.transcribe(audio, **options)
+
+    threads = [threading.Thread(target=run, args=(i, *request)) for i, request in enumerate(requests)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+    return results
+
+
+def test_concurrent_utterances_share_one_decode():
+    pipeline = ClipPipeline()
+    transcriber = BatchedTranscriber(pipeline=pipeline, max_batch=4, max_wait_seconds=0.2)
+    requests = [(np.full(1600 * (i + 1), i, dtype=np.float32), {"language": "pt"}) for i in range(3)]
+
+    results = _concurrently(transcriber, requests)
+    transcriber.close()
+
+    assert [[s.text for s in segments] for segments, _ in results] == [["1600:0"], ["3200:1"], ["4800:2"]]
+    assert pipeline.calls == [(3, 3, {"language": "pt", "vad_filter": False})]
+    assert transcriber.stats() == {"batches": 1, "utterances": 3, "avg_batch": 3.0}
+
+
+def test_different_options_are_decoded_separately():
+    pipeline = ClipPipeline()
+    transcriber = BatchedTranscriber(pipeline=pipeline, max_batch=4, max_wait_seconds=0.2)
+    requests = [
+        (np.zeros(1600, dtype=np.float32), {"initial_prompt": "a"}),
+        (np.ones(1600, dtype=np.float32), {"initial_prompt": "b"}),
+    ]
+
+    results = _concurrently(transcriber, requests)
+    transcriber.close()
+
+    assert [segments[0].text for segments, _ in results] == ["1600:0", "1600:1"]
+    assert sorted(call[0] for call in pipeline.calls) == [1, 1]
+
+
+def test_failed_batch_raises_in_every_caller():
+    transcriber = BatchedTranscriber(pipeline=ClipPipeline(fail=True), max_batch=2, max_wait_seconds=0.0)
+
+    with pytest.raises(TranscriptionError):
+        transcriber.transcribe(np.zeros(1600, dtype=np.float32))
+    assert transcriber.transcribe(np.zeros(0, dtype=np.float32)) == ([], None)
+    transcriber.close()
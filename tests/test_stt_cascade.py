@@ -0,0 +1,34 @@
+from types import SimpleNamespace
+
+from stuart_ai.services.stt_cascade import Transcript, TranscriptionCascade, summarize_segments
+
+
+def _segment(text, avg_logprob, no_speech_prob, compression_ratio):
+    return SimpleNamespace(text=text, avg_logprob=avg_logprob, no_speech_prob=no_speech_prob,
+                           compression_ratio=compression_ratio)
+
+
+def test_summary_keeps_the_worst_segment_statistics():
+    transcript = summarize_segments([
+        _segment(" Stuart, pesquise", -0.2, 0.30, 1.1),
+        _segment(" sobre gatos", -0.9, 0.05, 1.6),
+    ])
+
+    assert transcript == Transcript(" Stuart, pesquise  sobre gatos", -0.9, 0.30, 1.6)
+    assert summarize_segments([]) == Transcript("")
+
+
+def test_doubt_names_the_failing_statistic():
+    cascade = TranscriptionCascade(object(), min_avg_logprob=-0.6, max_no_speech_prob=0.5, max_compression_ratio=2.4)
+
+    assert cascade.doubt(Transcript("Stuart, que horas são", -0.3, 0.1, 1.2)) is None
+    assert cascade.doubt(Transcript("   ")) == "empty transcript"
+    assert cascade.doubt(Transcript("Stuart", -0.8, 0.1, 1.2)).startswith("avg_logprob")
+    assert cascade.doubt(Transcript("Stuart", -0.3, 0.7, 1.2)).startswith("no_speech_prob")
+    assert cascade.doubt(Transcript("sim sim sim sim", -0.3, 0.1, 3.0)).startswith("compression_ratio")
+
+
+def test_explicit_zero_thresholds_are_kept():
+    cascade = TranscriptionCascade(object(), min_avg_logprob=0.0, max_no_speech_prob=0.0, max_compression_ratio=0.0)
+
+    assert (cascade.min_avg_logprob, cascade.max_no_speech_prob, cascade.max_compression_ratio) == (0.0, 0.0, 0.0)
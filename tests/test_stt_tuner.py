@@ -0,0 +1,75 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from stuart_ai.services.stt_tuner import (
+    ProfileResult, TuningProfile, candidate_profiles, default_thread_counts, measure_profile, pick_best,
+    update_env_file,
+)
+from stuart_ai.services.wake_word import WakeWordMatcher
+
+
+def _result(size, beam, rtf, accuracy):
+    return ProfileResult(TuningProfile(size, "int8", 4, beam), rtf, accuracy)
+
+
+def test_thread_counts_stay_within_the_cpu():
+    assert default_thread_counts(16) == [2, 4, 8, 16]
+    assert default_thread_counts(2) == [1, 2]
+    assert default_thread_counts(1) == [1]
+
+
+def test_profiles_sharing_a_model_are_adjacent_with_growing_beams():
+    profiles = candidate_profiles(["tiny", "small"], ["int8"], [4], [5, 1])
+
+    assert [(p.model_size, p.beam_size) for p in profiles] == [("tiny", 1), ("tiny", 5), ("small", 1), ("small", 5)]
+
+
+def test_measure_profile_scores_keyword_accuracy_and_rtf():
+    model = MagicMock()
+    model.transcribe.side_effect = [
+        ([SimpleNamespace(text=" Stuart, que horas são?")], None),
+        ([SimpleNamespace(text=" O café acabou.")], None),
+        ([SimpleNamespace(text=" Stuart abre o navegador")], None),
+    ]
+    samples = [np.zeros(16000, dtype=np.float32)] * 3
+    profile = TuningProfile("tiny", "int8", 2, 3)
+
+    result = measure_profile(model, profile, samples, [True, False, False], WakeWordMatcher(["stuart"], 85))
+
+    assert result.keyword_accuracy == 2 / 3
+    assert result.rtf > 0
+    assert model.transcribe.call_args.kwargs["beam_size"] == 3
+
+
+def test_pick_best_prefers_accuracy_then_speed_within_the_rtf_budget():
+    results = [
+        _result("tiny", 1, 0.05, 0.80),
+        _result("base", 1, 0.15, 0.95),
+        _result("base", 5, 0.30, 0.95),
+        _result("small", 5, 0.90, 1.00),
+    ]
+
+    assert pick_best(results, max_rtf=0.5).profile == TuningProfile("base", "int8", 4, 1)
+    assert pick_best(results, max_rtf=1.0).profile.model_size == "small"
+    assert pick_best(results, max_rtf=0.5, accuracy_tolerance=0.2).profile.model_size == "tiny"
+    # Nothing fast enough: the profile that falls least behind speech, not the most accurate one
+    assert pick_best(results, max_rtf=0.01).profile.model_size == "tiny"
+    assert pick_best([]) is None
+
+
+def test_update_env_file_replaces_keys_and_keeps_other_lines(tmp_path):
+    env = tmp_path / ".env"
+    env.write_text("# Whisper\nWHISPER_MODEL_SIZE=small\nAPI_PORT=8000\n", encoding="utf-8")
+
+    update_env_file(str(env), TuningProfile("base", "int8_float32", 4, 1).as_env())
+
+    assert env.read_text(encoding="utf-8").splitlines() == [
+        "# Whisper",
+        "WHISPER_MODEL_SIZE=base",
+        "API_PORT=8000",
+        "WHISPER_COMPUTE_TYPE=int8_float32",
+        "WHISPER_CPU_THREADS=4",
+        "WHISPER_BEAM_SIZE=1",
+    ]
@@ -0,0 +1,134 @@
+import os
+import threading
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from stuart_ai.core.exceptions import TranscriptionError
+from stuart_ai.services.stt_worker import WhisperWorkerPool, WorkerSegment
+
+
+class EchoModel:
+    """Describes the audio it received, so tests can check what crossed shared memory."""
+
+    def transcribe(self, audio, **options):
+        if options.get("initial_prompt") == "fail":
+            raise RuntimeError("decode failed")
+        text = f"{audio.size} {audio[0]:.2f} {audio[-1]:.2f} {options.get('language')}"
+        return iter([SimpleNamespace(text=text, start=0.0, end=audio.size / 16000,
+                                     avg_logprob=-0.1, no_speech_prob=0.01, compression_ratio=1.2)]), None
+
+
+def make_echo_model():
+    return EchoModel()
+
+
+def make_broken_model():
+    raise RuntimeError("no weights")
+
+
+def make_model_unless(flag_path):
+    """Loads fine until ``flag_path`` exists (workers are separate processes, so state lives on disk)."""
+    if os.path.exists(flag_path):
+        raise RuntimeError("out of memory")
+    return EchoModel()
+
+
+@pytest.fixture
+def pool():
+    pool = WhisperWorkerPool(workers=2, model_factory=make_echo_model, factory_args=())
+    pool.start()
+    yield pool
+    pool.close()
+
+
+def test_transcribe_reads_audio_from_shared_memory(pool):
+    samples = np.linspace(-0.5, 0.5, 16000, dtype=np.float32)
+    segments, _ = pool.transcribe(samples, language="pt")
+
+    assert segments == [WorkerSegment("16000 -0.50 0.50 pt", 0.0, 1.0, -0.1, 0.01, 1.2)]
+    assert " ".join(segment.text for segment in segments) == "16000 -0.50 0.50 pt"
+
+
+def test_transcribe_grows_buffer_for_long_audio(pool):
+    samples = np.full(pool._capacity + 1000, 0.25, dtype=np.float32)
+    segments, _ = pool.transcribe(samples)
+    assert segments[0].text.startswith(f"{samples.size} 0.25 0.25")
+
+    segments, _ = pool.transcribe(np.zeros(10, dtype=np.float32))
+    assert segments[0].text.startswith("10 0.00")
+
+
+def test_concurrent_calls_use_separate_workers(pool):
+    results = {}
+
+    def run(value):
+        segments, _ = pool.transcribe(np.full(800, value, dtype=np.float32))
+        results[value] = segments[0].text
+
+    threads = [threading.Thread(target=run, args=(v,)) for v in (0.1, 0.2, 0.3, 0.4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == {v: f"800 {v:.2f} {v:.2f} None" for v in (0.1, 0.2, 0.3, 0.4)}
+
+
+def test_worker_error_raises_transcription_error_and_keeps_worker(pool):
+    with pytest.raises(TranscriptionError, match="decode failed"):
+        pool.transcribe(np.zeros(100, dtype=np.float32), initial_prompt="fail")
+
+    segments, _ = pool.transcribe(np.zeros(100, dtype=np.float32))
+    assert segments[0].text.startswith("100")
+
+
+def test_crashed_worker_is_replaced(pool):
+    for worker in list(pool._all):
+        worker.process.kill()
+        worker.process.join()
+
+    with pytest.raises(TranscriptionError, match="crashed"):
+        pool.transcribe(np.zeros(100, dtype=np.float32))
+
+    assert len(pool._all) == 2
+    # The second dead worker is replaced on its turn; after that the pool is healthy
+    with pytest.raises(TranscriptionError):
+        pool.transcribe(np.zeros(100, dtype=np.float32))
+    segments, _ = pool.transcribe(np.zeros(100, dtype=np.float32))
+    assert segments[0].text.startswith("100")
+
+
+def test_model_load_failure_raises():
+    pool = WhisperWorkerPool(workers=1, model_factory=make_broken_model, factory_args=())
+    with pytest.raises(TranscriptionError, match="no weights"):
+        pool.start()
+    pool.close()
+
+
+def test_failed_respawn_raises_and_is_retried_on_the_next_call(tmp_path):
+    flag = tmp_path / "broken"
+    pool = WhisperWorkerPool(workers=1, model_factory=make_model_unless, factory_args=(str(flag),))
+    pool.start()
+    try:
+        flag.touch()
+        worker = pool._all[0]
+        worker.process.kill()
+        worker.process.join()
+
+        with pytest.raises(TranscriptionError, match="crashed"):
+            pool.transcribe(np.zeros(100, dtype=np.float32))
+        # The dead worker is not handed out again
+        assert pool._all == []
+        assert pool._idle.empty()
+
+        with pytest.raises(TranscriptionError, match="out of memory"):
+            pool.transcribe(np.zeros(100, dtype=np.float32))
+
+        flag.unlink()
+        segments, _ = pool.transcribe(np.zeros(100, dtype=np.float32))
+        assert segments[0].text.startswith("100")
+        assert len(pool._all) == 1
+    finally:
+        pool.close()
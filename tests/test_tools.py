@@ -55,6 +55,15 @@ async def test_get_time(assistant_tools_fixture, mocker):
     
     assert result == "São 14:45."
 
+@pytest.mark.asyncio
+async def test_get_date_names_weekday_and_month(assistant_tools_fixture, mocker):
+    tools, _, _, _, _, _ = assistant_tools_fixture
+
+    # Spelled out by the assistant itself, not by the system locale
+    mocker.patch('stuart_ai.tools.system_tools.datetime').now.return_value = dt(2026, 10, 16, 9, 0)
+
+    assert tools._get_date() == "Hoje é sexta-feira, 16 de outubro de 2026."
+
 @pytest.mark.asyncio
 async def test_tell_joke_success(assistant_tools_fixture, mocker):
     tools, _, _, _, _, _ = assistant_tools_fixture
@@ -177,6 +186,18 @@ async def test_perform_web_search_success(assistant_tools_fixture, mocker):
     mock_speak.assert_called_once()
     assert "Search Result" in result
 
+@pytest.mark.asyncio
+async def test_web_search_announces_without_speaking(assistant_tools_fixture):
+    tools, mock_speak, _, mock_web_search_agent, _, _ = assistant_tools_fixture
+    tools.announce = AsyncMock()
+    mock_web_search_agent.run.return_value = "Search Result"
+
+    result = await tools._perform_web_search("test query")
+
+    tools.announce.assert_called_once()
+    mock_speak.assert_not_called()
+    assert "Search Result" in result
+
 @pytest.mark.asyncio
 async def test_quit(assistant_tools_fixture):
     tools, mock_speak, _, _, _, _ = assistant_tools_fixture
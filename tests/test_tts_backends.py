@@ -0,0 +1,155 @@
+import asyncio
+import io
+import wave
+
+import numpy as np
+import pytest
+
+from stuart_ai.core.exceptions import SpeechSynthesisError
+from stuart_ai.services.tts_backends import EspeakBackend, Synthesizer, TTSBackend, create_backend
+from stuart_ai.services.tts_cache import TTSCache
+from stuart_ai.services.tts_playback import Mp3Decoder
+
+
+class FakeBackend(TTSBackend):
+    def __init__(self, name, delay=0.0, fail=None, fail_after_first=False):
+        super().__init__(f"{name}-voice", "+0%")
+        self.name = name
+        self.delay = delay
+        self.fail = fail
+        self.fail_after_first = fail_after_first
+        self.texts = []
+
+    async def stream(self, text):
+        self.texts.append(text)
+        await asyncio.sleep(self.delay)
+        if self.fail and not self.fail_after_first:
+            raise self.fail
+        yield f"{self.name}:{text}".encode()
+        if self.fail:
+            raise self.fail
+
+
+async def _collect(synthesizer, text):
+    return b"".join([chunk async for chunk in synthesizer.stream(text)])
+
+
+@pytest.mark.asyncio
+async def test_slow_main_backend_falls_back_and_cools_down(tmp_path):
+    cache = TTSCache(str(tmp_path))
+    main, local = FakeBackend("edge", delay=1.0), FakeBackend("espeak")
+    fallbacks = []
+    synthesizer = Synthesizer(main, local, cache=cache, budget_seconds=0.05, cooldown_seconds=60,
+                              on_fallback=lambda: fallbacks.append(1))
+
+    assert await _collect(synthesizer, "Olá.") == "espeak:Olá.".encode()
+    # Within the cooldown the main backend is not even tried
+    assert await _collect(synthesizer, "Tudo bem?") == "espeak:Tudo bem?".encode()
+
+    assert main.texts == ["Olá."]
+    assert len(fallbacks) == 1
+    # Cached under the backend that produced the audio
+    assert cache.get("Olá.", "espeak-voice", "+0%") == "espeak:Olá.".encode()
+    assert cache.get("Olá.", "edge-voice", "+0%") is None
+
+
+@pytest.mark.asyncio
+async def test_main_backend_error_before_audio_falls_back():
+    synthesizer = Synthesizer(FakeBackend("edge", fail=ConnectionError("offline")), FakeBackend("espeak"),
+                              budget_seconds=1.0)
+
+    assert await _collect(synthesizer, "Olá.") == "espeak:Olá.".encode()
+
+
+@pytest.mark.asyncio
+async def test_fast_main_backend_is_used_and_errors_mid_sentence_propagate():
+    local = FakeBackend("espeak")
+    synthesizer = Synthesizer(FakeBackend("edge"), local, budget_seconds=1.0)
+    assert await _collect(synthesizer, "Olá.") == "edge:Olá.".encode()
+
+    # Part of the sentence was already played: no second voice
+    broken = Synthesizer(FakeBackend("edge", fail=ConnectionError("reset"), fail_after_first=True), local,
+                         budget_seconds=1.0)
+    with pytest.raises(ConnectionError):
+        await _collect(broken, "Olá.")
+    assert local.texts == []
+
+
+@pytest.mark.asyncio
+async def test_without_fallback_errors_are_raised():
+    synthesizer = Synthesizer(FakeBackend("edge", fail=ConnectionError("offline")))
+
+    with pytest.raises(SpeechSynthesisError):
+        await _collect(synthesizer, "Olá.")
+
+
+class EndlessBackend(FakeBackend):
+    """Keeps streaming until closed; records that it was."""
+
+    def __init__(self):
+        super().__init__("edge")
+        self.closed = False
+
+    async def stream(self, text):
+        try:
+            while True:
+                yield b"chunk"
+        finally:
+            self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_backend_stream_is_closed_when_the_sentence_is_dropped():
+    backend = EndlessBackend()
+    chunks = Synthesizer(backend)._stream_from(backend, "Olá.")  # pylint: disable=protected-access
+
+    assert await anext(chunks) == b"chunk"
+    await chunks.aclose()
+
+    assert backend.closed
+
+
+def _wav(seconds, rate=22050):
+    t = np.arange(int(seconds * rate)) / rate
+    samples = (0.3 * np.sin(2 * np.pi * 220 * t) * 32767).astype(np.int16)
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(rate)
+        f.writeframes(samples.tobytes())
+    return buffer.getvalue()
+
+
+@pytest.mark.asyncio
+async def test_espeak_output_is_encoded_as_mp3(mocker):
+    process = mocker.MagicMock(returncode=0)
+    process.communicate = mocker.AsyncMock(return_value=(_wav(1.0), b""))
+    spawn = mocker.patch("asyncio.create_subprocess_exec", new_callable=mocker.AsyncMock, return_value=process)
+
+    backend = EspeakBackend(voice="pt-br", speed=175)
+    mp3 = b"".join([chunk async for chunk in backend.stream("-q São 14 horas.")])
+
+    # The text goes through stdin: a leading dash cannot become an option
+    assert "-q São 14 horas." not in spawn.call_args.args
+    process.communicate.assert_awaited_once_with("-q São 14 horas.".encode())
+    decoder = Mp3Decoder(24000)
+    pcm = decoder.decode(mp3) + decoder.flush()
+    assert 1.0 <= len(pcm) / 2 / 24000 < 1.15
+
+
+@pytest.mark.asyncio
+async def test_espeak_failure_is_a_synthesis_error(mocker):
+    process = mocker.MagicMock(returncode=1)
+    process.communicate = mocker.AsyncMock(return_value=(b"", b"voice not found"))
+    mocker.patch("asyncio.create_subprocess_exec", new_callable=mocker.AsyncMock, return_value=process)
+
+    with pytest.raises(SpeechSynthesisError, match="voice not found"):
+        async for _ in EspeakBackend().stream("Olá."):
+            pass
+
+
+def test_create_backend_rejects_unknown_names():
+    assert create_backend("espeak").name == "espeak"
+    with pytest.raises(ValueError, match="edge"):
+        create_backend("festival")
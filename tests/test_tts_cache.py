@@ -0,0 +1,132 @@
+import os
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from stuart_ai.core.assistant import Assistant
+from stuart_ai.services.tts_cache import TTSCache, collect_static_phrases, presynthesize, static_phrases
+
+VOICE, RATE = "pt-BR-AntonioNeural", "+0%"
+
+
+def test_entries_are_keyed_by_text_voice_and_rate(tmp_path):
+    cache = TTSCache(str(tmp_path), max_bytes=1024)
+    cache.put("Olá", VOICE, RATE, b"mp3")
+
+    assert cache.get("Olá", VOICE, RATE) == b"mp3"
+    assert cache.get("Olá", VOICE, "+20%") is None
+    assert cache.get("Olá", "pt-BR-FranciscaNeural", RATE) is None
+    assert ("Olá", VOICE, RATE) in cache
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".part")]
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = TTSCache(str(tmp_path), max_bytes=300)
+    for i, text in enumerate(("um", "dois", "três")):
+        cache.put(text, VOICE, RATE, bytes(100))
+        path = os.path.join(tmp_path, cache.key(text, VOICE, RATE) + ".mp3")
+        os.utime(path, (1000 + i, 1000 + i))
+
+    # "um" is read again, so "dois" becomes the oldest entry
+    assert cache.get("um", VOICE, RATE) is not None
+    cache.put("quatro", VOICE, RATE, bytes(100))
+
+    assert cache.get("dois", VOICE, RATE) is None
+    for text in ("um", "três", "quatro"):
+        assert cache.get(text, VOICE, RATE) is not None
+    assert cache.size() <= 300
+
+
+def test_static_phrases_finds_only_literal_speech():
+    source = '''
+async def run(self, name):
+    await self.speak("Consultando sua agenda...")
+    await self.speak(f"Abrindo {name}.")
+    response_text = "Tudo bem, comando cancelado."
+    if not name:
+        return "Qual arquivo?"
+    return name
+'''
+    assert static_phrases(source) == ["Consultando sua agenda...", "Tudo bem, comando cancelado."]
+    assert "Qual arquivo?" in static_phrases(source, returns=True)
+
+
+def test_collect_static_phrases_covers_the_tools():
+    phrases = collect_static_phrases()
+
+    for phrase in ("Consultando sua agenda...", "Pesquisando nos seus arquivos...",
+                   "Sim, em que posso ajudar?", "Encerrando a assistente. Até logo!",
+                   "Entendi. Como posso ajudar com isso?"):
+        assert phrase in phrases
+    # Internal reason strings returned by the assistant are not speech
+    assert "no wake word" not in phrases
+    assert len(phrases) == len(set(phrases))
+
+
+class _Backend:
+    voice, rate = VOICE, RATE
+
+    def __init__(self):
+        self.texts = []
+
+    async def stream(self, text):
+        self.texts.append(text)
+        if text == "falha":
+            raise ConnectionError("offline")
+        yield text.encode()
+
+
+@pytest.mark.asyncio
+async def test_presynthesize_skips_cached_phrases_and_survives_failures(tmp_path):
+    cache = TTSCache(str(tmp_path))
+    cache.put("já está", VOICE, RATE, b"old")
+
+    backend = _Backend()
+    added = await presynthesize(cache, ["já está", "nova", "falha"], backend)
+
+    assert added == 1
+    assert cache.get("nova", VOICE, RATE) == b"nova"
+    assert cache.get("já está", VOICE, RATE) == b"old"
+    assert backend.texts == ["nova", "falha"]
+
+
+@pytest.mark.asyncio
+async def test_speak_plays_cached_audio_without_edge_tts(tmp_path):
+    cache = TTSCache(str(tmp_path))
+    speech_output = AsyncMock()
+    assistant = Assistant(MagicMock(), MagicMock(), MagicMock(), MagicMock(), MagicMock(), MagicMock(), MagicMock(),
+                          speech_output=speech_output, tts_cache=cache)
+
+    async def stream():
+        yield {"type": "audio", "data": b"sintetizado"}
+
+    communicate = MagicMock(return_value=MagicMock(stream=stream))
+    with patch("stuart_ai.services.tts_backends.edge_tts.Communicate", communicate):
+        await assistant.speak("Consultando sua agenda...")
+        await assistant.speak("Consultando sua agenda...")
+
+    # Synthesized once, then served from disk
+    communicate.assert_called_once()
+    assert [c.args[0] for c in speech_output.await_args_list] == [b"sintetizado", b"sintetizado"]
+    assert assistant.context.stage_timings["tts_first_audio"].count == 2
+
+
+@pytest.mark.asyncio
+async def test_presynthesized_multi_sentence_phrase_is_spoken_without_edge_tts(tmp_path):
+    cache = TTSCache(str(tmp_path))
+    phrase = "Arquivo não encontrado. Verifique se o caminho está correto."
+    backend = _Backend()
+    await presynthesize(cache, [phrase], backend)
+
+    # Cached per sentence, the way speak() looks it up
+    assert backend.texts == ["Arquivo não encontrado.", "Verifique se o caminho está correto."]
+
+    speech_output = AsyncMock()
+    assistant = Assistant(MagicMock(), MagicMock(), MagicMock(), MagicMock(), MagicMock(), MagicMock(), MagicMock(),
+                          speech_output=speech_output, tts_cache=cache)
+    with patch("stuart_ai.services.tts_backends.edge_tts.Communicate") as communicate:
+        await assistant.speak(phrase)
+
+    communicate.assert_not_called()
+    spoken = b"".join(c.args[0] for c in speech_output.await_args_list)
+    assert spoken == "Arquivo não encontrado.".encode() + "Verifique se o caminho está correto.".encode()
@@ -0,0 +1,94 @@
+import asyncio
+import time
+
+import pytest
+
+from stuart_ai.core.exceptions import AudioDeviceError
+from stuart_ai.services.tts_playback import AudioPlayer, Mp3Decoder
+
+RATE = 24000
+
+
+class FakeOutput:
+    """Output stream that 'plays' in real time and records what it was given."""
+
+    def __init__(self, speed: float = 1.0):
+        self.speed = speed
+        self.written = bytearray()
+        self.closed = False
+
+    def write(self, data):
+        time.sleep(len(data) / 2 / RATE / self.speed)
+        self.written += data
+
+    def close(self):
+        self.closed = True
+
+
+def _player(output, **kwargs):
+    return AudioPlayer(stream_factory=lambda: output, **kwargs)
+
+
+def test_decoder_handles_arbitrary_chunk_boundaries(mp3_tone):
+    mp3 = mp3_tone(1.0) + mp3_tone(0.5)
+    decoder = Mp3Decoder(RATE)
+    pcm = b"".join(decoder.decode(mp3[i:i + 777]) for i in range(0, len(mp3), 777)) + decoder.flush()
+
+    # Two concatenated streams decode as one (MP3 adds encoder padding)
+    assert 1.5 <= len(pcm) / 2 / RATE < 1.7
+
+
+@pytest.mark.asyncio
+async def test_player_plays_everything_before_flush_returns():
+    output = FakeOutput(speed=20)
+    player = _player(output)
+    player.start()
+    try:
+        await player.enqueue(b"\x01\x00" * RATE)
+        await player.enqueue(b"\x02\x00" * (RATE // 2))
+        await player.flush()
+
+        assert bytes(output.written) == b"\x01\x00" * RATE + b"\x02\x00" * (RATE // 2)
+    finally:
+        player.close()
+    assert output.closed
+
+
+@pytest.mark.asyncio
+async def test_interrupt_cuts_playback_within_a_block():
+    output = FakeOutput()
+    player = _player(output)
+    player.start()
+    try:
+        await player.enqueue(bytes(RATE * 2 * 5))
+        await asyncio.sleep(0.2)
+
+        started = time.monotonic()
+        player.interrupt()
+        await player.flush()
+        assert time.monotonic() - started < 0.2
+        assert len(output.written) < RATE * 2
+    finally:
+        player.close()
+
+
+@pytest.mark.asyncio
+async def test_enqueue_waits_when_the_buffer_is_full():
+    output = FakeOutput(speed=10)
+    player = _player(output, max_buffered_seconds=0.5)
+    player.start()
+    try:
+        for _ in range(4):
+            await player.enqueue(bytes(RATE))  # 0.5 s each
+            assert player.buffered_seconds <= 1.0
+        await player.flush()
+    finally:
+        player.close()
+
+
+def test_start_reports_a_missing_output_device():
+    def broken():
+        raise OSError("no default output device")
+
+    with pytest.raises(AudioDeviceError):
+        AudioPlayer(stream_factory=broken).start()
@@ -0,0 +1,44 @@
+import numpy as np
+
+from stuart_ai.utils.vad import EnergyZcrVAD, zero_crossing_rate
+
+RATE = 16000
+THRESHOLD = 1000
+
+
+def _pcm(samples: np.ndarray) -> bytes:
+    return np.clip(samples, -32768, 32767).astype("<i2").tobytes()
+
+
+def _tone(freq: float, amplitude: float, seconds: float = 0.05) -> np.ndarray:
+    t = np.arange(int(RATE * seconds)) / RATE
+    return amplitude * np.sin(2 * np.pi * freq * t)
+
+
+def test_zero_crossing_rate():
+    assert zero_crossing_rate(np.array([1.0, -1.0, 1.0, -1.0])) == 1.0
+    assert zero_crossing_rate(np.ones(100)) == 0.0
+    assert zero_crossing_rate(np.array([0.5])) == 0.0
+
+
+def test_loud_voiced_frame_is_speech():
+    vad = EnergyZcrVAD()
+    assert vad.is_speech(_pcm(_tone(200, 5000)), 2, THRESHOLD)
+
+
+def test_quiet_fricative_is_speech_but_hum_is_not():
+    vad = EnergyZcrVAD()
+    rng = np.random.default_rng(0)
+    # Broadband hiss just under the threshold, like the "s" in "Stuart"
+    fricative = rng.standard_normal(800) * 800
+    # Mains hum at the same energy: low zero-crossing rate
+    hum = _tone(60, 800 * np.sqrt(2))
+
+    assert vad.is_speech(_pcm(fricative), 2, THRESHOLD)
+    assert not vad.is_speech(_pcm(hum), 2, THRESHOLD)
+
+
+def test_silence_is_not_speech():
+    vad = EnergyZcrVAD()
+    assert not vad.is_speech(bytes(1600), 2, THRESHOLD)
+    assert not vad.is_speech(b"", 2, THRESHOLD)
@@ -0,0 +1,217 @@
+import asyncio
+import time
+import pytest
+import speech_recognition as sr
+from unittest.mock import MagicMock, AsyncMock
+
+from stuart_ai.core.assistant import Assistant
+from stuart_ai.core.enums import AssistantSignal
+from stuart_ai.core.state import AssistantContext
+from stuart_ai.services.audio_sources import UtteranceRecorder
+from stuart_ai.services.streaming_stt import PartialTranscriber
+from stuart_ai.services.stt_cascade import TranscriptionCascade
+from stuart_ai.utils.audio_corpus import corpus_entries, read_sidecar
+
+SPEECH = sr.AudioData(b"\x00\x10" * 8000, 16000, 2)
+
+
+def _segments(text):
+    segment = MagicMock()
+    segment.text = text
+    return [segment], None
+
+
+def _scored_segments(text, avg_logprob=-0.2, no_speech_prob=0.01, compression_ratio=1.2):
+    segment = MagicMock(text=text, avg_logprob=avg_logprob, no_speech_prob=no_speech_prob,
+                        compression_ratio=compression_ratio)
+    return [segment], None
+
+
+def _scripted_listen(*utterances):
+    """
+    capture.listen replacement: returns each utterance once, then keeps timing out.
+
+    An utterance given as ``(partial_count, audio)`` first reports that many partials.
+    """
+    pending = list(utterances)
+
+    def listen(timeout=None, phrase_time_limit=None, on_partial=None, partial_interval=None):
+        if pending:
+            item = pending.pop(0)
+            if isinstance(item, tuple):
+                partial_count, item = item
+                for _ in range(partial_count):
+                    if on_partial:
+                        on_partial(id(item), item)
+                    time.sleep(0.05)
+            return item
+        time.sleep(0.01)
+        raise sr.WaitTimeoutError()
+
+    return listen
+
+
+@pytest.fixture
+def assistant():
+    whisper = MagicMock()
+    context = AssistantContext()
+    assistant = Assistant(MagicMock(), MagicMock(), MagicMock(), MagicMock(), MagicMock(),
+                          whisper, MagicMock(), context=context)
+    assistant.wake_gate = None
+    assistant.speak = AsyncMock()
+    assistant.capture = MagicMock()
+    assistant.capture.lossless = False
+    assistant.noise_calibrator = MagicMock()
+    return assistant
+
+
+@pytest.mark.asyncio
+async def test_pipeline_dispatches_wake_commands_and_quits(assistant):
+    assistant.capture.listen.side_effect = _scripted_listen(SPEECH, SPEECH, SPEECH)
+    assistant.model.transcribe.side_effect = [
+        _segments(" bom dia pessoal"),
+        _segments(" Stewart, que horas são?"),
+        _segments(" Stuart, sair"),
+    ]
+    assistant.handle_command = AsyncMock(side_effect=[None, AssistantSignal.QUIT])
+
+    await asyncio.wait_for(assistant.listen_continuously(), timeout=5)
+
+    commands = [call.args[0] for call in assistant.handle_command.call_args_list]
+    assert commands == ["stuart, que horas são?", "Stuart, sair"]
+    assistant.capture.stop.assert_called_once()
+
+    stats = assistant.context.pipeline_stats()
+    assert stats["stages"]["stt"]["count"] == 3
+    assert stats["stages"]["execute"]["count"] == 2
+    assert set(stats["queue_depths"]) == {"audio", "transcripts", "commands", "barge_in"}
+
+
+@pytest.mark.asyncio
+async def test_capture_keeps_running_while_a_command_executes(assistant):
+    assistant.capture.listen.side_effect = _scripted_listen(SPEECH, SPEECH)
+    assistant.model.transcribe.side_effect = [_segments(" Stuart, pesquise algo"), _segments(" Stuart, sair")]
+
+    transcribed_during_execution = []
+
+    async def slow_command(text):
+        if "sair" in text:
+            return AssistantSignal.QUIT
+        await asyncio.sleep(0.3)
+        transcribed_during_execution.append(assistant.model.transcribe.call_count)
+        return None
+
+    assistant.handle_command = AsyncMock(side_effect=slow_command)
+    await asyncio.wait_for(assistant.listen_continuously(), timeout=5)
+
+    # The second phrase was captured and transcribed while the first command was still running
+    assert transcribed_during_execution == [2]
+
+
+@pytest.mark.asyncio
+async def test_stable_partial_dispatches_instant_command_early(assistant):
+    assistant.partial_transcriber = PartialTranscriber(assistant.model)
+    phrase = sr.AudioData(b"\x00\x10" * 8000, 16000, 2)
+    assistant.capture.listen.side_effect = _scripted_listen((3, phrase), SPEECH)
+    assistant.model.transcribe.side_effect = [
+        _segments(" Stuart, que horas"),
+        _segments(" Stuart, que horas são?"),
+        _segments(" Stuart, que horas são"),
+        _segments(" Stuart, sair"),
+    ]
+    assistant.handle_command = AsyncMock(side_effect=[None, AssistantSignal.QUIT])
+
+    await asyncio.wait_for(assistant.listen_continuously(), timeout=5)
+
+    commands = [call.args[0] for call in assistant.handle_command.call_args_list]
+    assert commands == ["Stuart, que horas são", "Stuart, sair"]
+    # Three partial decodes; the finished phrase was not transcribed again
+    assert assistant.model.transcribe.call_count == 4
+    assert assistant.context.pipeline_stats()["early_dispatches"] == 1
+
+
+@pytest.mark.asyncio
+async def test_partials_leave_other_commands_to_the_full_transcription(assistant):
+    assistant.partial_transcriber = PartialTranscriber(assistant.model)
+    phrase = sr.AudioData(b"\x00\x10" * 8000, 16000, 2)
+    assistant.capture.listen.side_effect = _scripted_listen((2, phrase), SPEECH)
+    assistant.model.transcribe.side_effect = [
+        _segments(" Stuart, pesquise sobre gatos"),
+        _segments(" Stuart, pesquise sobre gatos"),
+        _segments(" Stuart, pesquise sobre gatos pretos"),
+        _segments(" Stuart, sair"),
+    ]
+    assistant.handle_command = AsyncMock(side_effect=[None, AssistantSignal.QUIT])
+
+    await asyncio.wait_for(assistant.listen_continuously(), timeout=5)
+
+    commands = [call.args[0] for call in assistant.handle_command.call_args_list]
+    assert commands == ["Stuart, pesquise sobre gatos pretos", "Stuart, sair"]
+    assert assistant.context.pipeline_stats()["early_dispatches"] == 0
+
+
+@pytest.mark.asyncio
+async def test_capture_mode_records_utterances_with_transcripts(assistant, tmp_path):
+    assistant.recorder = UtteranceRecorder(str(tmp_path))
+    assistant.capture.listen.side_effect = _scripted_listen(SPEECH, SPEECH)
+    assistant.model.transcribe.side_effect = [_segments(" bom dia"), _segments(" Stuart, sair")]
+    assistant.handle_command = AsyncMock(return_value=AssistantSignal.QUIT)
+
+    await asyncio.wait_for(assistant.listen_continuously(), timeout=5)
+
+    entries = corpus_entries(str(tmp_path))
+    assert [e.rsplit("/", 1)[-1] for e in entries] == ["0000", "0001"]
+    first, second = (read_sidecar(e) for e in entries)
+    assert first["transcript"] == "bom dia"
+    assert second["transcript"] == "Stuart, sair"
+    assert first["duration"] == 0.5
+    assert "wake" not in first
+
+
+def test_put_dropping_oldest():
+    queue = asyncio.Queue(maxsize=2)
+    assert Assistant._put_dropping_oldest(queue, 1) is False
+    assert Assistant._put_dropping_oldest(queue, 2) is False
+    assert Assistant._put_dropping_oldest(queue, 3) is True
+    assert [queue.get_nowait(), queue.get_nowait()] == [2, 3]
+
+
+@pytest.mark.asyncio
+async def test_confirmation_claims_next_phrase_from_pipeline(assistant):
+    assistant._pipeline_active = True
+    assistant.model.transcribe.return_value = _segments(" Sim")
+
+    async def deliver():
+        while assistant._utterance_claim is None:
+            await asyncio.sleep(0.01)
+        assistant._utterance_claim.set_result(SPEECH)
+
+    delivery = asyncio.create_task(deliver())
+    assert await assistant.listen_for_confirmation("Tem certeza?") is True
+    await delivery
+    assistant.capture.flush.assert_called_once()
+    assistant.capture.calibrate.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_cascade_escalates_only_doubtful_or_unrouted_transcripts(assistant):
+    fast = MagicMock()
+    assistant.cascade = TranscriptionCascade(fast, min_avg_logprob=-0.6, max_no_speech_prob=0.5,
+                                             max_compression_ratio=2.4)
+    assistant.capture.listen.side_effect = _scripted_listen(SPEECH, SPEECH, SPEECH)
+    fast.transcribe.side_effect = [
+        _scored_segments(" Stuart, que horas são?"),
+        _scored_segments(" Stuart, pesquise sobre gatos"),
+        _scored_segments(" Stuart, sai", avg_logprob=-1.1),
+    ]
+    assistant.model.transcribe.side_effect = [_segments(" Stuart, pesquise sobre gatos"), _segments(" Stuart, sair")]
+    assistant.handle_command = AsyncMock(side_effect=[None, None, AssistantSignal.QUIT])
+
+    await asyncio.wait_for(assistant.listen_continuously(), timeout=5)
+
+    commands = [call.args[0] for call in assistant.handle_command.call_args_list]
+    assert commands == ["Stuart, que horas são?", "Stuart, pesquise sobre gatos", "Stuart, sair"]
+    # Confident and routed by regex: the full model never saw the first phrase
+    assert assistant.model.transcribe.call_count == 2
+    assert fast.transcribe.call_args.kwargs["beam_size"] == 1
+    assert assistant.context.pipeline_stats()["cascade"] == {"fast": 1, "escalated": 2}
@@ -0,0 +1,103 @@
+import numpy as np
+from unittest.mock import MagicMock
+
+from stuart_ai.core.config import settings
+from stuart_ai.services.wake_word import WakeWordGate, WakeWordMatcher, find_wake_word, phonetic_key
+
+
+def _segments(*texts):
+    segments = []
+    for text in texts:
+        segment = MagicMock()
+        segment.text = text
+        segments.append(segment)
+    return segments, None
+
+
+def test_find_wake_word_strict_and_fuzzy():
+    assert find_wake_word("Stuart, que horas são?", "stuart", 70) == ("stuart", 100)
+
+    matched_word, score = find_wake_word("stewart ligar luz", "stuart", 70)
+    assert matched_word == "stewart"
+    assert score >= 70
+
+    assert find_wake_word("hoje o dia está bonito", "stuart", 70) is None
+    assert find_wake_word("   ", "stuart", 70) is None
+
+
+def test_phonetic_key_folds_ptbr_spellings_of_the_name():
+    for spelling in ("Stuart", "stiuart", "Estuarte", "stewart", "stuard", "istuart"):
+        assert phonetic_key(spelling) == "stuart", spelling
+
+
+def test_matcher_rejects_sound_alike_words_at_default_confidence():
+    matcher = WakeWordMatcher(["stuart"], 85)
+
+    match = matcher.match("Estuarte, abre o navegador")
+    assert (match.word, match.keyword, match.score) == ("estuarte", "stuart", 100)
+    assert matcher.match("stu art que horas são").word == "stu art"
+
+    assert matcher.match("vamos estar lá amanhã") is None
+    assert matcher.match("preciso estudar hoje") is None
+
+
+def test_matcher_ignores_one_sound_off_words_and_pairs():
+    matcher = WakeWordMatcher(["stuart"], 85)
+
+    # Each of these is one dropped or extra sound away from "stuart" (score 91-92)
+    for text in ("sua arte é linda", "tu art", "start o carro", "os stuarts"):
+        assert matcher.match(text) is None, text
+
+    # Same-length keys still score fuzzily below the default confidence
+    assert WakeWordMatcher(["stuart"], 75).match("stuert abre").word == "stuert"
+
+
+def test_default_confidence_only_accepts_exact_phonetic_keys():
+    matcher = WakeWordMatcher(["stuart"], settings.wake_word_confidence)
+
+    assert matcher.match("stewart ligar a luz").score == 100
+    # One changed sound scores 83: too close to ordinary words ("estudar", "start o") to accept by default
+    for text in ("stuert abre", "preciso estudar hoje", "start o carro"):
+        assert matcher.match(text) is None, text
+
+
+def test_matcher_supports_several_keywords():
+    matcher = WakeWordMatcher(["stuart", "jarvis"], 85)
+
+    assert matcher.match("Jarvis, que horas são?").keyword == "jarvis"
+    assert matcher.match("jarviz ligar a luz").keyword == "jarvis"
+    assert matcher.match("stewart ligar a luz").keyword == "stuart"
+
+
+def test_gate_windows_cover_search_span():
+    gate = WakeWordGate(MagicMock(), "stuart", window_seconds=1.5, search_seconds=3.0, min_score=60)
+
+    # 5 s utterance: windows at 0, 0.75 and 1.5 s, each 1.5 s long
+    windows = list(gate.windows(np.zeros(5 * 16000, dtype=np.float32)))
+    assert [w.size for w in windows] == [24000, 24000, 24000]
+
+    # Shorter than one window: the whole utterance is decoded once
+    windows = list(gate.windows(np.zeros(8000, dtype=np.float32)))
+    assert [w.size for w in windows] == [8000]
+
+
+def test_gate_stops_at_first_hit_with_greedy_decoding():
+    model = MagicMock()
+    model.transcribe.side_effect = [_segments(" Bom dia a todos"), _segments(" Stuart, abra")]
+    gate = WakeWordGate(model, "stuart", window_seconds=1.5, search_seconds=3.0, min_score=60)
+
+    assert gate.detect(np.zeros(5 * 16000, dtype=np.float32)) is True
+    assert model.transcribe.call_count == 2
+
+    _, kwargs = model.transcribe.call_args
+    assert kwargs["beam_size"] == 1
+    assert kwargs["without_timestamps"] is True
+    assert kwargs["condition_on_previous_text"] is False
+
+
+def test_gate_rejects_conversation_without_keyword():
+    model = MagicMock()
+    model.transcribe.return_value = _segments(" a reunião foi adiada")
+    gate = WakeWordGate(model, "stuart", window_seconds=1.5, search_seconds=3.0, min_score=60)
+
+    assert gate.detect(np.zeros(4 * 16000, dtype=np.float32)) is False
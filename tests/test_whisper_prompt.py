@@ -1,4 +1,5 @@
 import pytest
+import numpy as np
 from unittest.mock import MagicMock, AsyncMock
 import asyncio
 import speech_recognition as sr
@@ -16,9 +17,8 @@ def mock_components():
     
     # Mock recognizer methods
     recognizer.adjust_for_ambient_noise = MagicMock()
-    # Simulate valid audio data
-    audio_data = MagicMock(spec=sr.AudioData)
-    audio_data.get_wav_data.return_value = b"fake_wav_data"
+    # Simulate valid audio data: 0.1 s of 16-bit silence at 16 kHz
+    audio_data = sr.AudioData(b"\x00\x00" * 1600, 16000, 2)
     recognizer.listen.return_value = audio_data
     
     # Mock whisper transcribe return for faster-whisper
@@ -50,17 +50,48 @@ async def test_transcribe_uses_initial_prompt(mock_components, mocker):
     # Mock speak to avoid actual TTS
     assistant.speak = AsyncMock()
     
-    # Mock sr.Microphone (including constructor) to avoid PyAudio dependency
-    mocker.patch("speech_recognition.Microphone")
-
-    # Mock ignore_stderr where it's used in assistant.py
-    mocker.patch("stuart_ai.core.assistant.ignore_stderr")
+    # Mock the persistent capture stream to avoid PyAudio dependency
+    assistant.capture = MagicMock()
+    assistant.capture.listen.return_value = recognizer.listen.return_value
 
     # Call confirmation logic
     await assistant.listen_for_confirmation("Teste?")
     
-    # Check if transcribe was called with initial_prompt
+    # Confirmations use a short greedy decode biased towards the yes/no vocabulary
     args, kwargs = whisper.transcribe.call_args
-    assert "initial_prompt" in kwargs
-    assert kwargs["initial_prompt"] == "Confirmação. Responda apenas Sim ou Não."
+    assert kwargs["initial_prompt"] == "Sim. Não. Confirmo. Cancela."
+    assert kwargs["hotwords"] == "sim não confirmo cancela"
+    assert kwargs["beam_size"] == 1
     assert kwargs["condition_on_previous_text"] is False
+    # The running stream keeps its calibration
+    assistant.capture.calibrate.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_transcribe_receives_in_memory_buffer(mock_components, mocker):
+    llm, web, rag, router, memory, whisper, recognizer = mock_components
+
+    assistant = Assistant(llm, web, rag, router, memory, whisper, recognizer)
+    assistant.speak = AsyncMock()
+    assistant.capture = MagicMock()
+    assistant.capture.listen.return_value = recognizer.listen.return_value
+
+    assert await assistant.listen_for_confirmation("Teste?") is True
+
+    # Whisper gets a float32 NumPy buffer, never a path to a temp WAV file
+    args, _ = whisper.transcribe.call_args
+    assert isinstance(args[0], np.ndarray)
+    assert args[0].dtype == np.float32
+    assert args[0].shape == (1600,)
+
+
+def test_wake_gate_uses_dedicated_wake_model(mock_components):
+    llm, web, rag, router, memory, whisper, recognizer = mock_components
+    wake_model = MagicMock()
+
+    assistant = Assistant(llm, web, rag, router, memory, whisper, recognizer, wake_model=wake_model)
+    assert assistant.wake_gate.model is wake_model
+    assert assistant.model is whisper
+
+    single_tier = Assistant(llm, web, rag, router, memory, whisper, recognizer)
+    assert single_tier.wake_gate.model is whisper